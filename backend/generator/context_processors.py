@@ -2,8 +2,7 @@ from generator.utils.report import SubsectionsBySections
 
 
 def sections(request):
-    # TODO: Use django.core.cache.
-    
+    # The navigation tree is built once per process.
     SubsectionsBySections.get_subsections_by_sections()
     SubsectionsBySections.get_sections_by_chapters()
 
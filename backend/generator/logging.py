@@ -1,16 +1,122 @@
 import logging
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+import weakref
+
+_FLUSH = object()
+_STOP = object()
 
 
 class TaskLogHandler(logging.Handler):
-    def __init__(self):
+    """
+    Stores log records of report generation tasks as "TaskLogEntry" objects.
+
+    Records are queued and written by a background thread with "bulk_create" in batches, so logging does not block
+    the rendering threads.
+    """
+
+    instances = weakref.WeakSet()
+
+    def __init__(self, batch_size: int = 100, interval: float = 1.0):
+        """
+        :param batch_size: Maximum number of log entries inserted by one query.
+        :param interval: Maximum time in seconds a record waits in the queue before it is written.
+        """
         logging.Handler.__init__(self)
 
+        self.batch_size = batch_size
+        self.interval = interval
+        self.queue = None
+        self.thread = None
+        self.pid = None
+        self.thread_lock = threading.Lock()
+
+        TaskLogHandler.instances.add(self)
+
     def emit(self, record):
         if record.name == "generator.tasks":
-            from generator.models import TaskLogEntry
+            self.__start()
+            self.queue.put((record.task_id, record.getMessage(), record.levelno))
+
+    def flush(self):
+        """
+        Blocks until all queued records are written.
+        """
+        if self.__is_running():
+            self.queue.put(_FLUSH)
+            self.queue.join()
+
+    def close(self):
+        with self.thread_lock:
+            if self.__is_running():
+                self.queue.put(_STOP)
+                self.thread.join()
+            self.thread = None
+        logging.Handler.close(self)
+
+    def __is_running(self):
+        return self.thread is not None and self.pid == os.getpid() and self.thread.is_alive()
+
+    def __start(self):
+        # The handler may be inherited by a forked Celery worker process, where the thread of the parent does not exist.
+        if self.__is_running():
+            return
+        with self.thread_lock:
+            if not self.__is_running():
+                self.queue = queue.Queue()
+                self.pid = os.getpid()
+                self.thread = threading.Thread(target=self.__run, name="task_log_handler", daemon=True)
+                self.thread.start()
+
+    def __run(self):
+        from django.db import close_old_connections, connection, DatabaseError
+
+        from generator.models import TaskLogEntry
+
+        stop = False
+        while not stop:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.interval
+            while batch[-1] not in (_FLUSH, _STOP) and len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            stop = batch[-1] is _STOP
+            try:
+                log_entries = [
+                    TaskLogEntry(task_id=task_id, message=message, level=level)
+                    for task_id, message, level in (item for item in batch if item not in (_FLUSH, _STOP))
+                ]
+                if log_entries:
+                    # The thread lives as long as the process, so its connection may have been closed by the server.
+                    close_old_connections()
+                    try:
+                        TaskLogEntry.objects.bulk_create(log_entries)
+                    except DatabaseError:
+                        connection.close()
+                        TaskLogEntry.objects.bulk_create(log_entries)
+            except Exception:
+                if logging.raiseExceptions:
+                    traceback.print_exc(file=sys.stderr)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+        connection.close()
+
 
-            log_entry = TaskLogEntry()
-            log_entry.task_id = record.task_id
-            log_entry.message = record.message
-            log_entry.level = record.levelno
-            log_entry.save()
+def flush_task_log_handlers():
+    """
+    Writes log records queued by all task log handlers of the process.
+    """
+    for handler in list(TaskLogHandler.instances):
+        handler.flush()
@@ -0,0 +1,133 @@
+import statistics
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+from sqlalchemy import event
+
+from generator.exceptions import DataNotFoundException
+from generator.utils.award_facts import AwardFacts
+from generator.utils.batch import build_report_request
+from generator.utils.database import Database, PoolMetrics
+from generator.utils.report import get_report, ReportRegistry, SubsectionsBySections
+
+
+class QueryRecorder:
+    """
+    Records latency and compiled cache usage of statements executed by the engine of Gustos database.
+    """
+
+    def __init__(self):
+        self.started: Dict[int, float] = {}
+        self.latencies: List[float] = []
+        self.cache_hits = 0
+        self.statements = set()
+        self.by_report: Dict[str, List[float]] = defaultdict(list)
+        self.report = None
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.started[id(cursor)] = time.perf_counter()
+
+    def after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        latency = time.perf_counter() - self.started.pop(id(cursor))
+        self.latencies.append(latency)
+        self.by_report[self.report].append(latency)
+        self.statements.add(statement)
+        if context is not None and context.cache_hit is context.dialect.CACHE_HIT:
+            self.cache_hits += 1
+
+    def listen(self, engine):
+        event.listen(engine, "before_cursor_execute", self.before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self.after_cursor_execute)
+
+    def remove(self, engine):
+        event.remove(engine, "before_cursor_execute", self.before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", self.after_cursor_execute)
+
+
+class Command(BaseCommand):
+    help = (
+        "Renders reports of sections for several year ranges and prints the compiled cache hit rate and latency of "
+        "their queries. Statements with a stable shape hit the compiled cache for every year range except the first one."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("sections", nargs="*", help="Names of sections, all sections by default.")
+        parser.add_argument("--years", nargs="+", default=["2018-2020", "2019-2021", "2020-2022"], help="Year ranges in \"<from>-<to>\" format.")
+        parser.add_argument("--winery", type=int, help="Identifier of the winery of winery reports.")
+        parser.add_argument("--country", type=int, help="Identifier of the country of country reports.")
+        parser.add_argument("--continent", type=int, help="Identifier of the continent of continent reports.")
+        parser.add_argument("--award-facts", action="store_true", help="Compute aggregates of reports from award fact frames like report generation tasks.")
+
+    def handle(self, *args, **options):
+        try:
+            year_ranges = [tuple(int(year) for year in years.split("-")) for years in options["years"]]
+        except ValueError:
+            raise CommandError("Year ranges must be in \"<from>-<to>\" format.")
+
+        SubsectionsBySections.get_subsections_by_sections()
+        sections = options["sections"] or list(SubsectionsBySections.subsections_by_sections)
+        unknown = set(sections) - set(SubsectionsBySections.subsections_by_sections)
+        if unknown:
+            raise CommandError(f"Unknown sections: {', '.join(sorted(unknown))}.")
+
+        engine = Database()
+        recorder = QueryRecorder()
+        passes = []
+
+        recorder.listen(engine)
+        try:
+            for year_from, year_to in year_ranges:
+                count, hits = len(recorder.latencies), recorder.cache_hits
+                award_facts = AwardFacts() if options["award_facts"] else None
+                for section in sections:
+                    subsections = ReportRegistry.get_catalog(section)
+                    for subsection, _ in subsections:
+                        request = build_report_request(reverse("sections", args=(section,)), {
+                            "subsection": subsection,
+                            "year_from": year_from,
+                            "year_to": year_to,
+                            **{name: options[name] for name in ("winery", "country", "continent") if options[name] is not None},
+                        })
+                        report = get_report(request, section, subsection)
+                        if report is None or not report.get_form(request.POST, subsections=subsections).is_valid():
+                            continue
+
+                        # Results of the query cache would hide the queries.
+                        report.database = engine
+                        report.award_facts = award_facts
+                        recorder.report = f"{section}/{subsection}"
+                        try:
+                            report.render()
+                        except DataNotFoundException:
+                            pass
+                        except Exception as e:
+                            self.stderr.write(f"{recorder.report}: {e}")
+                count, hits = len(recorder.latencies) - count, recorder.cache_hits - hits
+                passes.append((year_from, year_to, count, hits))
+        finally:
+            recorder.remove(engine)
+
+        for year_from, year_to, count, hits in passes:
+            self.stdout.write(f"{year_from}-{year_to}: {count} queries, compiled cache hit rate {hits / count if count else 0:.0%}.")
+
+        latencies = recorder.latencies
+        if not latencies:
+            raise CommandError("No queries were executed.")
+
+        self.stdout.write(
+            f"{len(latencies)} queries, {len(recorder.statements)} distinct statements, "
+            f"compiled cache hit rate {recorder.cache_hits / len(latencies):.0%}."
+        )
+        self.stdout.write(
+            f"Latency: mean {statistics.mean(latencies) * 1000:.1f} ms, median {statistics.median(latencies) * 1000:.1f} ms, "
+            f"max {max(latencies) * 1000:.1f} ms."
+        )
+        self.stdout.write(
+            "Connections: {checkouts} checked out, {saturated} of them from a saturated pool, {wait_total:.2f} s waited, "
+            "{checked_out_max} of {capacity} checked out at most.".format(**PoolMetrics.get_stats())
+        )
+        for report, report_latencies in sorted(recorder.by_report.items(), key=lambda x: sum(x[1]), reverse=True):
+            self.stdout.write(f"  {report}: {len(report_latencies)} queries, mean {statistics.mean(report_latencies) * 1000:.1f} ms.")
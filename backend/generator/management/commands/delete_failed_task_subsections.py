@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+
+from generator.models import Task, TaskStatus
+from generator.tasks import delete_subsections
+from generator.utils.database import get_data_version
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes rendered subsections of failed personal report tasks which are not going to be resumed, because Gustos "
+        "data has changed or they are too old, it should run periodically."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=7, help="Age in days after which subsections of failed tasks are deleted even if Gustos data has not changed.")
+
+    def handle(self, *args, **options):
+        # Requests of reports of a newer version of Gustos data create new tasks instead of resuming these ones.
+        final = ~Q(data_version=get_data_version()) | Q(updated__lt=timezone.now() - timedelta(days=options["days"]))
+        task_ids = list(Task.objects.filter(final, status=TaskStatus.FAILED, tasksubsection__isnull=False).order_by().values_list("id", flat=True).distinct())
+
+        for task_id in task_ids:
+            delete_subsections(str(task_id))
+        self.stdout.write(self.style.SUCCESS(f"Deleted subsections of {len(task_ids)} failed tasks."))
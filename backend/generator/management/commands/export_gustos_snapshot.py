@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from generator.utils.snapshot import export_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        "Exports Gustos tables to a Parquet snapshot, which is read by report queries if GUSTOS_BACKEND setting is "
+        "\"duckdb\". It should run after Gustos data changes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--keep", type=int, default=2, help="Number of the newest snapshots which are kept.")
+
+    def handle(self, *args, **options):
+        if options["keep"] < 1:
+            raise CommandError("At least one snapshot must be kept.")
+
+        started = time.monotonic()
+        name, counts = export_snapshot(keep=options["keep"])
+        for table, count in counts.items():
+            self.stdout.write(f"{table}: {count} rows.")
+        if counts:
+            self.stdout.write(self.style.SUCCESS(f"Exported snapshot {name} in {time.monotonic() - started:.1f} s."))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Snapshot {name} is up to date."))
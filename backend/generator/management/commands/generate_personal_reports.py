@@ -0,0 +1,55 @@
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from generator.models import Task
+from generator.reports.personal_winery_report.personal_winery_report.main import PersonalWineryReport
+from generator.tasks import generate_personal_reports
+from generator.utils.batch import build_personal_report_request
+from generator.utils.database import get_data_version
+
+
+class Command(BaseCommand):
+    help = "Generates personal reports of many wineries sharing rating queries between them."
+
+    def add_arguments(self, parser):
+        parser.add_argument("wineries", nargs="+", type=int, help="Identifiers of wineries.")
+        parser.add_argument("--year-from", type=int, required=True, help="Start of the period.")
+        parser.add_argument("--year-to", type=int, required=True, help="End of the period.")
+        parser.add_argument("--sync", action="store_true", help="Generate reports in this process instead of a Celery worker.")
+
+    def handle(self, *args, **options):
+        # All wineries are validated before any task is created, so an invalid winery does not leave pending tasks
+        # which are never enqueued.
+        errors = []
+        for winery_id in options["wineries"]:
+            try:
+                Task(winery=winery_id, year_from=options["year_from"], year_to=options["year_to"]).clean()
+            except ValidationError as e:
+                errors.append(f"Winery {winery_id}: {'; '.join(e.messages)}")
+        if errors:
+            raise CommandError("\n".join(errors))
+
+        data_version = get_data_version()
+
+        task_ids = []
+        for winery_id in options["wineries"]:
+            report = PersonalWineryReport(build_personal_report_request(winery_id, options["year_from"], options["year_to"]))
+            task, started = report.get_report_generation_task(data_version)
+
+            if started:
+                task_ids.append(str(task.id))
+            else:
+                self.stdout.write(f"Winery {winery_id}: the report has already been requested by task {task.id}.")
+
+        if not task_ids:
+            return
+
+        if options["sync"]:
+            statistics = generate_personal_reports.apply(args=(task_ids,)).get()
+            self.stdout.write(self.style.SUCCESS(
+                "Generated {finished} of {wineries} reports in {duration:.1f} s ({wineries_per_minute:.2f} wineries per minute), "
+                "shared rating queries: {shared_query_misses} executed, {shared_query_hits} reused.".format(**statistics)
+            ))
+        else:
+            result = generate_personal_reports.delay(task_ids)
+            self.stdout.write(self.style.SUCCESS(f"Generation of {len(task_ids)} reports has been enqueued as Celery task {result.id}."))
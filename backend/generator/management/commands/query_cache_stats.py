@@ -0,0 +1,30 @@
+from collections import Counter, defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+from generator.utils.query_cache import QueryCache, REDIS_KEY_PREFIX
+
+
+class Command(BaseCommand):
+    help = "Shows hits and misses of the query cache of reports collected by all processes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="Reset the counters.")
+
+    def handle(self, *args, **options):
+        redis = QueryCache.get_redis()
+        if redis is None:
+            raise CommandError("QUERY_CACHE_REDIS_URL setting is empty, counters are kept by each process separately.")
+
+        stats = defaultdict(Counter)
+        for field, value in redis.hgetall(f"{REDIS_KEY_PREFIX}:stats").items():
+            name, event = field.decode().rsplit(":", 1)
+            stats[name][event] = int(value)
+
+        for name, counter in sorted(stats.items(), key=lambda item: -sum(item[1].values())):
+            total = sum(counter.values())
+            hits = counter["local_hit"] + counter["redis_hit"]
+            self.stdout.write(f"{name}: {counter['local_hit']} local hits, {counter['redis_hit']} Redis hits, {counter['miss']} misses ({hits * 100 / total:.0f}% hit rate)")
+
+        if options["reset"]:
+            redis.delete(f"{REDIS_KEY_PREFIX}:stats")
@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from generator.models import RankingSnapshotStatus
+from generator.reports.table_winery_report import TableWineryReport
+from generator.tasks import refresh_ranking_snapshot
+from generator.utils.batch import build_personal_report_request
+from generator.utils.rankings import get_ranking_snapshot
+from generator.utils.report import ReportRegistry
+
+
+class Command(BaseCommand):
+    help = "Refreshes ranking snapshots of all table winery reports for the current version of Gustos data, it should run after Gustos data changes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--year-from", type=int, required=True, help="Start of the period.")
+        parser.add_argument("--year-to", type=int, required=True, help="End of the period.")
+        parser.add_argument("--sync", action="store_true", help="Refresh snapshots in this process instead of Celery workers.")
+
+    def handle(self, *args, **options):
+        ReportRegistry.load()
+
+        # Rating queries do not depend on the winery.
+        request = build_personal_report_request(0, options["year_from"], options["year_to"])
+        for (section, subsection), report_class in sorted(ReportRegistry.reports.items()):
+            if not issubclass(report_class, TableWineryReport):
+                continue
+
+            snapshot = get_ranking_snapshot(report_class(request), enqueue=not options["sync"])
+            if snapshot.status == RankingSnapshotStatus.FINISHED:
+                self.stdout.write(f"{section}/{subsection}: the snapshot is up to date.")
+            elif snapshot.status == RankingSnapshotStatus.FAILED:
+                self.stderr.write(f"{section}/{subsection}: the refresh has failed, it is retried after {snapshot.retry_after}.")
+            elif options["sync"]:
+                started = time.monotonic()
+                count = refresh_ranking_snapshot.apply(args=(snapshot.id, f"{report_class.__module__}.{report_class.__qualname__}")).get()
+                self.stdout.write(f"{section}/{subsection}: stored {count} rows in {time.monotonic() - started:.1f} s.")
+            else:
+                self.stdout.write(f"{section}/{subsection}: the refresh has been enqueued.")
@@ -0,0 +1,17 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from generator.utils.facts import facts_configured, refresh_wine_entity_facts
+
+
+class Command(BaseCommand):
+    help = "Refreshes the denormalized facts about wine entities and continents of countries used by report queries."
+
+    def handle(self, *args, **options):
+        if not facts_configured():
+            raise CommandError("WINE_ENTITY_FACTS_SCHEMA setting is empty.")
+
+        started = time.monotonic()
+        count = refresh_wine_entity_facts()
+        self.stdout.write(self.style.SUCCESS(f"Stored {count} wine entity facts in {time.monotonic() - started:.1f} s."))
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-18 07:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('generator', '0003_remove_task_generator_t_updated_d63c8f_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='data_version',
+            field=models.CharField(blank=True, editable=False, max_length=40, null=True),
+        ),
+        migrations.AlterUniqueTogether(
+            name='task',
+            unique_together={('winery', 'year_from', 'year_to', 'data_version')},
+        ),
+    ]
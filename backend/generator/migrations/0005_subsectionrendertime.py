@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-18 07:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('generator', '0004_task_data_version_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubsectionRenderTime',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('section', models.CharField(editable=False, max_length=255)),
+                ('subsection', models.CharField(editable=False, max_length=255)),
+                ('duration', models.FloatField(editable=False)),
+            ],
+            options={
+                'unique_together': {('section', 'subsection')},
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-18 07:19
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django_mysql.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('generator', '0005_subsectionrendertime'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskSubsection',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('section', models.CharField(editable=False, max_length=255)),
+                ('subsection', models.CharField(editable=False, max_length=255)),
+                ('weight', models.IntegerField(editable=False)),
+                ('status', django_mysql.models.EnumField(choices=[('FINISHED', 'Finished'), ('NO_DATA', 'No data'), ('FAILED', 'Failed')])),
+                ('file', models.FileField(blank=True, null=True, upload_to='fragments/%Y/%m/%d/')),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('task', models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, to='generator.task')),
+            ],
+            options={
+                'unique_together': {('task', 'section', 'subsection')},
+            },
+        ),
+    ]
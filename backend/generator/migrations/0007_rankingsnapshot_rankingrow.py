@@ -0,0 +1,51 @@
+# Generated by Django 4.2.30 on 2026-10-18 07:35
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django_mysql.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('generator', '0006_tasksubsection'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RankingSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(editable=False, max_length=40)),
+                ('data_version', models.CharField(editable=False, max_length=40)),
+                ('report', models.CharField(editable=False, max_length=255)),
+                ('year_from', models.PositiveSmallIntegerField(editable=False)),
+                ('year_to', models.PositiveSmallIntegerField(editable=False)),
+                ('status', django_mysql.models.EnumField(choices=[('IN_PROGRESS', 'In progress'), ('FINISHED', 'Finished')], default='IN_PROGRESS')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'unique_together': {('key', 'data_version')},
+            },
+        ),
+        migrations.CreateModel(
+            name='RankingRow',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField(editable=False)),
+                ('entity_id', models.PositiveIntegerField(editable=False)),
+                ('continent_id', models.PositiveSmallIntegerField(blank=True, editable=False, null=True)),
+                ('country_id', models.PositiveIntegerField(blank=True, editable=False, null=True)),
+                ('world_rank', models.PositiveIntegerField(editable=False)),
+                ('continent_rank', models.PositiveIntegerField(editable=False)),
+                ('country_rank', models.PositiveIntegerField(editable=False)),
+                ('row', models.BinaryField()),
+                ('snapshot', models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='rows', to='generator.rankingsnapshot')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['snapshot', 'entity_id', 'position'], name='generator_r_snapsho_249e37_idx'), models.Index(fields=['snapshot', 'world_rank', 'position'], name='generator_r_snapsho_b20e7d_idx'), models.Index(fields=['snapshot', 'continent_id', 'continent_rank', 'position'], name='generator_r_snapsho_85b32b_idx'), models.Index(fields=['snapshot', 'country_id', 'country_rank', 'position'], name='generator_r_snapsho_4caa87_idx')],
+                'unique_together': {('snapshot', 'position')},
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-18 08:25
+
+from django.db import migrations, models
+import django_mysql.models
+
+
+def delete_ranking_snapshots(apps, schema_editor):
+    # Pickled rows cannot be converted, snapshots are refreshed again by the next report generation tasks.
+    apps.get_model("generator", "RankingSnapshot").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('generator', '0007_rankingsnapshot_rankingrow'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_ranking_snapshots, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='rankingsnapshot',
+            name='retry_after',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='rankingrow',
+            name='row',
+            field=models.TextField(editable=False),
+        ),
+        migrations.AlterField(
+            model_name='rankingsnapshot',
+            name='status',
+            field=django_mysql.models.EnumField(choices=[('IN_PROGRESS', 'In progress'), ('FINISHED', 'Finished'), ('FAILED', 'Failed')], default='IN_PROGRESS'),
+        ),
+    ]
@@ -32,11 +32,23 @@ class Task(models.Model):
     current = models.PositiveIntegerField(null=False, blank=False, default=0, editable=False)
     total = models.PositiveIntegerField(null=False, blank=False, default=0, editable=False)
     file = models.FileField(upload_to="pdf/%Y/%m/%d/", null=True, blank=True)
+    data_version = models.CharField(null=True, blank=True, max_length=40, editable=False)
     created = models.DateTimeField(null=False, blank=False, auto_now_add=True)
     updated = models.DateTimeField(null=False, blank=False, auto_now=True)
 
     class Meta:
         ordering = ("-updated", )
+        # A single task generates the report of the same parameters and Gustos data for all requests.
+        unique_together = ("winery", "year_from", "year_to", "data_version")
+
+    @property
+    def progress(self) -> int:
+        """
+        :return: Percentage of rendered subsections.
+        """
+        if not self.total:
+            return 0
+        return round(self.current / self.total * 100)
 
     def clean(self):
         errors = defaultdict(list)
@@ -71,4 +83,92 @@ class TaskLogEntry(models.Model):
     created = models.DateTimeField(null=False, blank=False, auto_now_add=True, editable=False)
 
     class Meta:
-        ordering = ("created", )
\ No newline at end of file
+        ordering = ("created", )
+
+
+class TaskSubsectionStatus(models.TextChoices):
+    FINISHED = "FINISHED", _("Finished")
+    NO_DATA = "NO_DATA", _("No data")
+    FAILED = "FAILED", _("Failed")
+
+
+class TaskSubsection(models.Model):
+    """
+    Outcome of rendering of a subsection of the task, so a resumed task renders only missing and failed subsections.
+    """
+    task = models.ForeignKey(Task, null=False, blank=False, on_delete=models.CASCADE, editable=False)
+    section = models.CharField(null=False, blank=False, max_length=255, editable=False)
+    subsection = models.CharField(null=False, blank=False, max_length=255, editable=False)
+    weight = models.IntegerField(null=False, blank=False, editable=False)
+    status = EnumField(choices=TaskSubsectionStatus.choices, null=False, blank=False)
+    file = models.FileField(upload_to="fragments/%Y/%m/%d/", null=True, blank=True)
+    """HTML code of the rendered subsection."""
+    updated = models.DateTimeField(null=False, blank=False, auto_now=True)
+
+    class Meta:
+        unique_together = ("task", "section", "subsection")
+
+
+class SubsectionRenderTime(models.Model):
+    section = models.CharField(null=False, blank=False, max_length=255, editable=False)
+    subsection = models.CharField(null=False, blank=False, max_length=255, editable=False)
+    duration = models.FloatField(null=False, blank=False, editable=False)
+    """Moving average of render durations of the subsection in seconds."""
+
+    class Meta:
+        unique_together = ("section", "subsection")
+
+
+class RankingSnapshotStatus(models.TextChoices):
+    IN_PROGRESS = "IN_PROGRESS", _("In progress")
+    FINISHED = "FINISHED", _("Finished")
+    FAILED = "FAILED", _("Failed")
+
+
+class RankingSnapshot(models.Model):
+    """
+    Materialized rows of a rating query of table winery reports for a version of Gustos data.
+
+    The key identifies the criterion, filters and year range of the query, so a snapshot is shared by reports of all
+    wineries.
+    """
+    key = models.CharField(null=False, blank=False, max_length=40, editable=False)
+    """SHA1 hash of the compiled rating query and its parameters."""
+    data_version = models.CharField(null=False, blank=False, max_length=40, editable=False)
+    report = models.CharField(null=False, blank=False, max_length=255, editable=False)
+    year_from = models.PositiveSmallIntegerField(null=False, blank=False, editable=False)
+    year_to = models.PositiveSmallIntegerField(null=False, blank=False, editable=False)
+    status = EnumField(choices=RankingSnapshotStatus.choices, null=False, blank=False, default=RankingSnapshotStatus.IN_PROGRESS)
+    retry_after = models.DateTimeField(null=True, blank=True)
+    """Time after which the refresh of a failed snapshot is enqueued again."""
+    created = models.DateTimeField(null=False, blank=False, auto_now_add=True)
+    updated = models.DateTimeField(null=False, blank=False, auto_now=True)
+
+    class Meta:
+        unique_together = ("key", "data_version")
+
+
+class RankingRow(models.Model):
+    """
+    Row of a rating query in a ranking snapshot, ranks are copied to indexed columns for lookups of neighbours.
+    """
+    snapshot = models.ForeignKey(RankingSnapshot, null=False, blank=False, on_delete=models.CASCADE, related_name="rows", editable=False)
+    position = models.PositiveIntegerField(null=False, blank=False, editable=False)
+    """Index of the row in the query result."""
+    entity_id = models.PositiveIntegerField(null=False, blank=False, editable=False)
+    continent_id = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
+    country_id = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    world_rank = models.PositiveIntegerField(null=False, blank=False, editable=False)
+    continent_rank = models.PositiveIntegerField(null=False, blank=False, editable=False)
+    country_rank = models.PositiveIntegerField(null=False, blank=False, editable=False)
+    row = models.TextField(null=False, blank=False, editable=False)
+    """Values of the row encoded as a JSON array."""
+
+    class Meta:
+        unique_together = ("snapshot", "position")
+        indexes = (
+            models.Index(fields=("snapshot", "entity_id", "position")),
+            models.Index(fields=("snapshot", "world_rank", "position")),
+            models.Index(fields=("snapshot", "continent_id", "continent_rank", "position")),
+            models.Index(fields=("snapshot", "country_id", "country_rank", "position")),
+        )
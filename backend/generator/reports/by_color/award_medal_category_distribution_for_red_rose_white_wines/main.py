@@ -8,13 +8,8 @@ from generator.reports.report import Report
 
 
 class AwardCategoryDistributionForRedRoseWhiteWines(Report):
-    @property
-    def title(self):
-        return "4.2 Award category distribution for Red / Rose / White wine"
-
-    @property
-    def weight(self):
-        return 20
+    title = "4.2 Award category distribution for Red / Rose / White wine"
+    weight = 20
 
     def render(self):
         colors = {
@@ -36,8 +31,8 @@ class AwardCategoryDistributionForRedRoseWhiteWines(Report):
                     "INNER JOIN wine ON wine.id = wine_entity.wine "
                     "INNER JOIN award ON award.id = award_wine_entity.award_id "
                     "INNER JOIN event ON event.id = award.event_id "
-                    f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color]} "
-                    "GROUP BY award.value")
+                    f"WHERE (event.year BETWEEN :year_from AND :year_to) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color]} "
+                    "GROUP BY award.value").bindparams(year_from=self.year_from, year_to=self.year_to)
                 )
 
             df = pd.DataFrame(res.fetchall(), columns=["MEDAL", "WINE_COUNT"], dtype=int).set_index("MEDAL")
@@ -50,4 +45,3 @@ class AwardCategoryDistributionForRedRoseWhiteWines(Report):
             page_info.append(result)
 
         return self.render_template("bar_diagrams/simple.html", page_info=page_info)
-
@@ -5,13 +5,8 @@ from generator.reports.report import Report
 
 
 class RedRoseWhiteWinesTopWineriesInTheWorldByAwardedWines(Report):
-    @property
-    def title(self):
-        return "4.2 Red / Rose / White Wines: Top Wineries in the World by Awarded wines"
-
-    @property
-    def weight(self):
-        return 70
+    title = "4.2 Red / Rose / White Wines: Top Wineries in the World by Awarded wines"
+    weight = 70
 
     def render(self):
         colors_ids = {
@@ -31,11 +26,11 @@ class RedRoseWhiteWinesTopWineriesInTheWorldByAwardedWines(Report):
                     "INNER JOIN wine ON wine.winery = winery.id "
                     "INNER JOIN wine_entity ON wine_entity.wine = wine.id "
                     "INNER JOIN wine_gwmr ON wine_gwmr.wine_entity_id = wine_entity.id "
-                    f"WHERE wine_gwmr.year_from = {self.year_from} AND wine_gwmr.year_to = {self.year_to} AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors_ids[color]} "
+                    f"WHERE wine_gwmr.year_from = :year_from AND wine_gwmr.year_to = :year_to AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors_ids[color]} "
                     "GROUP BY winery.id "
                     "ORDER BY AWARDED_WINES DESC "
                     "LIMIT 5",
-                )
+                ).bindparams(year_from=self.year_from, year_to=self.year_to)
             )
             df = pd.DataFrame(res.fetchall(), columns=["WINERY_NAME", "COUNTRY", "AWARDED_WINES"])
             result = f"{result}<b>{color} Wines</b>{df.to_html()}<br>"
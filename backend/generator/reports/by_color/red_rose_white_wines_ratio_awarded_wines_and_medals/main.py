@@ -8,13 +8,8 @@ from generator.reports.report import Report
 
 
 class RedRoseWhiteWinesRatioAwardedWinesAndMedals(Report):
-    @property
-    def title(self):
-        return "4.2 Red / Rose / White wines ratio: Awarded wines and Medal"
-
-    @property
-    def weight(self):
-        return 10
+    title = "4.2 Red / Rose / White wines ratio: Awarded wines and Medal"
+    weight = 10
 
     def render(self):
         wine_ratio_category = {
@@ -33,8 +28,8 @@ class RedRoseWhiteWinesRatioAwardedWinesAndMedals(Report):
                 "INNER JOIN event ON event.id = award.event_id "
                 "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
                 "INNER JOIN wine ON wine.id = wine_entity.wine "
-                f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"color\"')) IN ({self.RED_WINE_ID}, {self.WHITE_WINE_ID}, {self.ROSE_WINE_ID}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) "
-                "GROUP BY WINE_COLOR")
+                f"WHERE (event.year BETWEEN :year_from AND :year_to) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"color\"')) IN ({self.RED_WINE_ID}, {self.WHITE_WINE_ID}, {self.ROSE_WINE_ID}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) "
+                "GROUP BY WINE_COLOR").bindparams(year_from=self.year_from, year_to=self.year_to)
             )
 
             df = pd.DataFrame(res.fetchall(), columns=["", "WINE_COLOR"])
@@ -47,4 +42,3 @@ class RedRoseWhiteWinesRatioAwardedWinesAndMedals(Report):
             page_info.append(result)
 
         return self.render_template("wines_pie_ratio.html", page_info=page_info)
-
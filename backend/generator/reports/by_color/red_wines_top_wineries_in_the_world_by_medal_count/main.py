@@ -5,6 +5,9 @@ from generator.reports.top_wineries_report import TopWineriesReport
 
 
 class RedWinesTopWineriesInTheWorldByMedalCount(TopWineriesReport):
+    title = "4.2.1 Red Wines: Top Wineries in the World by Medal Count"
+    weight = 60
+
     @property
     def value_name(self) -> str:
         return "Medals"
@@ -14,12 +17,3 @@ class RedWinesTopWineriesInTheWorldByMedalCount(TopWineriesReport):
             event_year=(self.year_from, self.year_to),
             wine_color=WineColor.RED,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.2.1 Red Wines: Top Wineries in the World by Medal Count"
-
-
-    @property
-    def weight(self) -> int:
-        return 60
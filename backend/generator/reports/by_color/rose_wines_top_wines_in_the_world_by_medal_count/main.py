@@ -3,17 +3,12 @@ from generator.reports.top_wines_report import TopWinesReport
 
 
 class RoseWinesTopWinesInTheWorldByMedalCount(TopWinesReport):
+    title = "4.2.3 Rose Wines: Top wines in the world by Medal Count"
+    weight = 56
+
     def get_url(self) -> str:
         return self.build_top_wines_url(
             event_year=(self.year_from, self.year_to),
             rating_type=GWMRUrlRatingType.BY_MEDALS,
             wine_color=WineColor.ROSE,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.2.3 Rose Wines: Top wines in the world by Medal Count"
-
-    @property
-    def weight(self) -> int:
-        return 56
@@ -3,13 +3,8 @@ from generator.enum import WineColor
 
 
 class WhiteWinesGlobalParticipantsMedalsAndAwardedWines(ContinentsTabReport):
-    @property
-    def title(self):
-        return "4.2.2 White Wines: Global participants, Medals and Awarded wines"
-
-    @property
-    def weight(self):
-        return 55
+    title = "4.2.2 White Wines: Global participants, Medals and Awarded wines"
+    weight = 55
 
     def get_query(self):
         return self.build_query_for_count_wineries_medals_wines_by_continent(
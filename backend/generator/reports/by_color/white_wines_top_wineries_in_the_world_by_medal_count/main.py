@@ -5,6 +5,9 @@ from generator.reports.top_wineries_report import TopWineriesReport
 
 
 class WhiteWinesTopWineriesInTheWorldByMedalCount(TopWineriesReport):
+    title = "4.2.1 White Wines: Top Wineries in the World by Medal Count"
+    weight = 63
+
     @property
     def value_name(self) -> str:
         return "Medals"
@@ -14,12 +17,3 @@ class WhiteWinesTopWineriesInTheWorldByMedalCount(TopWineriesReport):
             event_year=(self.year_from, self.year_to),
             wine_color=WineColor.WHITE,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.2.1 White Wines: Top Wineries in the World by Medal Count"
-
-
-    @property
-    def weight(self) -> int:
-        return 63
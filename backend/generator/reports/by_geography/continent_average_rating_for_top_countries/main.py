@@ -8,13 +8,8 @@ from gustos.models import wine, taxonomy_term, award_wine_entity
 
 
 class ContinentAverageRatingForTopCountriesReport(HistogramReport, ContinentReport):
-    @property
-    def title(self) -> str:
-        return "4.5 <Continent>: Average rating for Top 6 Countries"
-
-    @property
-    def weight(self) -> int:
-        return 40
+    title = "4.5 <Continent>: Average rating for Top 6 Countries"
+    weight = 40
 
     @property
     def get_query_args(self) -> dict[Any, str]:
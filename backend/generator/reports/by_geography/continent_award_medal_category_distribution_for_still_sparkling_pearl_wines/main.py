@@ -2,19 +2,14 @@ import base64
 from io import BytesIO
 
 import pandas as pd
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from generator.reports.continent_report import ContinentReport
 
 
 class ContinentAwardMedalCategoryDistributionForStillSparklingPearlWinesReport(ContinentReport):
-    @property
-    def title(self):
-        return "4.5 <Continent>: Award medal category distribution for Still / Sparkling & Pearl wine"
-
-    @property
-    def weight(self):
-        return 80
+    title = "4.5 <Continent>: Award medal category distribution for Still / Sparkling & Pearl wine"
+    weight = 80
 
     def render(self):
         product_types = {
@@ -35,8 +30,8 @@ class ContinentAwardMedalCategoryDistributionForStillSparklingPearlWinesReport(C
                     "INNER JOIN wine ON wine.id = wine_entity.wine "
                     "INNER JOIN award ON award.id = award_wine_entity.award_id "
                     "INNER JOIN event ON event.id = award.event_id "
-                    f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {product_types[product_type]} AND wine.country IN ({', '.join([str(continent) for continent in self.CONTINENTS[self.continent]])}) "
-                    "GROUP BY award.value"),
+                    f"WHERE (event.year BETWEEN :year_from AND :year_to) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {product_types[product_type]} AND wine.country IN :continent_countries "
+                    "GROUP BY award.value").bindparams(bindparam("continent_countries", self.CONTINENTS[self.continent], expanding=True), year_from=self.year_from, year_to=self.year_to),
                 )
 
             df = pd.DataFrame(res.fetchall(), columns=["MEDAL", "WINE_COUNT"]).set_index("MEDAL")
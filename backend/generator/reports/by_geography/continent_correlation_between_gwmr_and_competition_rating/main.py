@@ -5,13 +5,8 @@ from generator.reports.correlation_report import CorrelationReport
 
 
 class ContinentCorrelationBetweenGwmrAndCompetitionRatingReport(ContinentReport, CorrelationReport):
-    @property
-    def title(self) -> str:
-        return "4.5 <Continent>: Correlation between GWMR and Competition rating"
-
-    @property
-    def weight(self) -> int:
-        return 50
+    title = "4.5 <Continent>: Correlation between GWMR and Competition rating"
+    weight = 50
 
     @property
     def x_column_name(self) -> str:
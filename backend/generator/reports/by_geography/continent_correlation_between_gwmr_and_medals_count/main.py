@@ -5,6 +5,9 @@ from generator.reports.continent_report import ContinentReport
 
 
 class ContinentCorrelationBetweenGwmrAndMedalsCountReport(ContinentReport, CorrelationReport):
+    title = "4.5 <Continent>: Correlation between GWMR and Medals Count"
+    weight = 60
+
     @property
     def x_column_name(self) -> str:
         return "MEDALS COUNT"
@@ -18,11 +21,3 @@ class ContinentCorrelationBetweenGwmrAndMedalsCountReport(ContinentReport, Corre
             event_year=(self.year_from, self.year_to),
             countries_ids=self.CONTINENTS[self.continent],
         )
-
-    @property
-    def title(self) -> str:
-        return "4.5 <Continent>: Correlation between GWMR and Medals Count"
-
-    @property
-    def weight(self) -> int:
-        return 60
@@ -1,17 +1,12 @@
 import pandas as pd
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from generator.reports.continent_report import ContinentReport
 
 
 class ContinentIconicWinesWinesDistributionReport(ContinentReport):
-    @property
-    def title(self):
-        return "4.5 <Continent>: “Iconic wines” wines distribution"
-
-    @property
-    def weight(self):
-        return 30
+    title = "4.5 <Continent>: “Iconic wines” wines distribution"
+    weight = 30
 
     def render(self):
         with self.database.connect() as connection:
@@ -22,10 +17,10 @@ class ContinentIconicWinesWinesDistributionReport(ContinentReport):
                     "INNER JOIN wine ON wine.id = wine_entity.wine "
                     "INNER JOIN wine_gwmr ON wine_gwmr.wine_entity_id = wine_entity.id "
                     "INNER JOIN taxonomy_term ON taxonomy_term.tid = wine.country "
-                    f"WHERE wine_gwmr.year_from = {self.year_from} AND wine_gwmr.year_to = {self.year_to} AND wine.country IN ({', '.join([str(continent) for continent in self.CONTINENTS[self.continent]])}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) "
+                    "WHERE wine_gwmr.year_from = :year_from AND wine_gwmr.year_to = :year_to AND wine.country IN :continent_countries AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) "
                     "GROUP BY wine.country "
                     "ORDER BY WITH_HIGH_GWMR_SCORE DESC",
-                    ))
+                    ).bindparams(bindparam("continent_countries", self.CONTINENTS[self.continent], expanding=True), year_from=self.year_from, year_to=self.year_to))
 
         df = pd.DataFrame(res.fetchall(), columns=["WITH_HIGH_GWMR_SCORE", "WITH_ALL_GWMR_SCORE", "COUNTRY"])
 
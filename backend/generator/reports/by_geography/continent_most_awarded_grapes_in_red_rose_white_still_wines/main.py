@@ -1,17 +1,12 @@
 import pandas as pd
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from generator.reports.continent_report import ContinentReport
 
 
 class ContinentMostAwardedGrapesInRedRoseWhiteStillWinesReport(ContinentReport):
-    @property
-    def title(self):
-        return "4.5 <Continent>: Most awarded grapes in Red / Rose / White Still Wines"
-
-    @property
-    def weight(self):
-        return 280
+    title = "4.5 <Continent>: Most awarded grapes in Red / Rose / White Still Wines"
+    weight = 280
 
     def render(self):
         colors = {
@@ -37,16 +32,16 @@ class ContinentMostAwardedGrapesInRedRoseWhiteStillWinesReport(ContinentReport):
                             "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
                             "LEFT JOIN wine_grapes ON wine_grapes.wine_entity = wine_entity.id "
                             "INNER JOIN taxonomy_term ON taxonomy_term.tid = wine_grapes.grape "
-                            f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND EXISTS( "
+                            "WHERE (event.year BETWEEN :year_from AND :year_to) AND EXISTS( "
                             "SELECT * FROM wine "
-                            f"WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {self.STILL_WINE_WHERE_CLAUSE} AND {colors[color]} AND wine.country IN ({', '.join([str(continent) for continent in self.CONTINENTS[self.continent]])})) AND EXISTS( "
+                            f"WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {self.STILL_WINE_WHERE_CLAUSE} AND {colors[color]} AND wine.country IN :continent_countries) AND EXISTS( "
                             "SELECT * FROM wine_grapes "
                             "WHERE wine_grapes.wine_entity = wine_entity.id "
                             "GROUP BY wine_grapes.wine_entity "
                             f"HAVING {grape_mixes[grape]}) "
                             "GROUP BY wine_grapes.grape "
                             "ORDER BY AWARDED_WINE DESC "
-                            "LIMIT 10")
+                            "LIMIT 10").bindparams(bindparam("continent_countries", self.CONTINENTS[self.continent], expanding=True), year_from=self.year_from, year_to=self.year_to)
                     )
                 df = pd.DataFrame(res.fetchall(), columns=["GRAPE", "MEDALS", "AWARDED_WINE"])
                 color_result = f"{color_result}<p>{grape}</p>{df.to_html()}"
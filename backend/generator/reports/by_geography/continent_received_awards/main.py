@@ -1,17 +1,12 @@
 import pandas as pd
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from generator.reports.continent_report import ContinentReport
 
 
 class ContinentReceivedAwardsReport(ContinentReport):
-    @property
-    def title(self):
-        return "4.5 <Continent>: Received Award"
-
-    @property
-    def weight(self):
-        return 20
+    title = "4.5 <Continent>: Received Award"
+    weight = 20
 
     def render(self):
         with self.database.connect() as connection:
@@ -22,9 +17,9 @@ class ContinentReceivedAwardsReport(ContinentReport):
             "INNER JOIN award ON award.id = award_wine_entity.award_id "
             "INNER JOIN event ON event.id = award.event_id "
             "INNER JOIN taxonomy_term ON taxonomy_term.tid = wine.country "
-            f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND taxonomy_term.tid IN ({', '.join([str(continent) for continent in self.CONTINENTS[self.continent]])}) "
+            "WHERE (event.year BETWEEN :year_from AND :year_to) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND taxonomy_term.tid IN :continent_countries "
             "GROUP BY wine.country "
-            "ORDER BY MEDAL_COUNT DESC",)
+            "ORDER BY MEDAL_COUNT DESC",).bindparams(bindparam("continent_countries", self.CONTINENTS[self.continent], expanding=True), year_from=self.year_from, year_to=self.year_to)
         )
         df = pd.DataFrame(res.fetchall(), columns=["COUNTRY", "MEDAL_COUNT"])
 
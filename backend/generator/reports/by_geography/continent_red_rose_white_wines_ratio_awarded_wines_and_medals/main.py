@@ -2,19 +2,14 @@ import base64
 from io import BytesIO
 
 import pandas as pd
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from generator.reports.continent_report import ContinentReport
 
 
 class ContinentRedRoseWhiteWinesRatioAwardedWinesAndMedalsReport(ContinentReport):
-    @property
-    def title(self):
-        return "4.5 <Continent>: Red / Rose / White wines ratio: Awarded wines and Medals"
-
-    @property
-    def weight(self):
-        return 90
+    title = "4.5 <Continent>: Red / Rose / White wines ratio: Awarded wines and Medals"
+    weight = 90
 
     def render(self):
         wine_ratio_category = {
@@ -36,8 +31,8 @@ class ContinentRedRoseWhiteWinesRatioAwardedWinesAndMedalsReport(ContinentReport
                         "INNER JOIN event ON event.id = award.event_id "
                         "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
                         "INNER JOIN wine ON wine.id = wine_entity.wine "
-                        f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"color\"')) IN ({self.RED_WINE_ID}, {self.WHITE_WINE_ID}, {self.ROSE_WINE_ID}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND wine.country IN ({', '.join([str(continent) for continent in self.CONTINENTS[self.continent]])}) "
-                        "GROUP BY WINE_COLOR"),
+                        f"WHERE (event.year BETWEEN :year_from AND :year_to) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"color\"')) IN ({self.RED_WINE_ID}, {self.WHITE_WINE_ID}, {self.ROSE_WINE_ID}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND wine.country IN :continent_countries "
+                        "GROUP BY WINE_COLOR").bindparams(bindparam("continent_countries", self.CONTINENTS[self.continent], expanding=True), year_from=self.year_from, year_to=self.year_to),
                 )
 
             df = pd.DataFrame(res.fetchall(), columns=["", "WINE_COLOR"])
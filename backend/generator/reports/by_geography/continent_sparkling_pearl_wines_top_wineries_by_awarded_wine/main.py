@@ -1,17 +1,12 @@
 import pandas as pd
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from generator.reports.continent_report import ContinentReport
 
 
 class ContinentSparklingPearlWinesTopWineriesByAwardedWineReport(ContinentReport):
-    @property
-    def title(self):
-        return "4.5 <Continent>: Sparkling & Pearl Wines: Top Wineries by Awarded wines"
-
-    @property
-    def weight(self):
-        return 260
+    title = "4.5 <Continent>: Sparkling & Pearl Wines: Top Wineries by Awarded wines"
+    weight = 260
 
     def render(self):
         with self.database.connect() as connection:
@@ -21,11 +16,11 @@ class ContinentSparklingPearlWinesTopWineriesByAwardedWineReport(ContinentReport
                     "INNER JOIN wine ON wine.winery = winery.id "
                     "INNER JOIN wine_entity ON wine_entity.wine = wine.id "
                     "INNER JOIN wine_gwmr ON wine_gwmr.wine_entity_id = wine_entity.id "
-                    f"WHERE wine_gwmr.year_from = {self.year_from} AND wine_gwmr.year_to = {self.year_to} AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {self.SPARKLING_PEARL_WINE_WHERE_CLAUSE} and winery.country IN ({', '.join([str(continent) for continent in self.CONTINENTS[self.continent]])}) "
+                    f"WHERE wine_gwmr.year_from = :year_from AND wine_gwmr.year_to = :year_to AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {self.SPARKLING_PEARL_WINE_WHERE_CLAUSE} and winery.country IN :continent_countries "
                     "GROUP BY winery.id "
                     "ORDER BY AWARDED_WINES DESC "
                     "LIMIT 5",
-                )
+                ).bindparams(bindparam("continent_countries", self.CONTINENTS[self.continent], expanding=True), year_from=self.year_from, year_to=self.year_to)
             )
         df = pd.DataFrame(res.fetchall(), columns=["WINERY_NAME", "AWARDED_WINES"])
 
@@ -5,8 +5,10 @@ from generator.enum import WineType
 from generator.reports.top_wineries_report import TopWineriesReport
 
 
-
 class ContinentSparklingPearlWinesTopWineriesByCountReport(ContinentReport, TopWineriesReport):
+    title = "4.5.1 <Continent>: Sparkling & Pearl Wines: Top Wineries by Medal Count"
+    weight = 250
+
     @property
     def value_name(self) -> str:
         return "Medals"
@@ -17,11 +19,3 @@ class ContinentSparklingPearlWinesTopWineriesByCountReport(ContinentReport, TopW
             countries_ids=self.CONTINENTS[self.continent],
             wine_type=(WineType.SPARKLING, WineType.PEARL),
         )
-
-    @property
-    def title(self) -> str:
-        return "4.5.1 <Continent>: Sparkling & Pearl Wines: Top Wineries by Medal Count"
-
-    @property
-    def weight(self) -> int:
-        return 250
@@ -2,19 +2,14 @@ import base64
 from io import BytesIO
 
 import pandas as pd
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from generator.reports.continent_report import ContinentReport
 
 
 class ContinentStillBlendsAwardCategoryDistributionByColourReport(ContinentReport):
-    @property
-    def title(self):
-        return "4.5 <Continent>: Still Blends: Award category distribution by Colour"
-
-    @property
-    def weight(self):
-        return 140
+    title = "4.5 <Continent>: Still Blends: Award category distribution by Colour"
+    weight = 140
 
     def render(self):
         colors = {
@@ -36,12 +31,12 @@ class ContinentStillBlendsAwardCategoryDistributionByColourReport(ContinentRepor
                     "INNER JOIN wine ON wine.id = wine_entity.wine "
                     "INNER JOIN award ON award.id = award_wine_entity.award_id "
                     "INNER JOIN event ON event.id = award.event_id "
-                    f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color]} AND {self.STILL_WINE_WHERE_CLAUSE} AND wine.country IN ({', '.join([str(continent) for continent in self.CONTINENTS[self.continent]])}) AND EXISTS ( "
+                    f"WHERE (event.year BETWEEN :year_from AND :year_to) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color]} AND {self.STILL_WINE_WHERE_CLAUSE} AND wine.country IN :continent_countries AND EXISTS ( "
                     "SELECT * FROM wine_grapes "
                     "WHERE wine_grapes.wine_entity = wine_entity.id "
                     "GROUP BY wine_grapes.wine_entity "
                     f"HAVING {self.BLENDS_WINE_HAVING_CLAUSE}) "
-                    "GROUP BY award.value"),
+                    "GROUP BY award.value").bindparams(bindparam("continent_countries", self.CONTINENTS[self.continent], expanding=True), year_from=self.year_from, year_to=self.year_to),
                 )
 
             df = pd.DataFrame(res.fetchall(), columns=["MEDAL", "WINE_COUNT"]).set_index("MEDAL")
@@ -2,19 +2,14 @@ import base64
 from io import BytesIO
 
 import pandas as pd
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from generator.reports.continent_report import ContinentReport
 
 
 class ContinentStillBlendsSingleVarietyWinesRatioReport(ContinentReport):
-    @property
-    def title(self):
-        return "4.5 <Continent>: Still Blends / Single variety wines ratio"
-
-    @property
-    def weight(self):
-        return 110
+    title = "4.5 <Continent>: Still Blends / Single variety wines ratio"
+    weight = 110
 
     def render(self):
         composition_having_case = {
@@ -41,14 +36,14 @@ class ContinentStillBlendsSingleVarietyWinesRatioReport(ContinentReport):
                              "INNER JOIN event ON event.id = award.event_id "
                              "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
                              "INNER JOIN wine_grapes ON wine_grapes.wine_entity = wine_entity.id "
-                             f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND EXISTS( "
+                             "WHERE (event.year BETWEEN :year_from AND :year_to) AND EXISTS( "
                              "SELECT * FROM wine "
-                             f"WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {self.STILL_WINE_WHERE_CLAUSE} AND wine.country IN ({', '.join([str(continent) for continent in self.CONTINENTS[self.continent]])})) AND EXISTS( "
+                             f"WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {self.STILL_WINE_WHERE_CLAUSE} AND wine.country IN :continent_countries) AND EXISTS( "
                              "SELECT * FROM wine_grapes "
                              "WHERE wine_grapes.wine_entity = wine_entity.id "
                              "GROUP BY wine_grapes.wine_entity "
                              f"HAVING {composition_having_case[composition]})",
-                             ))
+                             ).bindparams(bindparam("continent_countries", self.CONTINENTS[self.continent], expanding=True), year_from=self.year_from, year_to=self.year_to))
                 df = pd.DataFrame(res.fetchall(), columns=[""], dtype=int, index=[composition])
                 df_by_composition = pd.concat([df_by_composition, df])
 
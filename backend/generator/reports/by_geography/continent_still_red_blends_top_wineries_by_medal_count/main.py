@@ -6,6 +6,9 @@ from generator.reports.top_wineries_report import TopWineriesReport
 
 
 class ContinentStillRedBlendsTopWineriesByMedalCountReport(ContinentReport, TopWineriesReport):
+    title = "4.5.1 <Continent>: Still Red Blends: Top Wineries by Medal Count"
+    weight = 170
+
     @property
     def value_name(self) -> str:
         return "Medals"
@@ -18,11 +21,3 @@ class ContinentStillRedBlendsTopWineriesByMedalCountReport(ContinentReport, TopW
             wine_type=WineType.STILL,
             grape_variety=GrapeVariety.BLEND,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.5.1 <Continent>: Still Red Blends: Top Wineries by Medal Count"
-
-    @property
-    def weight(self) -> int:
-        return 170
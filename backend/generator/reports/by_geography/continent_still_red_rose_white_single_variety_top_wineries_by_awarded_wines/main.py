@@ -1,17 +1,12 @@
 import pandas as pd
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from generator.reports.continent_report import ContinentReport
 
 
 class ContinentStillRedRoseWhiteSingleVarietyTopWineriesByAwardedWinesReport(ContinentReport):
-    @property
-    def title(self):
-        return "4.5 <Continent>: Still Red / Rose / White Single Variety: Top Wineries by Awarded wines"
-
-    @property
-    def weight(self):
-        return 220
+    title = "4.5 <Continent>: Still Red / Rose / White Single Variety: Top Wineries by Awarded wines"
+    weight = 220
 
     def render(self):
         colors_ids = {
@@ -29,7 +24,7 @@ class ContinentStillRedRoseWhiteSingleVarietyTopWineriesByAwardedWinesReport(Con
                         "INNER JOIN wine ON wine.winery = winery.id "
                         "INNER JOIN wine_entity ON wine_entity.wine = wine.id "
                         "INNER JOIN wine_gwmr ON wine_gwmr.wine_entity_id = wine_entity.id "
-                        f"WHERE wine_gwmr.year_from = {self.year_from} AND wine_gwmr.year_to = {self.year_to} AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors_ids[color]} AND winery.country IN ({', '.join([str(continent) for continent in self.CONTINENTS[self.continent]])}) AND {self.STILL_WINE_WHERE_CLAUSE} AND EXISTS( "
+                        f"WHERE wine_gwmr.year_from = :year_from AND wine_gwmr.year_to = :year_to AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors_ids[color]} AND winery.country IN :continent_countries AND {self.STILL_WINE_WHERE_CLAUSE} AND EXISTS( "
                         "SELECT * FROM wine_grapes "
                         "WHERE wine_grapes.wine_entity = wine_entity.id "
                         "GROUP BY wine_grapes.wine_entity "
@@ -37,7 +32,7 @@ class ContinentStillRedRoseWhiteSingleVarietyTopWineriesByAwardedWinesReport(Con
                         "GROUP BY winery.id "
                         "ORDER BY AWARDED_WINES DESC "
                         "LIMIT 5",
-                    )
+                    ).bindparams(bindparam("continent_countries", self.CONTINENTS[self.continent], expanding=True), year_from=self.year_from, year_to=self.year_to)
                 )
             df = pd.DataFrame(res.fetchall(), columns=["WINERY_NAME", "AWARDED_WINES"])
             result = f"{result}<b>{color} Wines</b>{df.to_html()}<br>"
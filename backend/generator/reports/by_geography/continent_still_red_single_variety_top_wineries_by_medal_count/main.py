@@ -6,6 +6,9 @@ from generator.reports.top_wineries_report import TopWineriesReport
 
 
 class ContinentStillRedSingleVarietyTopWineriesByMedalCountReport(TopWineriesReport, ContinentReport):
+    title = "4.5.1 <Continent>: Still Red Single Variety: Top Wineries by Medal Count"
+    weight = 210
+
     @property
     def value_name(self) -> str:
         return "Medals"
@@ -18,11 +21,3 @@ class ContinentStillRedSingleVarietyTopWineriesByMedalCountReport(TopWineriesRep
             wine_type=WineType.STILL,
             grape_variety=GrapeVariety.SINGLE,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.5.1 <Continent>: Still Red Single Variety: Top Wineries by Medal Count"
-
-    @property
-    def weight(self) -> int:
-        return 210
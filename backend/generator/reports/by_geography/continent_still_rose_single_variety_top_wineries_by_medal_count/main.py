@@ -6,6 +6,9 @@ from generator.reports.top_wineries_report import TopWineriesReport
 
 
 class ContinentStillRoseSingleVarietyTopWineriesByMedalCountReport(ContinentReport, TopWineriesReport):
+    title = "4.5.1 <Continent>: Still Rose Single Variety: Top Wineries by Medal Count"
+    weight = 216
+
     @property
     def value_name(self) -> str:
         return "Medals"
@@ -18,11 +21,3 @@ class ContinentStillRoseSingleVarietyTopWineriesByMedalCountReport(ContinentRepo
             wine_type=WineType.STILL,
             grape_variety=GrapeVariety.SINGLE,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.5.1 <Continent>: Still Rose Single Variety: Top Wineries by Medal Count"
-
-    @property
-    def weight(self) -> int:
-        return 216
@@ -6,6 +6,9 @@ from generator.reports.top_wineries_report import TopWineriesReport
 
 
 class ContinentStillWhiteSingleVarietyTopWineriesByMedalCountReport(ContinentReport, TopWineriesReport):
+    title = "4.5.1 <Continent>: Still White Single Variety: Top Wineries by Medal Count"
+    weight = 213
+
     @property
     def value_name(self) -> str:
         return "Medals"
@@ -18,11 +21,3 @@ class ContinentStillWhiteSingleVarietyTopWineriesByMedalCountReport(ContinentRep
             wine_type=WineType.STILL,
             grape_variety=GrapeVariety.SINGLE,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.5.1 <Continent>: Still White Single Variety: Top Wineries by Medal Count"
-
-    @property
-    def weight(self) -> int:
-        return 213
@@ -4,6 +4,9 @@ from generator.reports.top_wines_report import TopWinesReport
 
 
 class ContinentTopSparklingPearlWinesByGwmr(TopWinesReport, ContinentReport):
+    title = "4.5.1 <Continent>: Top Sparkling & Pearl Wines by GWMR"
+    weight = 230
+
     def get_url(self) -> str:
         return self.build_top_wines_url(
             event_year=(self.year_from, self.year_to),
@@ -11,11 +14,3 @@ class ContinentTopSparklingPearlWinesByGwmr(TopWinesReport, ContinentReport):
             wine_type=(WineType.SPARKLING, WineType.PEARL),
             countries_ids=self.CONTINENTS[self.continent],
         )
-
-    @property
-    def title(self) -> str:
-        return "4.5.1 <Continent>: Top Sparkling & Pearl Wines by GWMR"
-
-    @property
-    def weight(self) -> int:
-        return 230
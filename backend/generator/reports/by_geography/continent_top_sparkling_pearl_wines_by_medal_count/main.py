@@ -4,6 +4,9 @@ from generator.reports.top_wines_report import TopWinesReport
 
 
 class ContinentTopSparklingPearlWinesByMedalCountReport(TopWinesReport, ContinentReport):
+    title = "4.5 <Continent>: Top Sparkling & Pearl Wines by Medal Count"
+    weight = 240
+
     def get_url(self) -> str:
         return self.build_top_wines_url(
             event_year=(self.year_from, self.year_to),
@@ -11,11 +14,3 @@ class ContinentTopSparklingPearlWinesByMedalCountReport(TopWinesReport, Continen
             wine_type=(WineType.SPARKLING, WineType.PEARL),
             countries_ids=self.CONTINENTS[self.continent],
         )
-
-    @property
-    def title(self) -> str:
-        return "4.5 <Continent>: Top Sparkling & Pearl Wines by Medal Count"
-
-    @property
-    def weight(self) -> int:
-        return 240
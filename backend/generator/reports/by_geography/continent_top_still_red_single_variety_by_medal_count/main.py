@@ -4,6 +4,9 @@ from generator.reports.top_wines_report import TopWinesReport
 
 
 class ContinentTopStillRedSingleVarietyByMedalCountReport(TopWinesReport, ContinentReport):
+    title = "4.5.1 <Continent>: Top Still Red Single Variety by Medal Count"
+    weight = 200
+
     def get_url(self) -> str:
         return self.build_top_wines_url(
             event_year=(self.year_from, self.year_to),
@@ -13,11 +16,3 @@ class ContinentTopStillRedSingleVarietyByMedalCountReport(TopWinesReport, Contin
             grape_variety=GrapeVariety.SINGLE,
             countries_ids=self.CONTINENTS[self.continent],
         )
-
-    @property
-    def title(self) -> str:
-        return "4.5.1 <Continent>: Top Still Red Single Variety by Medal Count"
-
-    @property
-    def weight(self) -> int:
-        return 200
@@ -4,6 +4,9 @@ from generator.reports.top_wines_report import TopWinesReport
 
 
 class ContinentTopStillWhiteBlendsByGwmrReport(TopWinesReport, ContinentReport):
+    title = "4.5.2 <Continent>: Top Still White Blends by GWMR"
+    weight = 153
+
     def get_url(self) -> str:
         return self.build_top_wines_url(
             event_year=(self.year_from, self.year_to),
@@ -13,11 +16,3 @@ class ContinentTopStillWhiteBlendsByGwmrReport(TopWinesReport, ContinentReport):
             grape_variety=GrapeVariety.BLEND,
             countries_ids=self.CONTINENTS[self.continent],
         )
-
-    @property
-    def title(self) -> str:
-        return "4.5.2 <Continent>: Top Still White Blends by GWMR"
-
-    @property
-    def weight(self) -> int:
-        return 153
@@ -4,6 +4,9 @@ from generator.reports.top_wines_report import TopWinesReport
 
 
 class ContinentTopStillWhiteSingleVarietyByMedalCountReport(TopWinesReport, ContinentReport):
+    title = "4.5.2 <Continent>: Top Still White Single Variety by Medal Count"
+    weight = 203
+
     def get_url(self) -> str:
         return self.build_top_wines_url(
             event_year=(self.year_from, self.year_to),
@@ -13,11 +16,3 @@ class ContinentTopStillWhiteSingleVarietyByMedalCountReport(TopWinesReport, Cont
             grape_variety=GrapeVariety.SINGLE,
             countries_ids=self.CONTINENTS[self.continent],
         )
-
-    @property
-    def title(self) -> str:
-        return "4.5.2 <Continent>: Top Still White Single Variety by Medal Count"
-
-    @property
-    def weight(self) -> int:
-        return 203
@@ -8,13 +8,8 @@ from gustos.models import wine_entity, wine, taxonomy_term, award_wine_entity
 
 
 class CountryAverageRatingForWineRegionsReport(HistogramReport, CountryReport):
-    @property
-    def title(self) -> str:
-        return "4.5 <Country>: Average rating for Wine Regions"
-
-    @property
-    def weight(self) -> int:
-        return 360
+    title = "4.5 <Country>: Average rating for Wine Regions"
+    weight = 360
 
     @property
     def get_query_args(self) -> dict[Any, str]:
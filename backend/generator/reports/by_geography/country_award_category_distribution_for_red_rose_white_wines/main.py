@@ -8,13 +8,8 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryAwardCategoryDistributionForRedRoseWhiteWinesReport(CountryReport):
-    @property
-    def title(self):
-        return "4.5 <Country>: Award category distribution for Red / Rose / White wine"
-
-    @property
-    def weight(self):
-        return 420
+    title = "4.5 <Country>: Award category distribution for Red / Rose / White wine"
+    weight = 420
 
     def render(self):
         country_id = self.country
@@ -38,8 +33,8 @@ class CountryAwardCategoryDistributionForRedRoseWhiteWinesReport(CountryReport):
                     "INNER JOIN wine ON wine.id = wine_entity.wine "
                     "INNER JOIN award ON award.id = award_wine_entity.award_id "
                     "INNER JOIN event ON event.id = award.event_id "
-                    f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color]} AND wine.country IN ({country_id}) "
-                    "GROUP BY award.value"),
+                    f"WHERE (event.year BETWEEN :year_from AND :year_to) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color]} AND wine.country IN (:country_id) "
+                    "GROUP BY award.value").bindparams(year_from=self.year_from, year_to=self.year_to, country_id=country_id),
                 )
 
             df = pd.DataFrame(res.fetchall(), columns=["MEDAL", "WINE_COUNT"], dtype=int).set_index("MEDAL")
@@ -5,13 +5,8 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryAwardedWinesByRegionReport(CountryReport):
-    @property
-    def title(self):
-        return "4.5 <Country>: Awarded wines by region"
-
-    @property
-    def weight(self):
-        return 335
+    title = "4.5 <Country>: Awarded wines by region"
+    weight = 335
 
     def render(self):
         result = ""
@@ -21,11 +16,11 @@ class CountryAwardedWinesByRegionReport(CountryReport):
                 text(
                     "SELECT COUNT(wine_entity.id) AS AWARDED_WINES FROM wine_entity "
                     "INNER JOIN wine_gwmr ON wine_gwmr.wine_entity_id = wine_entity.id "
-                    f"WHERE wine_gwmr.year_from = {self.year_from} AND wine_gwmr.year_to = {self.year_to} AND EXISTS( "
+                    "WHERE wine_gwmr.year_from = :year_from AND wine_gwmr.year_to = :year_to AND EXISTS( "
                     "SELECT * FROM wine "
-                    f"WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND wine.country IN ({self.country})) "
+                    "WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND wine.country IN (:country)) "
                     "ORDER BY AWARDED_WINES DESC",
-                )
+                ).bindparams(year_from=self.year_from, year_to=self.year_to, country=self.country)
             )
 
         try:
@@ -39,12 +34,12 @@ class CountryAwardedWinesByRegionReport(CountryReport):
                     "SELECT taxonomy_term.name AS REGION_NAME, COUNT(wine_entity.id) AS AWARDED_WINES FROM wine_entity "
                     "INNER JOIN wine_gwmr ON wine_gwmr.wine_entity_id = wine_entity.id "
                     "INNER JOIN taxonomy_term ON taxonomy_term.tid = wine_entity.region "
-                    f"WHERE wine_gwmr.year_from = {self.year_from} AND wine_gwmr.year_to = {self.year_to} AND EXISTS( "
+                    "WHERE wine_gwmr.year_from = :year_from AND wine_gwmr.year_to = :year_to AND EXISTS( "
                     "SELECT * FROM wine "
-                    f"WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND wine.country IN ({self.country})) AND taxonomy_term.name != 'Unknown' "
+                    "WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND wine.country IN (:country)) AND taxonomy_term.name != 'Unknown' "
                     "GROUP BY taxonomy_term.tid "
                     "ORDER BY AWARDED_WINES DESC",
-                )
+                ).bindparams(year_from=self.year_from, year_to=self.year_to, country=self.country)
             )
 
         df = pd.DataFrame(res.fetchall(), columns=["REGION_NAME", "AWARDED_WINES"])
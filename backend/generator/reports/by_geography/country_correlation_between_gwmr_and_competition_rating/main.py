@@ -5,13 +5,8 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryCorrelationBetweenGwmrAndCompetitionRatingReport(CorrelationReport, CountryReport):
-    @property
-    def title(self) -> str:
-        return "4.5 <Country>: Correlation between GWMR and Competition rating"
-
-    @property
-    def weight(self) -> int:
-        return 370
+    title = "4.5 <Country>: Correlation between GWMR and Competition rating"
+    weight = 370
 
     @property
     def x_column_name(self) -> str:
@@ -5,6 +5,9 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryCorrelationBetweenGwmrAndMedalsCountReport(CorrelationReport, CountryReport):
+    title = "4.5 <Country>: Correlation between GWMR and Medals Count"
+    weight = 380
+
     @property
     def x_column_name(self) -> str:
         return "MEDALS COUNT"
@@ -18,11 +21,3 @@ class CountryCorrelationBetweenGwmrAndMedalsCountReport(CorrelationReport, Count
             event_year=(self.year_from, self.year_to),
             countries_ids=self.country,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.5 <Country>: Correlation between GWMR and Medals Count"
-
-    @property
-    def weight(self) -> int:
-        return 380
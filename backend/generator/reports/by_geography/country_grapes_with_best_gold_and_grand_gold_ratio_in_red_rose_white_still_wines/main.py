@@ -9,13 +9,8 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryGrapesWithBestGoldAndGrandGoldRatioInRedRoseWhiteStillWinesReport(CountryReport):
-    @property
-    def title(self):
-        return "4.5 <Country>: Grapes with best Gold and Grand Gold ratio in Red / Rose / White Still Wines"
-
-    @property
-    def weight(self):
-        return 480
+    title = "4.5 <Country>: Grapes with best Gold and Grand Gold ratio in Red / Rose / White Still Wines"
+    weight = 480
 
     def render(self):
         colors = {
@@ -28,12 +23,9 @@ class CountryGrapesWithBestGoldAndGrandGoldRatioInRedRoseWhiteStillWinesReport(C
             "SINGLE": [self.SINGLE_GRAPE_WINE_HAVING_CLAUSE, GrapeVariety.SINGLE],
         }
 
-        result = ""
+        top_grapes = {}
         for color in colors:
-            page_info = []
             for mix in grape_mixes:
-                category = {"title": f"{color} STILL {mix}"}
-
                 with self.database.connect() as connection:
                     res = connection.execute(
                         text(
@@ -51,7 +43,7 @@ class CountryGrapesWithBestGoldAndGrandGoldRatioInRedRoseWhiteStillWinesReport(C
                             "        from event e "
                             "        where "
                             "            e.id = a.event_id and "
-                            f"            (e.year between {self.year_from} and {self.year_to}) "
+                            "            (e.year between :year_from and :year_to) "
                             "    ) and "
                             "    exists( "
                             "        select * "
@@ -61,7 +53,7 @@ class CountryGrapesWithBestGoldAndGrandGoldRatioInRedRoseWhiteStillWinesReport(C
                             "            json_unquote(json_extract(w.category, '$.\"beverageType\"')) in (1425) and "
                             f"           {self.STILL_WINE_WHERE_CLAUSE.replace('wine', 'w')} and "
                             f"           {colors[color][0].replace('wine', 'w')} and "
-                            f"           w.country = {self.country} "
+                            "           w.country = :country "
                             "    ) and "
                             "    exists( "
                             "        select * "
@@ -75,12 +67,29 @@ class CountryGrapesWithBestGoldAndGrandGoldRatioInRedRoseWhiteStillWinesReport(C
                             "having count(a.id) >= 2 "
                             "order by count(case when a.value in ('GRAND', 'GOLD') then 1 end) / count(a.value) desc "
                             "limit 16"
-                        )
+                        ).bindparams(year_from=self.year_from, year_to=self.year_to, country=self.country)
                     )
-                top_grapes = res.fetchall()
+                top_grapes[color, mix] = res.fetchall()
+
+        # Medals of all grapes of all colors and grape mixes are counted by one query.
+        with self.database.connect() as connection:
+            distributions = self.get_grape_medal_distributions(
+                connection,
+                {
+                    (color, mix): ([grape_id for _, grape_id in top_grapes[color, mix]], f"{colors[color][0]} AND {self.STILL_WINE_WHERE_CLAUSE}", grape_mixes[mix][0])
+                    for color in colors
+                    for mix in grape_mixes
+                },
+                countries_ids=(self.country,),
+            )
 
+        result = ""
+        for color in colors:
+            page_info = []
+            for mix in grape_mixes:
+                category = {"title": f"{color} STILL {mix}"}
                 category["diagrams"] = []
-                for grape, grape_id in top_grapes:
+                for grape, grape_id in top_grapes[color, mix]:
                     df_pre = pd.DataFrame(
                         index=["GRAND", "GOLD", "SILVER", "BRONZE"])
 
@@ -96,26 +105,7 @@ class CountryGrapesWithBestGoldAndGrandGoldRatioInRedRoseWhiteStillWinesReport(C
                         )
                     }
 
-                    with self.database.connect() as connection:
-                        res = connection.execute(
-                            text(
-                                "SELECT COUNT(award.value) AS MEDAL_COUNT, award.value AS MEDAL_NAME FROM award_wine_entity "
-                                "INNER JOIN award ON award.id = award_wine_entity.award_id "
-                                "INNER JOIN event ON event.id = award.event_id "
-                                "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
-                                "INNER JOIN wine_grapes ON wine_grapes.wine_entity = wine_entity.id "
-                                f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND EXISTS( "
-                                "SELECT * FROM wine "
-                                f"WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color][0]} AND {self.STILL_WINE_WHERE_CLAUSE} AND wine.country IN ({self.country})) AND EXISTS( "
-                                "SELECT * FROM wine_grapes "
-                                f"WHERE wine_grapes.wine_entity = wine_entity.id "
-                                "GROUP BY wine_grapes.wine_entity "
-                                f"HAVING {grape_mixes[mix][0]}) AND wine_grapes.grape = {grape_id} "
-                                "GROUP BY award.value"
-                            ),
-                        )
-
-                    df = pd.DataFrame(res.fetchall(), columns=["MEDAL_COUNT", "MEDAL_NAME"]).set_index("MEDAL_NAME")
+                    df = pd.DataFrame(distributions.get(((color, mix), grape_id), []), columns=["MEDAL_NAME", "MEDAL_COUNT"]).set_index("MEDAL_NAME")
                     df = pd.concat([df_pre, df], axis=1)
 
                     df["MEDAL_COUNT"] = 0 if df["MEDAL_COUNT"].sum() == 0 else (df["MEDAL_COUNT"] / df["MEDAL_COUNT"].sum()) * 100
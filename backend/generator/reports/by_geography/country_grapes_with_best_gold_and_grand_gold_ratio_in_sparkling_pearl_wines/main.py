@@ -9,13 +9,8 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryGrapesWithBestGoldAndGrandGoldRatioInSparklingPearlWinesReport(CountryReport):
-    @property
-    def title(self):
-        return "4.5 <Country>: Grapes with best Gold and Grand Gold ratio in Sparkling & Pearl wines"
-
-    @property
-    def weight(self):
-        return 500
+    title = "4.5 <Country>: Grapes with best Gold and Grand Gold ratio in Sparkling & Pearl wines"
+    weight = 500
 
     def render(self):
         colors = {
@@ -23,10 +18,8 @@ class CountryGrapesWithBestGoldAndGrandGoldRatioInSparklingPearlWinesReport(Coun
             "ROSE": [self.ROSE_WINE_WHERE_CLAUSE, WineColor.ROSE],
         }
 
-        page_info = []
+        top_grapes = {}
         for color in colors:
-            category = {"title": f"SPARKLING OR PEARL {color} WINES"}
-
             with self.database.connect() as connection:
                 res = connection.execute(
                     text(
@@ -44,7 +37,7 @@ class CountryGrapesWithBestGoldAndGrandGoldRatioInSparklingPearlWinesReport(Coun
                         "        from event e "
                         "        where "
                         "            e.id = a.event_id and "
-                        f"            (e.year between {self.year_from} and {self.year_to}) "
+                        "            (e.year between :year_from and :year_to) "
                         "    ) and "
                         "    exists( "
                         "        select * "
@@ -54,18 +47,32 @@ class CountryGrapesWithBestGoldAndGrandGoldRatioInSparklingPearlWinesReport(Coun
                         "            json_unquote(json_extract(w.category, '$.\"beverageType\"')) in (1425) and "
                         f"           {self.SPARKLING_PEARL_WINE_WHERE_CLAUSE.replace('wine', 'w')} and "
                         f"           {colors[color][0].replace('wine', 'w')} and "
-                        f"           w.country = {self.country} "
+                        "           w.country = :country "
                         "    ) "
                         "group by tt.tid "
                         "having count(a.id) >= 2 "
                         "order by count(case when a.value in ('GRAND', 'GOLD') then 1 end) / count(a.value) desc "
                         "limit 10"
-                    )
+                    ).bindparams(year_from=self.year_from, year_to=self.year_to, country=self.country)
                 )
-            top_grapes = res.fetchall()
+            top_grapes[color] = res.fetchall()
+
+        # Medals of all grapes of all colors are counted by one query.
+        with self.database.connect() as connection:
+            distributions = self.get_grape_medal_distributions(
+                connection,
+                {
+                    color: ([grape_id for _, grape_id in top_grapes[color]], f"{colors[color][0]} AND {self.SPARKLING_PEARL_WINE_WHERE_CLAUSE}", None)
+                    for color in colors
+                },
+                countries_ids=(self.country,),
+            )
 
+        page_info = []
+        for color in colors:
+            category = {"title": f"SPARKLING OR PEARL {color} WINES"}
             category["diagrams"] = []
-            for grape, grape_id in top_grapes:
+            for grape, grape_id in top_grapes[color]:
                 df_pre = pd.DataFrame(
                     index=["GRAND", "GOLD", "SILVER", "BRONZE"])
 
@@ -81,22 +88,7 @@ class CountryGrapesWithBestGoldAndGrandGoldRatioInSparklingPearlWinesReport(Coun
                     )
                 }
 
-                with self.database.connect() as connection:
-                    res = connection.execute(
-                        text(
-                            "SELECT COUNT(award.value) AS MEDAL_COUNT, award.value AS MEDAL_NAME FROM award_wine_entity "
-                            "INNER JOIN award ON award.id = award_wine_entity.award_id "
-                            "INNER JOIN event ON event.id = award.event_id "
-                            "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
-                            "INNER JOIN wine_grapes ON wine_grapes.wine_entity = wine_entity.id "
-                            f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND EXISTS( "
-                            "SELECT * FROM wine "
-                            f"WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color][0]} AND {self.SPARKLING_PEARL_WINE_WHERE_CLAUSE} AND wine.country IN ({self.country})) AND wine_grapes.grape = {grape_id} "
-                            "GROUP BY award.value"
-                        ),
-                    )
-
-                df = pd.DataFrame(res.fetchall(), columns=["MEDAL_COUNT", "MEDAL_NAME"]).set_index("MEDAL_NAME")
+                df = pd.DataFrame(distributions.get((color, grape_id), []), columns=["MEDAL_NAME", "MEDAL_COUNT"]).set_index("MEDAL_NAME")
                 df = pd.concat([df_pre, df], axis=1)
 
                 df["MEDAL_COUNT"] = 0 if df["MEDAL_COUNT"].sum() == 0 else (df["MEDAL_COUNT"] / df["MEDAL_COUNT"].sum()) * 100
@@ -5,13 +5,8 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryIconicWinesWinesDistributionReport(CountryReport):
-    @property
-    def title(self):
-        return "4.5 <Country>: “Iconic wines” wines distribution"
-
-    @property
-    def weight(self):
-        return 350
+    title = "4.5 <Country>: “Iconic wines” wines distribution"
+    weight = 350
 
     def render(self):
         result = ""
@@ -22,9 +17,9 @@ class CountryIconicWinesWinesDistributionReport(CountryReport):
                     f"SELECT COUNT(CASE WHEN {self.ICONIC_WINES_WHERE_CLAUSE} THEN 1 END) AS WITH_HIGH_GWMR_SCORE, COUNT(wine_gwmr.rating) AS WITH_ALL_GWMR_SCORE FROM wine_entity "
                     "INNER JOIN wine_gwmr ON wine_gwmr.wine_entity_id = wine_entity.id "
                     "INNER JOIN wine ON wine.id = wine_entity.wine "
-                    f"WHERE wine_gwmr.year_from = {self.year_from} AND wine_gwmr.year_to = {self.year_to} AND wine.country IN ({self.country}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) "
+                    "WHERE wine_gwmr.year_from = :year_from AND wine_gwmr.year_to = :year_to AND wine.country IN (:country) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) "
                     "ORDER BY WITH_HIGH_GWMR_SCORE DESC",
-                )
+                ).bindparams(year_from=self.year_from, year_to=self.year_to, country=self.country)
             )
 
         country_with_height_gwmr_score, country_with_all_gwmr_score = res.fetchall()[0]
@@ -36,10 +31,10 @@ class CountryIconicWinesWinesDistributionReport(CountryReport):
                     "INNER JOIN wine_gwmr ON wine_gwmr.wine_entity_id = wine_entity.id "
                     "INNER JOIN wine ON wine.id = wine_entity.wine "
                     "INNER JOIN taxonomy_term ON taxonomy_term.tid = wine_entity.region "
-                    f"WHERE wine_gwmr.year_from = {self.year_from} AND wine_gwmr.year_to = {self.year_to} AND wine.country IN ({self.country}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND taxonomy_term.name != 'Unknown' "
+                    "WHERE wine_gwmr.year_from = :year_from AND wine_gwmr.year_to = :year_to AND wine.country IN (:country) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND taxonomy_term.name != 'Unknown' "
                     "GROUP BY wine_entity.region "
                     "ORDER BY WITH_HIGH_GWMR_SCORE DESC, WITH_ALL_GWMR_SCORE DESC",
-                )
+                ).bindparams(year_from=self.year_from, year_to=self.year_to, country=self.country)
             )
 
         df = pd.DataFrame(res.fetchall(), columns=["REGION", "WITH_HIGH_GWMR_SCORE", "WITH_ALL_GWMR_SCORE"])
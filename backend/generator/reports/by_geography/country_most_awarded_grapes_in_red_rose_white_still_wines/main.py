@@ -5,13 +5,8 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryMostAwardedGrapesInRedRoseWhiteStillWinesReport(CountryReport):
-    @property
-    def title(self):
-        return "4.5 <Country>: Most awarded grapes in Red / Rose / White Still Wines"
-
-    @property
-    def weight(self):
-        return 470
+    title = "4.5 <Country>: Most awarded grapes in Red / Rose / White Still Wines"
+    weight = 470
 
     def render(self):
         colors = {
@@ -38,13 +33,13 @@ class CountryMostAwardedGrapesInRedRoseWhiteStillWinesReport(CountryReport):
                             "INNER JOIN wine ON wine.id = wine_entity.wine "
                             "INNER JOIN wine_grapes ON wine_grapes.wine_entity = wine_entity.id "
                             "INNER JOIN taxonomy_term ON taxonomy_term.tid = wine_grapes.grape "
-                            f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND wine.id = wine_entity.wine AND wine.country IN ({self.country}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color]} AND {self.STILL_WINE_WHERE_CLAUSE} AND {grape_mix[grape]} EXISTS ( "
+                            f"WHERE (event.year BETWEEN :year_from AND :year_to) AND wine.id = wine_entity.wine AND wine.country IN (:country) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color]} AND {self.STILL_WINE_WHERE_CLAUSE} AND {grape_mix[grape]} EXISTS ( "
                             "SELECT * FROM wine_grapes "
                             f"WHERE wine_grapes.wine_entity = wine_entity.id AND {self.SINGLE_GRAPE_WHERE_EXISTS_CLAUSE}) "
                             "GROUP BY wine_grapes.grape "
                             "ORDER BY AWARDED_WINE DESC "
                             "LIMIT 10",
-                            ))
+                            ).bindparams(year_from=self.year_from, year_to=self.year_to, country=self.country))
 
                 df = pd.DataFrame(res.fetchall(), columns=["MEDALS", "AWARDED_WINE", "GRAPE_NAME"])
                 color_result = f"{color_result}<p>{grape}</p>{df.to_html()}"
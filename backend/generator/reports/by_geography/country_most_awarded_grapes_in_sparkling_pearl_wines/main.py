@@ -5,13 +5,8 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryMostAwardedGrapesInSparklingPearlWinesReport(CountryReport):
-    @property
-    def title(self):
-        return "4.5 <Country>: Most awarded grapes in Sparkling & Pearl Wines"
-
-    @property
-    def weight(self):
-        return 490
+    title = "4.5 <Country>: Most awarded grapes in Sparkling & Pearl Wines"
+    weight = 490
 
     def render(self):
         colors = {
@@ -30,13 +25,13 @@ class CountryMostAwardedGrapesInSparklingPearlWinesReport(CountryReport):
                         "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
                         "INNER JOIN wine_grapes ON wine_grapes.wine_entity = wine_entity.id "
                         "INNER JOIN taxonomy_term ON taxonomy_term.tid = wine_grapes.grape "
-                        f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND EXISTS( "
+                        "WHERE (event.year BETWEEN :year_from AND :year_to) AND EXISTS( "
                         "SELECT * FROM wine "
-                        f"WHERE wine.id = wine_entity.wine AND wine.country IN ({self.country}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color]} AND {self.SPARKLING_PEARL_WINE_WHERE_CLAUSE}) "
+                        f"WHERE wine.id = wine_entity.wine AND wine.country IN (:country) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color]} AND {self.SPARKLING_PEARL_WINE_WHERE_CLAUSE}) "
                         "GROUP BY wine_grapes.grape "
                         "ORDER BY MEDAL_COUNT DESC "
                         "LIMIT 10",
-                        ))
+                        ).bindparams(year_from=self.year_from, year_to=self.year_to, country=self.country))
             df = pd.DataFrame(res.fetchall(), columns=["GRAPE", "MEDAL_COUNT"])
             result = f"{result}<div><p>Sparkling or Pearl {color} Wines</p>{df.to_html()}</div>"
 
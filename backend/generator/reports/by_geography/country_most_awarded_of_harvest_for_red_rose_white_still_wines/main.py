@@ -5,13 +5,8 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryMostAwardedOfHarvestForRedRoseWhiteStillWinesReport(CountryReport):
-    @property
-    def title(self):
-        return "4.5 <Country>: Most awarded years of harvest for Red / Rose / White Still wines"
-
-    @property
-    def weight(self):
-        return 510
+    title = "4.5 <Country>: Most awarded years of harvest for Red / Rose / White Still wines"
+    weight = 510
 
     def render(self):
         colors = {
@@ -29,13 +24,13 @@ class CountryMostAwardedOfHarvestForRedRoseWhiteStillWinesReport(CountryReport):
                         "INNER JOIN award ON award.id = award_wine_entity.award_id "
                         "INNER JOIN event ON event.id = award.event_id "
                         "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
-                        f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND EXISTS( "
+                        "WHERE (event.year BETWEEN :year_from AND :year_to) AND EXISTS( "
                         "SELECT * FROM wine "
-                        f"WHERE wine.id = wine_entity.wine AND wine.country IN ({self.country}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color]} AND {self.STILL_WINE_WHERE_CLAUSE}) AND wine_entity.vintage != 1 "
+                        f"WHERE wine.id = wine_entity.wine AND wine.country IN (:country) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color]} AND {self.STILL_WINE_WHERE_CLAUSE}) AND wine_entity.vintage != 1 "
                         "GROUP BY wine_entity.vintage "
                         "ORDER BY MEDAL_COUNT DESC "
                         "LIMIT 10",
-                        ))
+                        ).bindparams(year_from=self.year_from, year_to=self.year_to, country=self.country))
             df = pd.DataFrame(res.fetchall(), columns=["VINTAGE", "MEDAL_COUNT"])
             result = f"{result}<div><p>{color} wines</p>{df.to_html()}</div>"
 
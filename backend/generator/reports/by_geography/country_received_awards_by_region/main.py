@@ -5,13 +5,8 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryReceivedAwardsByRegionReport(CountryReport):
-    @property
-    def title(self):
-        return "4.5 <Country>: Received Awards by region"
-
-    @property
-    def weight(self):
-        return 330
+    title = "4.5 <Country>: Received Awards by region"
+    weight = 330
 
     def render(self):
         result = ""
@@ -22,12 +17,12 @@ class CountryReceivedAwardsByRegionReport(CountryReport):
                     "SELECT COUNT(award_wine_entity.award_id) AS AWARD_COUNT FROM award_wine_entity "
                     "INNER JOIN award ON award.id = award_wine_entity.award_id "
                     "INNER JOIN event ON event.id = award.event_id "
-                    f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND EXISTS( "
+                    "WHERE (event.year BETWEEN :year_from AND :year_to) AND EXISTS( "
                     "SELECT * FROM wine_entity "
                     "INNER JOIN wine ON wine.id = wine_entity.wine "
-                    f"WHERE wine_entity.id = award_wine_entity.wine_entity_id AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND wine.country IN ({self.country})) "
+                    "WHERE wine_entity.id = award_wine_entity.wine_entity_id AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND wine.country IN (:country)) "
                     "ORDER BY AWARD_COUNT DESC",
-                    ))
+                    ).bindparams(year_from=self.year_from, year_to=self.year_to, country=self.country))
 
         try:
             all_country_award_count = res.fetchall()[0][0]
@@ -42,12 +37,12 @@ class CountryReceivedAwardsByRegionReport(CountryReport):
                     "INNER JOIN event ON event.id = award.event_id "
                     "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
                     "INNER JOIN taxonomy_term ON taxonomy_term.tid = wine_entity.region "
-                    f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND EXISTS( "
+                    "WHERE (event.year BETWEEN :year_from AND :year_to) AND EXISTS( "
                     "SELECT * FROM wine "
-                    f"WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND wine.country IN ({self.country})) AND taxonomy_term.name != 'Unknown' "
+                    "WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND wine.country IN (:country)) AND taxonomy_term.name != 'Unknown' "
                     "GROUP BY taxonomy_term.tid "
                     "ORDER BY AWARD_COUNT DESC",
-                    ))
+                    ).bindparams(year_from=self.year_from, year_to=self.year_to, country=self.country))
 
         df = pd.DataFrame(res.fetchall(), columns=["REGION_NAME", "AWARD_COUNT"])
         with_region_country_award_count = sum(df["AWARD_COUNT"])
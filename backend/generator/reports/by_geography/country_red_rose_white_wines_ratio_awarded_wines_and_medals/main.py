@@ -8,13 +8,8 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryRedRoseWhiteWinesRatioAwardedWinesAndMedalsReport(CountryReport):
-    @property
-    def title(self):
-        return "4.5 <Country>: Red / Rose / White wines ratio: Awarded wines and Medals"
-
-    @property
-    def weight(self):
-        return 410
+    title = "4.5 <Country>: Red / Rose / White wines ratio: Awarded wines and Medals"
+    weight = 410
 
     def render(self):
         wine_ratio_category = {
@@ -36,9 +31,9 @@ class CountryRedRoseWhiteWinesRatioAwardedWinesAndMedalsReport(CountryReport):
                         "INNER JOIN event ON event.id = award.event_id "
                         "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
                         "INNER JOIN wine ON wine.id = wine_entity.wine "
-                        f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"color\"')) IN ({self.RED_WINE_ID}, {self.WHITE_WINE_ID}, {self.ROSE_WINE_ID}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND wine.country IN ({self.country}) "
+                        f"WHERE (event.year BETWEEN :year_from AND :year_to) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"color\"')) IN ({self.RED_WINE_ID}, {self.WHITE_WINE_ID}, {self.ROSE_WINE_ID}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND wine.country IN (:country) "
                         "GROUP BY WINE_COLOR",
-                        ))
+                        ).bindparams(year_from=self.year_from, year_to=self.year_to, country=self.country))
 
             df = pd.DataFrame(res.fetchall(), columns=["", "WINE_COLOR"])
 
@@ -6,6 +6,9 @@ from generator.reports.top_wineries_report import TopWineriesReport
 
 
 class CountrySparklingPearlWinesTopWineriesByMedalCountReport(TopWineriesReport, CountryReport):
+    title = "4.5 <Country>: Sparkling & Pearl Wines: Top Wineries by Medal Count"
+    weight = 466
+
     @property
     def value_name(self) -> str:
         return "Medals"
@@ -16,11 +19,3 @@ class CountrySparklingPearlWinesTopWineriesByMedalCountReport(TopWineriesReport,
             countries_ids=self.country,
             wine_type=(WineType.SPARKLING, WineType.PEARL),
         )
-
-    @property
-    def title(self) -> str:
-        return "4.5 <Country>: Sparkling & Pearl Wines: Top Wineries by Medal Count"
-
-    @property
-    def weight(self) -> int:
-        return 466
@@ -8,13 +8,8 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryStillBlendsAwardCategoryDistributionByColourReport(CountryReport):
-    @property
-    def title(self):
-        return "4.5 <Country>: Still Blends: Award category distribution by Colour"
-
-    @property
-    def weight(self):
-        return 454
+    title = "4.5 <Country>: Still Blends: Award category distribution by Colour"
+    weight = 454
 
     def render(self):
         country_id = self.country
@@ -38,12 +33,12 @@ class CountryStillBlendsAwardCategoryDistributionByColourReport(CountryReport):
                     "INNER JOIN wine ON wine.id = wine_entity.wine "
                     "INNER JOIN award ON award.id = award_wine_entity.award_id "
                     "INNER JOIN event ON event.id = award.event_id "
-                    f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color]} AND {self.STILL_WINE_WHERE_CLAUSE} AND wine.country IN ({country_id}) AND EXISTS ( "
+                    f"WHERE (event.year BETWEEN :year_from AND :year_to) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color]} AND {self.STILL_WINE_WHERE_CLAUSE} AND wine.country IN (:country_id) AND EXISTS ( "
                     "SELECT * FROM wine_grapes "
                     "WHERE wine_grapes.wine_entity = wine_entity.id "
                     "GROUP BY wine_grapes.wine_entity "
                     f"HAVING {self.BLENDS_WINE_HAVING_CLAUSE}) "
-                    "GROUP BY award.value"),
+                    "GROUP BY award.value").bindparams(year_from=self.year_from, year_to=self.year_to, country_id=country_id),
                 )
 
             df = pd.DataFrame(res.fetchall(), columns=["MEDAL", "WINE_COUNT"]).set_index("MEDAL")
@@ -8,13 +8,8 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryStillBlendsSingleVarietyWinesRatioReport(CountryReport):
-    @property
-    def title(self):
-        return "4.5 <Country>: Still Blends / Single variety wines ratio"
-
-    @property
-    def weight(self):
-        return 430
+    title = "4.5 <Country>: Still Blends / Single variety wines ratio"
+    weight = 430
 
     def render(self):
         composition_having_case = {
@@ -41,14 +36,14 @@ class CountryStillBlendsSingleVarietyWinesRatioReport(CountryReport):
                              "INNER JOIN event ON event.id = award.event_id "
                              "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
                              "INNER JOIN wine_grapes ON wine_grapes.wine_entity = wine_entity.id "
-                             f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND EXISTS( "
+                             "WHERE (event.year BETWEEN :year_from AND :year_to) AND EXISTS( "
                              "SELECT * FROM wine "
-                             f"WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {self.STILL_WINE_WHERE_CLAUSE} AND wine.country IN ({self.country})) AND EXISTS( "
+                             f"WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {self.STILL_WINE_WHERE_CLAUSE} AND wine.country IN (:country)) AND EXISTS( "
                              "SELECT * FROM wine_grapes "
                              "WHERE wine_grapes.wine_entity = wine_entity.id "
                              "GROUP BY wine_grapes.wine_entity "
                              f"HAVING {composition_having_case[composition]})",
-                             ))
+                             ).bindparams(year_from=self.year_from, year_to=self.year_to, country=self.country))
                 df = pd.DataFrame(res.fetchall(), columns=[""], dtype=int, index=[composition])
                 df_by_composition = pd.concat([df_by_composition, df])
 
@@ -6,6 +6,9 @@ from generator.reports.top_wineries_report import TopWineriesReport
 
 
 class CountryStillRedBlendsTopWineriesByMedalCountReport(TopWineriesReport, CountryReport):
+    title = "4.5.1 <Country>: Still Red Blends Top Wineries by Medal Count"
+    weight = 457
+
     @property
     def value_name(self) -> str:
         return "Medals"
@@ -18,11 +21,3 @@ class CountryStillRedBlendsTopWineriesByMedalCountReport(TopWineriesReport, Coun
             wine_type=WineType.STILL,
             grape_variety=GrapeVariety.BLEND,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.5.1 <Country>: Still Red Blends Top Wineries by Medal Count"
-
-    @property
-    def weight(self) -> int:
-        return 457
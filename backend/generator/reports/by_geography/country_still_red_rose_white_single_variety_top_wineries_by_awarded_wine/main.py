@@ -5,13 +5,8 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryStillRedRoseWhiteSingleVarietyTopWineriesByAwardedWineReport(CountryReport):
-    @property
-    def title(self):
-        return "4.5 <Country>: Still Red / Rose / White Single Variety: Top Wineries by Awarded wines"
-
-    @property
-    def weight(self):
-        return 463
+    title = "4.5 <Country>: Still Red / Rose / White Single Variety: Top Wineries by Awarded wines"
+    weight = 463
 
     def render(self):
         colors_ids = {
@@ -29,7 +24,7 @@ class CountryStillRedRoseWhiteSingleVarietyTopWineriesByAwardedWineReport(Countr
                         "INNER JOIN wine ON wine.winery = winery.id "
                         "INNER JOIN wine_entity ON wine_entity.wine = wine.id "
                         "INNER JOIN wine_gwmr ON wine_gwmr.wine_entity_id = wine_entity.id "
-                        f"WHERE wine_gwmr.year_from = {self.year_from} AND wine_gwmr.year_to = {self.year_to} AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors_ids[color]} AND winery.country IN ({self.country}) AND {self.STILL_WINE_WHERE_CLAUSE} AND EXISTS( "
+                        f"WHERE wine_gwmr.year_from = :year_from AND wine_gwmr.year_to = :year_to AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors_ids[color]} AND winery.country IN (:country) AND {self.STILL_WINE_WHERE_CLAUSE} AND EXISTS( "
                         "SELECT * FROM wine_grapes "
                         "WHERE wine_grapes.wine_entity = wine_entity.id "
                         "GROUP BY wine_grapes.wine_entity "
@@ -37,7 +32,7 @@ class CountryStillRedRoseWhiteSingleVarietyTopWineriesByAwardedWineReport(Countr
                         "GROUP BY winery.id "
                         "ORDER BY AWARDED_WINES DESC "
                         "LIMIT 5",
-                    )
+                    ).bindparams(year_from=self.year_from, year_to=self.year_to, country=self.country)
                 )
             df = pd.DataFrame(res.fetchall(), columns=["WINERY_NAME", "AWARDED_WINES"])
             result = f"{result}<b>{color} Wines</b>{df.to_html()}<br>"
@@ -6,6 +6,9 @@ from generator.reports.top_wineries_report import TopWineriesReport
 
 
 class CountryStillRedSingleVarietyTopWineriesByMedalCountReport(TopWineriesReport, CountryReport):
+    title = "4.5.1 <Country>: Still Red Single Variety: Top Wineries by Medal Count"
+    weight = 462
+
     @property
     def value_name(self) -> str:
         return "Medals"
@@ -18,11 +21,3 @@ class CountryStillRedSingleVarietyTopWineriesByMedalCountReport(TopWineriesRepor
             wine_type=WineType.STILL,
             grape_variety=GrapeVariety.SINGLE,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.5.1 <Country>: Still Red Single Variety: Top Wineries by Medal Count"
-
-    @property
-    def weight(self) -> int:
-        return 462
@@ -6,6 +6,9 @@ from generator.reports.top_wineries_report import TopWineriesReport
 
 
 class CountryStillRoseBlendsTopWineriesByMedalCountReport(TopWineriesReport, CountryReport):
+    title = "4.5.3 <Country>: Still Rose Blends Top Wineries by Medal Count"
+    weight = 459
+
     @property
     def value_name(self) -> str:
         return "Medals"
@@ -18,11 +21,3 @@ class CountryStillRoseBlendsTopWineriesByMedalCountReport(TopWineriesReport, Cou
             wine_type=WineType.STILL,
             grape_variety=GrapeVariety.BLEND,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.5.3 <Country>: Still Rose Blends Top Wineries by Medal Count"
-
-    @property
-    def weight(self) -> int:
-        return 459
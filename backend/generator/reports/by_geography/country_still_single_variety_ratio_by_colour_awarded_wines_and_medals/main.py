@@ -8,13 +8,8 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryStillSingleVarietyRatioByColourAwardedWinesAndMedalsReport(CountryReport):
-    @property
-    def title(self):
-        return "4.5 <Country>: Still Single variety ratio by Colour: Awarded wines and Medals"
-
-    @property
-    def weight(self):
-        return 530
+    title = "4.5 <Country>: Still Single variety ratio by Colour: Awarded wines and Medals"
+    weight = 530
 
     def render(self):
         wine_ratio_category = {
@@ -36,13 +31,13 @@ class CountryStillSingleVarietyRatioByColourAwardedWinesAndMedalsReport(CountryR
                         "INNER JOIN event ON event.id = award.event_id "
                         "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
                         "INNER JOIN wine ON wine.id = wine_entity.wine "
-                        f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND wine.country IN ({self.country}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"color\"')) IN ({self.RED_WINE_ID}, {self.WHITE_WINE_ID}, {self.ROSE_WINE_ID}) AND {self.STILL_WINE_WHERE_CLAUSE} AND EXISTS( "
+                        f"WHERE (event.year BETWEEN :year_from AND :year_to) AND wine.country IN (:country) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"color\"')) IN ({self.RED_WINE_ID}, {self.WHITE_WINE_ID}, {self.ROSE_WINE_ID}) AND {self.STILL_WINE_WHERE_CLAUSE} AND EXISTS( "
                         "SELECT * FROM wine_grapes "
                         "WHERE wine_grapes.wine_entity = wine_entity.id "
                         "GROUP BY wine_grapes.grape "
                         f"HAVING {self.SINGLE_GRAPE_WINE_HAVING_CLAUSE}) "
                         "GROUP BY WINE_COLOR",
-                        ))
+                        ).bindparams(year_from=self.year_from, year_to=self.year_to, country=self.country))
 
             df = pd.DataFrame(res.fetchall(), columns=["", "WINE_COLOR"])
 
@@ -8,13 +8,8 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryStillSparklingPearlWinesRatioReport(CountryReport):
-    @property
-    def title(self):
-        return "4.5 <Country>: Still / Sparkling & Pearl wines ratio"
-
-    @property
-    def weight(self):
-        return 390
+    title = "4.5 <Country>: Still / Sparkling & Pearl wines ratio"
+    weight = 390
 
     def render(self):
         wine_ratio_category = {
@@ -36,9 +31,9 @@ class CountryStillSparklingPearlWinesRatioReport(CountryReport):
                         "INNER JOIN event ON event.id = award.event_id "
                         "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
                         "INNER JOIN wine ON wine.id = wine_entity.wine "
-                        f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"co2\"')) IN ({self.STILL_WINE_ID}, {', '.join(self.SPARKLING_PEARL_WINE_IDS)}) AND wine.country IN ({self.country}) "
+                        f"WHERE (event.year BETWEEN :year_from AND :year_to) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"co2\"')) IN ({self.STILL_WINE_ID}, {', '.join(self.SPARKLING_PEARL_WINE_IDS)}) AND wine.country IN (:country) "
                         "GROUP BY WINE_PRODUCT_TYPE",
-                        ))
+                        ).bindparams(year_from=self.year_from, year_to=self.year_to, country=self.country))
 
             df = pd.DataFrame(res.fetchall(), columns=["", "WINE_PRODUCT_TYPE"])
 
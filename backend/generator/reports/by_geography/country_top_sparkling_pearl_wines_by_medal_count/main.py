@@ -4,6 +4,9 @@ from generator.reports.top_wines_report import TopWinesReport
 
 
 class CountryTopSparklingPearlWinesByMedalCountReport(TopWinesReport, CountryReport):
+    title = "4.5 <Country>: Top Sparkling & Pearl Wines by Medal Count"
+    weight = 465
+
     def get_url(self) -> str:
         return self.build_top_wines_url(
             event_year=(self.year_from, self.year_to),
@@ -11,11 +14,3 @@ class CountryTopSparklingPearlWinesByMedalCountReport(TopWinesReport, CountryRep
             wine_type=(WineType.SPARKLING, WineType.PEARL),
             countries_ids=self.country,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.5 <Country>: Top Sparkling & Pearl Wines by Medal Count"
-
-    @property
-    def weight(self) -> int:
-        return 465
@@ -4,6 +4,9 @@ from generator.reports.top_wines_report import TopWinesReport
 
 
 class CountryTopStillRoseSingleVarietyByGwmrReport(TopWinesReport, CountryReport):
+    title = "4.5.3 <Country>: Top Still Rose Single Variety by GWMR"
+    weight = 460
+
     def get_url(self) -> str:
         return self.build_top_wines_url(
             event_year=(self.year_from, self.year_to),
@@ -13,11 +16,3 @@ class CountryTopStillRoseSingleVarietyByGwmrReport(TopWinesReport, CountryReport
             grape_variety=GrapeVariety.SINGLE,
             countries_ids=self.country,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.5.3 <Country>: Top Still Rose Single Variety by GWMR"
-
-    @property
-    def weight(self) -> int:
-        return 460
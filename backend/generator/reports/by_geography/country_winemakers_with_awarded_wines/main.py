@@ -5,13 +5,8 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryWinemakersWithAwardedWinesReport(CountryReport):
-    @property
-    def title(self):
-        return "4.5 <Country>: Winemakers with awarded wines"
-
-    @property
-    def weight(self):
-        return 340
+    title = "4.5 <Country>: Winemakers with awarded wines"
+    weight = 340
 
     def render(self):
         with self.database.connect() as connection:
@@ -23,10 +18,10 @@ class CountryWinemakersWithAwardedWinesReport(CountryReport):
                     "INNER JOIN wine ON wine.id = wine_entity.wine "
                     "INNER JOIN winery ON winery.id = wine.winery "
                     "INNER JOIN taxonomy_term ON taxonomy_term.tid = wine_entity.region "
-                    f"WHERE wine_gwmr.year_from = {self.year_from} AND wine_gwmr.year_to = {self.year_to} AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND wine.country IN ({self.country}) "
+                    "WHERE wine_gwmr.year_from = :year_from AND wine_gwmr.year_to = :year_to AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND wine.country IN (:country) "
                     "GROUP BY taxonomy_term.tid "
                     "ORDER BY VINEYARD_COUNT DESC",
-                )
+                ).bindparams(year_from=self.year_from, year_to=self.year_to, country=self.country)
             )
 
         df = pd.DataFrame(res.fetchall(), columns=["REGION_NAME", "VINEYARD_COUNT"])
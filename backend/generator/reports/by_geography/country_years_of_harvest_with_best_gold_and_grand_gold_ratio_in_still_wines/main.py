@@ -9,13 +9,8 @@ from generator.reports.country_report import CountryReport
 
 
 class CountryYearsOfHarvestWithBestGoldAndGrandGoldRatioInStillWinesReport(CountryReport):
-    @property
-    def title(self):
-        return "4.5 <Country>: Years of harvest with best Gold and Grand Gold ratio in Still wine"
-
-    @property
-    def weight(self):
-        return 520
+    title = "4.5 <Country>: Years of harvest with best Gold and Grand Gold ratio in Still wine"
+    weight = 520
 
     def render(self):
         colors = {
@@ -44,7 +39,7 @@ class CountryYearsOfHarvestWithBestGoldAndGrandGoldRatioInStillWinesReport(Count
                         "        from event e "
                         "        where "
                         "            e.id = a.event_id and "
-                        f"           (e.year between {self.year_from} and {self.year_to}) "
+                        "           (e.year between :year_from and :year_to) "
                         "    ) and "
                         "    exists( "
                         "        select * "
@@ -54,13 +49,13 @@ class CountryYearsOfHarvestWithBestGoldAndGrandGoldRatioInStillWinesReport(Count
                         "            json_unquote(json_extract(w.category, '$.\"beverageType\"')) in (1425) and "
                         f"           {self.STILL_WINE_WHERE_CLAUSE.replace('wine', 'w')} and "
                         f"           {colors[color][0].replace('wine', 'w')} and "
-                        f"           w.country = {self.country} "
+                        "           w.country = :country "
                         "    ) and "
                         "    we.vintage > 1900 "
                         "group by we.vintage "
                         "order by count(case when a.value in ('GRAND', 'GOLD') then 1 end) / count(a.value) desc "
                         "limit 8"
-                    ),
+                    ).bindparams(year_from=self.year_from, year_to=self.year_to, country=self.country),
                 )
             top_vintages = res.fetchall()
 
@@ -87,11 +82,11 @@ class CountryYearsOfHarvestWithBestGoldAndGrandGoldRatioInStillWinesReport(Count
                             "INNER JOIN award ON award.id = award_wine_entity.award_id "
                             "INNER JOIN event ON event.id = award.event_id "
                             "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
-                            f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND wine_entity.vintage IN ({vintage[0]}) AND EXISTS("
+                            "WHERE (event.year BETWEEN :year_from AND :year_to) AND wine_entity.vintage IN (:vintage) AND EXISTS("
                             "SELECT * FROM wine "
-                            f"WHERE wine.id = wine_entity.wine AND wine.country IN ({self.country}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color][0]} AND {self.STILL_WINE_WHERE_CLAUSE}) "
+                            f"WHERE wine.id = wine_entity.wine AND wine.country IN (:country) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color][0]} AND {self.STILL_WINE_WHERE_CLAUSE}) "
                             "GROUP BY award.value"
-                        ),
+                        ).bindparams(year_from=self.year_from, year_to=self.year_to, vintage=vintage[0], country=self.country),
                     )
 
                 df = pd.DataFrame(res.fetchall(), columns=["MEDAL_COUNT", "MEDAL_NAME"]).set_index("MEDAL_NAME")
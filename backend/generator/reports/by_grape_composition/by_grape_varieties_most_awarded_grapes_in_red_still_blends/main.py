@@ -5,13 +5,8 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByGrapeVarietiesMostAwardedGrapesInRedStillBlends(ContinentsTabReport):
-    @property
-    def title(self):
-        return "4.3.2 By Grape varieties: Most awarded grapes in Red Still Blends"
-
-    @property
-    def weight(self):
-        return 150
+    title = "4.3.2 By Grape varieties: Most awarded grapes in Red Still Blends"
+    weight = 150
 
     @property
     def use_tab_title(self) -> bool:
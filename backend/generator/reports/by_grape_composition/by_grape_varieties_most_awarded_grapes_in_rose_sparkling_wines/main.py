@@ -5,13 +5,8 @@ from generator.enum import WineType, WineColor
 
 
 class ByGrapeVarietiesMostAwardedGrapesInRoseSparklingWines(ContinentsTabReport):
-    @property
-    def title(self):
-        return "4.3.2 By Grape varieties: Most awarded grapes in Rose Sparkling wines"
-
-    @property
-    def weight(self):
-        return 175
+    title = "4.3.2 By Grape varieties: Most awarded grapes in Rose Sparkling wines"
+    weight = 175
 
     @property
     def use_tab_title(self) -> bool:
@@ -5,13 +5,8 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByGrapeVarietiesMostAwardedGrapesInRoseStillBlends(ContinentsTabReport):
-    @property
-    def title(self):
-        return "4.3.2 By Grape varieties: Most awarded grapes in Rose Still Blends"
-
-    @property
-    def weight(self):
-        return 156
+    title = "4.3.2 By Grape varieties: Most awarded grapes in Rose Still Blends"
+    weight = 156
 
     @property
     def use_tab_title(self) -> bool:
@@ -5,13 +5,8 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByGrapeVarietiesMostAwardedGrapesInRoseStillSingleVarietyWines(ContinentsTabReport):
-    @property
-    def title(self):
-        return "4.3.2 By Grape varieties: Most awarded grapes in Rose Still Single Variety wines"
-
-    @property
-    def weight(self):
-        return 166
+    title = "4.3.2 By Grape varieties: Most awarded grapes in Rose Still Single Variety wines"
+    weight = 166
 
     @property
     def use_tab_title(self) -> bool:
@@ -5,13 +5,8 @@ from generator.enum import WineType, WineColor
 
 
 class ByGrapeVarietiesMostAwardedGrapesInWhiteSparklingWines(ContinentsTabReport):
-    @property
-    def title(self):
-        return "4.3.2 By Grape varieties: Most awarded grapes in White Sparkling wines"
-
-    @property
-    def weight(self):
-        return 170
+    title = "4.3.2 By Grape varieties: Most awarded grapes in White Sparkling wines"
+    weight = 170
 
     @property
     def use_tab_title(self) -> bool:
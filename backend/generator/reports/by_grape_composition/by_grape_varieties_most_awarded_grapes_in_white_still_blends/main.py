@@ -5,13 +5,8 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByGrapeVarietiesMostAwardedGrapesInWhiteStillBlends(ContinentsTabReport):
-    @property
-    def title(self):
-        return "4.3.2 By Grape varieties: Most awarded grapes in White Still Blends"
-
-    @property
-    def weight(self):
-        return 153
+    title = "4.3.2 By Grape varieties: Most awarded grapes in White Still Blends"
+    weight = 153
 
     @property
     def use_tab_title(self) -> bool:
@@ -8,13 +8,8 @@ from generator.reports.report import Report
 
 
 class GrapesWithBestGoldAndGrandGoldRatioInRedRoseWhiteStillBlends(Report):
-    @property
-    def title(self):
-        return "4.3 Grapes with best Gold and Grand Gold ratio in Red / Rose / White Still Blend"
-
-    @property
-    def weight(self):
-        return 180
+    title = "4.3 Grapes with best Gold and Grand Gold ratio in Red / Rose / White Still Blend"
+    weight = 180
 
     def render(self):
         colors_ids = {
@@ -23,10 +18,8 @@ class GrapesWithBestGoldAndGrandGoldRatioInRedRoseWhiteStillBlends(Report):
             "Rose": [self.ROSE_WINE_WHERE_CLAUSE, self.ROSE_WINE_ID],
         }
 
-        result = ""
-
+        top_grapes = {}
         for color in colors_ids:
-            page_info = []
             with self.database.connect() as connection:
                 res = connection.execute(
                     text(
@@ -44,7 +37,7 @@ class GrapesWithBestGoldAndGrandGoldRatioInRedRoseWhiteStillBlends(Report):
                         "        from event e "
                         "        where "
                         "            e.id = a.event_id and "
-                        f"            (e.year between {self.year_from} and {self.year_to}) "
+                        "            (e.year between :year_from and :year_to) "
                         "    ) and "
                         "    exists( "
                         "        select * "
@@ -67,10 +60,25 @@ class GrapesWithBestGoldAndGrandGoldRatioInRedRoseWhiteStillBlends(Report):
                         "having count(a.id) >= 50 "
                         "order by count(case when a.value in ('GRAND', 'GOLD') then 1 end) / count(a.value) desc "
                         "limit 16"
-                    )
+                    ).bindparams(year_from=self.year_from, year_to=self.year_to)
                 )
+            top_grapes[color] = res.fetchall()
+
+        # Medals of all grapes of all colors are counted by one query.
+        with self.database.connect() as connection:
+            distributions = self.get_grape_medal_distributions(
+                connection,
+                {
+                    color: ([grape_id for _, grape_id in top_grapes[color]], f"{colors_ids[color][0]} AND {self.STILL_WINE_WHERE_CLAUSE}", None)
+                    for color in colors_ids
+                },
+                grape_having_clause=self.BLENDS_WINE_HAVING_CLAUSE,
+            )
 
-            for grape, grape_id in res.fetchall():
+        result = ""
+        for color in colors_ids:
+            page_info = []
+            for grape, grape_id in top_grapes[color]:
                 df_pre = pd.DataFrame(index=["GRAND", "GOLD", "SILVER", "BRONZE"])
 
                 diagram = {
@@ -78,23 +86,7 @@ class GrapesWithBestGoldAndGrandGoldRatioInRedRoseWhiteStillBlends(Report):
                     "link": f"https://{self.TOP_WINES_GWMR_DOMEN}/wines?mode=expert&grape[]={grape_id}&grapes_mix[]=blends&co2[]={self.STILL_WINE_ID}&color[]={colors_ids[color][1]}",
                 }
 
-                with self.database.connect() as connection:
-                    res = connection.execute(
-                        text("SELECT award.value AS MEDAL_NAME, COUNT(award.value) AS MEDAL_COUNT FROM award_wine_entity "
-                        "INNER JOIN award ON award.id = award_wine_entity.award_id "
-                        "INNER JOIN event ON event.id = award.event_id "
-                        "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
-                        f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND EXISTS( "
-                        "SELECT * FROM wine_grapes "
-                        f"WHERE wine_grapes.wine_entity = wine_entity.id AND wine_grapes.grape = {grape_id} "
-                        "GROUP BY wine_grapes.grape "
-                        f"HAVING {self.BLENDS_WINE_HAVING_CLAUSE}) AND EXISTS( "
-                        "SELECT * FROM wine "
-                        f"WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors_ids[color][0]} AND {self.STILL_WINE_WHERE_CLAUSE}) "
-                        "GROUP BY MEDAL_NAME"),
-                    )
-
-                df = pd.DataFrame(res.fetchall(), columns=["MEDAL_NAME", "MEDAL_COUNT"]).set_index("MEDAL_NAME")
+                df = pd.DataFrame(distributions.get((color, grape_id), []), columns=["MEDAL_NAME", "MEDAL_COUNT"]).set_index("MEDAL_NAME")
                 df = pd.concat([df_pre, df], axis=1)
 
                 df["MEDAL_COUNT"] = 0 if df["MEDAL_COUNT"].sum() == 0 else (df["MEDAL_COUNT"] / df["MEDAL_COUNT"].sum()) * 100
@@ -107,4 +99,3 @@ class GrapesWithBestGoldAndGrandGoldRatioInRedRoseWhiteStillBlends(Report):
             result = f"{result}<h1>{color}</h1>{self.render_template('bar_diagrams/for_one_category.html', page_info=page_info)}"
 
         return result
-
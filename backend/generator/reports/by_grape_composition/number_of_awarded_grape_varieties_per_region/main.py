@@ -1,3 +1,5 @@
+from typing import Any, List, Mapping
+
 from sqlalchemy import Select, func, select, distinct
 
 from generator.reports.continents_value_report import ContinentsValueReport
@@ -5,26 +7,27 @@ from gustos.models import wine_grapes, wine, award_wine_entity
 
 
 class NumberOfAwardedGrapeVarietiesPerRegion(ContinentsValueReport):
-    @property
-    def title(self) -> str:
-        return "4.3.2 Number of awarded grape varieties per region"
+    title = "4.3.2 Number of awarded grape varieties per region"
+    weight = 140
 
     def get_query(self) -> Select:
         we_subquery = self.build_query_for_wine_entity(
             event_year=(self.year_from, self.year_to),
         ).alias("we_subquery")
 
-        return select(
+        query = select(
                 func.count(distinct(wine_grapes.c.grape)).label(self.value_column_name),
-                self.build_continent_case(wine.c.country).label(self.continent_column_name),
+                self.build_continent(wine.c.country).label(self.continent_column_name),
             ).select_from(award_wine_entity) \
                 .join(we_subquery, we_subquery.c.id == award_wine_entity.c.wine_entity_id) \
                 .join(wine, wine.c.id == we_subquery.c.wine) \
                 .join(wine_grapes, wine_grapes.c.wine_entity == we_subquery.c.id) \
             .group_by(self.continent_column_name)
 
+        return self.join_continent(query, wine.c.country)
 
-
-    @property
-    def weight(self) -> int:
-        return 140
\ No newline at end of file
+    def aggregate_award_facts(self) -> List[Mapping[str, Any]] | None:
+        frame = self.get_award_fact_frame()
+        if frame is None:
+            return None
+        return frame.count_grape_varieties_by_continent(self.value_column_name, self.continent_column_name)
@@ -8,13 +8,8 @@ from generator.reports.report import Report
 
 
 class StillBlendsAwardCategoryDistributionForRedRoseWhite(Report):
-    @property
-    def title(self):
-        return "4.3 Still Blends Award category distribution for Red / Rose / White"
-
-    @property
-    def weight(self):
-        return 50
+    title = "4.3 Still Blends Award category distribution for Red / Rose / White"
+    weight = 50
 
     def render(self):
         colors = {
@@ -36,12 +31,12 @@ class StillBlendsAwardCategoryDistributionForRedRoseWhite(Report):
                     "INNER JOIN wine ON wine.id = wine_entity.wine "
                     "INNER JOIN award ON award.id = award_wine_entity.award_id "
                     "INNER JOIN event ON event.id = award.event_id "
-                    f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color]} AND {self.STILL_WINE_WHERE_CLAUSE} AND EXISTS ( "
+                    f"WHERE (event.year BETWEEN :year_from AND :year_to) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors[color]} AND {self.STILL_WINE_WHERE_CLAUSE} AND EXISTS ( "
                     "SELECT * FROM wine_grapes "
                     "WHERE wine_grapes.wine_entity = wine_entity.id "
                     "GROUP BY wine_grapes.wine_entity "
                     f"HAVING {self.BLENDS_WINE_HAVING_CLAUSE}) "
-                    "GROUP BY award.value")
+                    "GROUP BY award.value").bindparams(year_from=self.year_from, year_to=self.year_to)
                 )
 
             df = pd.DataFrame(res.fetchall(), columns=["MEDAL", "WINE_COUNT"]).set_index("MEDAL")
@@ -54,4 +49,3 @@ class StillBlendsAwardCategoryDistributionForRedRoseWhite(Report):
             page_info.append(result)
 
         return self.render_template("bar_diagrams/simple.html", page_info=page_info)
-
@@ -8,13 +8,8 @@ from generator.reports.report import Report
 
 
 class StillBlendsRedRoseWhiteWinesRatioAwardedWinesAndMedals(Report):
-    @property
-    def title(self):
-        return "4.3 Still Blends: Red / Rose / White wines ratio: Awarded wines and Medals"
-
-    @property
-    def weight(self):
-        return 40
+    title = "4.3 Still Blends: Red / Rose / White wines ratio: Awarded wines and Medals"
+    weight = 40
 
     def render(self):
         wine_ratio_category = {
@@ -36,13 +31,13 @@ class StillBlendsRedRoseWhiteWinesRatioAwardedWinesAndMedals(Report):
                         "INNER JOIN wine ON wine.id = wine_entity.wine "
                         "INNER JOIN award ON award.id = award_wine_entity.award_id "
                         "INNER JOIN event ON event.id = award.event_id "
-                        f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"color\"')) IN ({self.RED_WINE_ID}, {self.WHITE_WINE_ID}, {self.ROSE_WINE_ID}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {self.STILL_WINE_WHERE_CLAUSE} AND EXISTS ( "
+                        f"WHERE (event.year BETWEEN :year_from AND :year_to) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"color\"')) IN ({self.RED_WINE_ID}, {self.WHITE_WINE_ID}, {self.ROSE_WINE_ID}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {self.STILL_WINE_WHERE_CLAUSE} AND EXISTS ( "
                         "SELECT * FROM wine_grapes "
                         "WHERE wine_grapes.wine_entity = wine_entity.id "
                         "GROUP BY wine_grapes.wine_entity "
                         f"HAVING {self.BLENDS_WINE_HAVING_CLAUSE}) "
                         "GROUP BY WINE_COLOR"
-                        ))
+                        ).bindparams(year_from=self.year_from, year_to=self.year_to))
 
             df = pd.DataFrame(res.fetchall(), columns=["", "WINE_COLOR"])
 
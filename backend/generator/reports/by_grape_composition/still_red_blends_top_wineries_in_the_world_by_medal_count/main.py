@@ -5,6 +5,8 @@ from generator.reports.top_wineries_report import TopWineriesReport
 
 
 class StillRedBlendsTopWineriesInTheWorldByMedalCount(TopWineriesReport):
+    title = "4.3.1 Still Red Blends: Top Wineries in the World by Medal Count"
+    weight = 80
 
     @property
     def value_name(self) -> str:
@@ -17,12 +19,3 @@ class StillRedBlendsTopWineriesInTheWorldByMedalCount(TopWineriesReport):
             wine_type=WineType.STILL,
             grape_variety=GrapeVariety.BLEND,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.3.1 Still Red Blends: Top Wineries in the World by Medal Count"
-
-
-    @property
-    def weight(self) -> int:
-        return 80
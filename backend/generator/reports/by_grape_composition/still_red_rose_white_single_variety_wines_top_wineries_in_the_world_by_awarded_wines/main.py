@@ -5,13 +5,8 @@ from generator.reports.report import Report
 
 
 class StillRedRoseWhiteSingleVarietyWinesTopWineriesInTheWorldByAwardedWines(Report):
-    @property
-    def title(self):
-        return "4.3 Still Red / Rose / White Single variety wines: Top Wineries in the World by Awarded wines"
-
-    @property
-    def weight(self):
-        return 130
+    title = "4.3 Still Red / Rose / White Single variety wines: Top Wineries in the World by Awarded wines"
+    weight = 130
 
     def render(self):
         colors_ids = {
@@ -30,7 +25,7 @@ class StillRedRoseWhiteSingleVarietyWinesTopWineriesInTheWorldByAwardedWines(Rep
                         "INNER JOIN wine ON wine.winery = winery.id "
                         "INNER JOIN wine_entity ON wine_entity.wine = wine.id "
                         "INNER JOIN wine_gwmr ON wine_gwmr.wine_entity_id = wine_entity.id "
-                        f"WHERE wine_gwmr.year_from = {self.year_from} AND wine_gwmr.year_to = {self.year_to} AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors_ids[color]} AND {self.STILL_WINE_WHERE_CLAUSE} AND EXISTS ( "
+                        f"WHERE wine_gwmr.year_from = :year_from AND wine_gwmr.year_to = :year_to AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors_ids[color]} AND {self.STILL_WINE_WHERE_CLAUSE} AND EXISTS ( "
                         "SELECT * FROM wine_grapes "
                         "WHERE wine_grapes.wine_entity = wine_entity.id "
                         "GROUP BY wine_grapes.wine_entity "
@@ -38,7 +33,7 @@ class StillRedRoseWhiteSingleVarietyWinesTopWineriesInTheWorldByAwardedWines(Rep
                         "GROUP BY winery.id "
                         "ORDER BY AWARDED_WINES DESC "
                         "LIMIT 5",
-                    )
+                    ).bindparams(year_from=self.year_from, year_to=self.year_to)
                 )
             df = pd.DataFrame(res.fetchall(), columns=["WINERY_NAME", "COUNTRY", "AWARDED_WINES"])
             result = f"{result}<b>{color} Wines</b>{df.to_html()}<br>"
@@ -3,6 +3,9 @@ from generator.reports.top_wines_report import TopWinesReport
 
 
 class StillRedSingleVarietyWinesTopWinesInTheWorldByGWMR(TopWinesReport):
+    title = "4.3.1 Still Red Single variety wines: Top wines in the world by GWMR"
+    weight = 100
+
     def get_url(self) -> str:
         return self.build_top_wines_url(
             event_year=(self.year_from, self.year_to),
@@ -11,12 +14,3 @@ class StillRedSingleVarietyWinesTopWinesInTheWorldByGWMR(TopWinesReport):
             wine_color=WineColor.RED,
             grape_variety=GrapeVariety.SINGLE,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.3.1 Still Red Single variety wines: Top wines in the world by GWMR"
-
-
-    @property
-    def weight(self) -> int:
-        return 100
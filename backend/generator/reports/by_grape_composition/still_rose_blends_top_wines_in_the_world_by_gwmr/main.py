@@ -3,6 +3,9 @@ from generator.reports.top_wines_report import TopWinesReport
 
 
 class StillRoseBlendsTopWinesInTheWorldByGWMR(TopWinesReport):
+    title = "4.3.3 Still Rose Blends: Top wines in the world by GWMR"
+    weight = 66
+
     def get_url(self) -> str:
         return self.build_top_wines_url(
             event_year=(self.year_from, self.year_to),
@@ -11,12 +14,3 @@ class StillRoseBlendsTopWinesInTheWorldByGWMR(TopWinesReport):
             wine_color=WineColor.ROSE,
             grape_variety=GrapeVariety.BLEND,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.3.3 Still Rose Blends: Top wines in the world by GWMR"
-
-
-    @property
-    def weight(self) -> int:
-        return 66
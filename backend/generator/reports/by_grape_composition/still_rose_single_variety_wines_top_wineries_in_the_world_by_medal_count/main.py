@@ -5,6 +5,8 @@ from generator.reports.top_wineries_report import TopWineriesReport
 
 
 class StillRoseSingleVarietyWinesTopWineriesInTheWorldByMedalCount(TopWineriesReport):
+    title = "4.3.1 Still Rose Single variety wines: Top Wineries in the World by Medal Count"
+    weight = 126
 
     @property
     def value_name(self) -> str:
@@ -17,12 +19,3 @@ class StillRoseSingleVarietyWinesTopWineriesInTheWorldByMedalCount(TopWineriesRe
             wine_type=WineType.STILL,
             grape_variety=GrapeVariety.SINGLE,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.3.1 Still Rose Single variety wines: Top Wineries in the World by Medal Count"
-
-
-    @property
-    def weight(self) -> int:
-        return 126
@@ -3,6 +3,9 @@ from generator.reports.top_wines_report import TopWinesReport
 
 
 class StillWhiteSingleVarietyWinesTopWinesInTheWorldByMedalCount(TopWinesReport):
+    title = "4.3.1 Still White Single variety wines: Top wines in the world by Medal Count"
+    weight = 113
+
     def get_url(self) -> str:
         return self.build_top_wines_url(
             event_year=(self.year_from, self.year_to),
@@ -11,12 +14,3 @@ class StillWhiteSingleVarietyWinesTopWinesInTheWorldByMedalCount(TopWinesReport)
             wine_color=WineColor.WHITE,
             grape_variety=GrapeVariety.SINGLE,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.3.1 Still White Single variety wines: Top wines in the world by Medal Count"
-
-
-    @property
-    def weight(self) -> int:
-        return 113
@@ -1,18 +1,13 @@
 import pandas as pd
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from generator.enum import Continent
 from generator.reports.report import Report
 
 
 class StillWineBlendsGlobalParticipantsMedalsAndAwardedWines(Report):
-    @property
-    def title(self):
-        return "4.3 Still wine Blends: Global participants, Medals and Awarded wines"
-
-    @property
-    def weight(self):
-        return 30
+    title = "4.3 Still wine Blends: Global participants, Medals and Awarded wines"
+    weight = 30
 
     def render(self):
         data = {}
@@ -26,14 +21,14 @@ class StillWineBlendsGlobalParticipantsMedalsAndAwardedWines(Report):
                         "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
                         "INNER JOIN wine ON wine.id = wine_entity.wine "
                         "INNER JOIN wine_grapes ON wine_grapes.wine_entity = wine_entity.id "
-                        f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND EXISTS ( "
+                        "WHERE (event.year BETWEEN :year_from AND :year_to) AND EXISTS ( "
                         "SELECT * FROM winery "
-                        f"WHERE winery.id = wine.winery AND winery.country IN ({', '.join([str(continent) for continent in self.CONTINENTS[continent]])})) AND {self.STILL_WINE_WHERE_CLAUSE} AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) in (1425) AND EXISTS( "
+                        f"WHERE winery.id = wine.winery AND winery.country IN :continent_countries) AND {self.STILL_WINE_WHERE_CLAUSE} AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) in (1425) AND EXISTS( "
                         "SELECT * FROM wine_grapes "
                         "WHERE wine_grapes.wine_entity = wine_entity.id "
                         "GROUP BY wine_grapes.wine_entity "
                         f"HAVING {self.BLENDS_WINE_HAVING_CLAUSE})",
-                        ))
+                        ).bindparams(bindparam("continent_countries", self.CONTINENTS[continent], expanding=True), year_from=self.year_from, year_to=self.year_to))
             data[continent] = res.fetchall()[0]
         df = pd.DataFrame(data, index=["MANUFACTURES", "MEDAL WINES", "MEDALS"]).transpose()
         africa_tab_name = None
@@ -8,13 +8,8 @@ from generator.reports.report import Report
 
 
 class StillWinesBlendSingleVarietyWinesRatio(Report):
-    @property
-    def title(self):
-        return "4.3 Still wines Blend / Single variety wines ratio"
-
-    @property
-    def weight(self):
-        return 10
+    title = "4.3 Still wines Blend / Single variety wines ratio"
+    weight = 10
 
     def render(self):
         composition_having_case = {
@@ -42,14 +37,14 @@ class StillWinesBlendSingleVarietyWinesRatio(Report):
                     "INNER JOIN event ON event.id = award.event_id "
                     "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
                     "INNER JOIN wine_grapes ON wine_grapes.wine_entity = wine_entity.id "
-                    f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND EXISTS( "
+                    "WHERE (event.year BETWEEN :year_from AND :year_to) AND EXISTS( "
                     "SELECT * FROM wine "
                     f"WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {self.STILL_WINE_WHERE_CLAUSE}) AND EXISTS( "
                     "SELECT * FROM wine_grapes "
                     "WHERE wine_grapes.wine_entity = wine_entity.id "
                     "GROUP BY wine_grapes.wine_entity "
                     f"HAVING {composition_having_case[composition]})"
-                ))
+                ).bindparams(year_from=self.year_from, year_to=self.year_to))
                 df = pd.DataFrame(res.fetchall(), columns=[""], dtype=int, index=[composition])
                 df_by_composition = pd.concat([df_by_composition, df])
 
@@ -60,4 +55,3 @@ class StillWinesBlendSingleVarietyWinesRatio(Report):
             page_info.append(result)
 
         return self.render_template("wines_pie_ratio.html", page_info=page_info)
-
@@ -3,18 +3,13 @@ from generator.reports.by_number_winery_report.by_number_winery_report import \
 
 
 class ByAwardNumberWineryReport(ByNumberWineryReport):
-    @property
-    def title(self):
-        return "8.1 Your Winery Position by Total number of medals"
+    title = "8.1 Your Winery Position by Total number of medals"
+    weight = 10
 
     @property
     def parameter_title(self):
         return "Total Number of Medals"
 
-    @property
-    def weight(self):
-        return 10
-
     def format_entity_value(self, value):
         return value
 
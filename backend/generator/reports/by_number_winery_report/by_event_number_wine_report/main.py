@@ -10,18 +10,13 @@ from gustos.models import (
 
 
 class ByEventNumberWineryReport(ByNumberWineryReport):
-    @property
-    def title(self):
-        return "8.1 Your Winery Position by number of different Competition Events"
+    title = "8.1 Your Winery Position by number of different Competition Events"
+    weight = 50
 
     @property
     def parameter_title(self):
         return "Different Competitions"
 
-    @property
-    def weight(self):
-        return 50
-
     def format_entity_value(self, value):
         return value
 
@@ -34,19 +29,20 @@ class ByEventNumberWineryReport(ByNumberWineryReport):
         e = event.alias("e")
 
         criteria = func.count(a.c.event_id.distinct())
+        continent = self.build_continent(v.c.country)
 
         # Works slowly due to count distinct.
-        return select(
+        query = select(
             # 0  world_rank_index
             func.rank().over(order_by=criteria.desc()).label('world_rank'),
             # 1  world_percent_rank_index
             func.percent_rank().over(order_by=criteria.desc()).label('world_percent_rank'),
             # 2  continent_rank_index
-            func.rank().over(order_by=criteria.desc(), partition_by=self.build_continent_case(v.c.country)).label('continent_rank'),
+            func.rank().over(order_by=criteria.desc(), partition_by=continent).label('continent_rank'),
             # 3  continent_percent_rank_index
-            func.percent_rank().over(order_by=criteria.desc(), partition_by=self.build_continent_case(v.c.country)).label('continent_percent_rank'),
+            func.percent_rank().over(order_by=criteria.desc(), partition_by=continent).label('continent_percent_rank'),
             # 4  continent_id_index
-            self.build_continent_case(v.c.country).label('continent_id'),
+            continent.label('continent_id'),
             # 5  country_rank_index
             func.rank().over(order_by=criteria.desc(), partition_by=v.c.country).label('country_rank'),
             # 6  country_percent_rank_index
@@ -59,6 +55,8 @@ class ByEventNumberWineryReport(ByNumberWineryReport):
             criteria.label('entity_value'),
             # 10 entity_id_index
             v.c.id.label('entity_id'),
+            # 11 position in the ranking
+            func.row_number().over(order_by=criteria.desc()).label('position'),
         ).select_from(v) \
             .join(w, w.c.winery == v.c.id) \
             .join(we, we.c.wine == w.c.id) \
@@ -66,5 +64,7 @@ class ByEventNumberWineryReport(ByNumberWineryReport):
             .join(a, a.c.id == awe.c.award_id) \
             .join(e, e.c.id == a.c.event_id) \
             .where(e.c.year.between(self.year_from, self.year_to)) \
-            .group_by(v.c.id) \
+            .group_by(v.c.id, v.c.name, v.c.country, continent) \
             .order_by(criteria.desc())
+
+        return self.join_continent(query, v.c.country)
@@ -4,18 +4,13 @@ from generator.enum import AwardValue
 
 
 class ByGEGoldAwardNumberWineryReport(ByNumberWineryReport):
-    @property
-    def title(self):
-        return "8.1 Your Winery Position by number of Gold and Grand Gold medals"
+    title = "8.1 Your Winery Position by number of Gold and Grand Gold medals"
+    weight = 20
 
     @property
     def parameter_title(self):
         return "Gold and Grand Medals"
 
-    @property
-    def weight(self):
-        return 20
-
     def format_entity_value(self, value):
         return value
 
@@ -11,18 +11,13 @@ from gustos.models import (
 
 
 class ByGrapeNumberWineryReport(ByNumberWineryReport):
-    @property
-    def title(self):
-        return "8.1 Your Winery Position by Total number of grape varieties in awarded wines"
+    title = "8.1 Your Winery Position by Total number of grape varieties in awarded wines"
+    weight = 60
 
     @property
     def parameter_title(self):
         return "Total grape varieties"
 
-    @property
-    def weight(self):
-        return 60
-
     def format_entity_value(self, value):
         return value
 
@@ -36,6 +31,7 @@ class ByGrapeNumberWineryReport(ByNumberWineryReport):
         e2 = event.alias("e")
 
         criteria = func.count(distinct(wg.c.grape))
+        continent = self.build_continent(v.c.country)
 
         subquery = select(awe2) \
             .select_from(awe2) \
@@ -49,21 +45,22 @@ class ByGrapeNumberWineryReport(ByNumberWineryReport):
         query = select(
             func.rank().over(order_by=criteria.desc()).label('world_rank'),  # 0  world_rank_index
             func.percent_rank().over(order_by=criteria.desc()).label('world_percent_rank'),  # 1  world_percent_rank_index
-            func.rank().over(order_by=criteria.desc(), partition_by=self.build_continent_case(v.c.country)).label('continent_rank'),  # 2  continent_rank_index
-            func.percent_rank().over(order_by=criteria.desc(), partition_by=self.build_continent_case(v.c.country)).label('continent_percent_rank'),  # 3  continent_percent_rank_index
-            self.build_continent_case(v.c.country).label('continent_id'),  # 4  continent_id_index
+            func.rank().over(order_by=criteria.desc(), partition_by=continent).label('continent_rank'),  # 2  continent_rank_index
+            func.percent_rank().over(order_by=criteria.desc(), partition_by=continent).label('continent_percent_rank'),  # 3  continent_percent_rank_index
+            continent.label('continent_id'),  # 4  continent_id_index
             func.rank().over(order_by=criteria.desc(), partition_by=v.c.country).label('country_rank'),  # 5  country_rank_index
             func.percent_rank().over(order_by=criteria.desc(), partition_by=v.c.country).label('country_percent_rank'),  # 6  country_percent_rank_index
             v.c.country.label('country_id'),  # 7  country_id_index
             v.c.name.label('entity_name'),  # 8  entity_name_index
             criteria.label('entity_value'),  # 9  entity_value_index
             v.c.id.label('entity_id'),  # 10 entity_id_index
+            func.row_number().over(order_by=criteria.desc()).label('position'),  # 11 position in the ranking
         ).select_from(v) \
             .join(w, w.c.winery == v.c.id) \
             .join(we, we.c.wine == w.c.id) \
             .join(wg, wg.c.wine_entity == we.c.id) \
             .where(subquery.exists()) \
-            .group_by(v.c.id) \
+            .group_by(v.c.id, v.c.name, v.c.country, continent) \
             .order_by(criteria.desc())
 
-        return query
+        return self.join_continent(query, v.c.country)
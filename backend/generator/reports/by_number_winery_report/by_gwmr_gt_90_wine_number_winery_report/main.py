@@ -3,18 +3,13 @@ from generator.reports.by_number_winery_report.by_number_winery_report import \
 
 
 class ByGwmrGT90WineNumberWineryReport(ByNumberWineryReport):
-    @property
-    def title(self):
-        return "8.1 Your Winery Position by number of wines with GWMR above 90 points"
+    title = "8.1 Your Winery Position by number of wines with GWMR above 90 points"
+    weight = 40
 
     @property
     def parameter_title(self):
         return "Wines with GWMR above 90 points"
 
-    @property
-    def weight(self):
-        return 40
-
     def format_entity_value(self, value):
         return value
 
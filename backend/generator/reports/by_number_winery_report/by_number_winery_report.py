@@ -22,15 +22,14 @@ class ByNumberWineryReport(TableWineryReport, ABC):
     def get_template_kwargs(self):
         return { }
 
+    def get_rating_indices(self):
+        return self.__get_query_count_wine_entities_of_winery_indices(self.continent_id, self.country_id, self.winery_id)
+
     def render(self, throw_exception=False):
         self.fill_continent_and_country()
 
         with self.database.connect() as connection:
-            result = connection.execute(self.get_query())
-            self.get_ratings_by_query_result(
-                result,
-                *self.__get_query_count_wine_entities_of_winery_indices(self.continent_id, self.country_id, self.winery_id),
-            )
+            self.fill_ratings(connection)
 
         world_percent_rank = format_percent_rank(self.world_percent_rank)
         name_svg_world_rating = self.build_pie_chart_base64(
@@ -87,6 +86,7 @@ class ByNumberWineryReport(TableWineryReport, ABC):
             we=we2,
             w=w2,
         ).alias('we1')
+        continent = self.build_continent(v.c.country)
 
         query = select(
             # 0  world_rank_index
@@ -94,11 +94,11 @@ class ByNumberWineryReport(TableWineryReport, ABC):
             # 1  world_percent_rank_index
             func.percent_rank().over(order_by=func.count(we1.c.id).desc()).label('world_percent_rank'),
             # 2  continent_rank_index
-            func.rank().over(order_by=func.count(we1.c.id).desc(), partition_by=self.build_continent_case(v.c.country)).label('continent_rank'),
+            func.rank().over(order_by=func.count(we1.c.id).desc(), partition_by=continent).label('continent_rank'),
             # 3  continent_percent_rank_index
-            func.percent_rank().over(order_by=func.count(we1.c.id).desc(), partition_by=self.build_continent_case(v.c.country)).label('continent_percent_rank'),
+            func.percent_rank().over(order_by=func.count(we1.c.id).desc(), partition_by=continent).label('continent_percent_rank'),
             # 4  continent_id_index
-            self.build_continent_case(v.c.country).label('continent_id'),
+            continent.label('continent_id'),
             # 5  country_rank_index
             func.rank().over(order_by=func.count(we1.c.id).desc(), partition_by=v.c.country).label('country_rank'),
             # 6  country_percent_rank_index
@@ -111,9 +111,14 @@ class ByNumberWineryReport(TableWineryReport, ABC):
             func.count(we1.c.id).label('entity_value'),
             # 10 entity_id_index
             v.c.id.label('entity_id'),
+            # 11 position in the ranking
+            func.row_number().over(order_by=(func.count(we1.c.id).desc(), v.c.name, v.c.id)).label('position'),
         ).select_from(v) \
-            .join(we1, we1.c.winery == v.c.id) \
-            .group_by(v.c.id) \
+            .join(we1, we1.c.winery == v.c.id)
+
+        # DuckDB does not allow ungrouped columns which MySQL derives from the primary key.
+        query = self.join_continent(query, v.c.country) \
+            .group_by(v.c.id, v.c.name, v.c.country, continent) \
             .order_by(
             func.count(we1.c.id).desc(),
             v.c.name,
@@ -135,6 +140,7 @@ class ByNumberWineryReport(TableWineryReport, ABC):
         we = wine_entity.alias("we")
         w = wine.alias("w")
         awe = award_wine_entity.alias("awe")
+        continent = self.build_continent(v.c.country)
 
         query = select(
             # 0  world_rank_index
@@ -142,11 +148,11 @@ class ByNumberWineryReport(TableWineryReport, ABC):
             # 1  world_percent_rank_index
             func.percent_rank().over(order_by=func.count(awe.c.award_id).desc()).label('world_percent_rank'),
             # 2  continent_rank_index
-            func.rank().over(order_by=func.count(awe.c.award_id).desc(), partition_by=self.build_continent_case(v.c.country)).label('continent_rank'),
+            func.rank().over(order_by=func.count(awe.c.award_id).desc(), partition_by=continent).label('continent_rank'),
             # 3  continent_percent_rank_index
-            func.percent_rank().over(order_by=func.count(awe.c.award_id).desc(), partition_by=self.build_continent_case(v.c.country)).label('continent_percent_rank'),
+            func.percent_rank().over(order_by=func.count(awe.c.award_id).desc(), partition_by=continent).label('continent_percent_rank'),
             # 4  continent_id_index
-            self.build_continent_case(v.c.country).label('continent_id'),
+            continent.label('continent_id'),
             # 5  country_rank_index
             func.rank().over(order_by=func.count(awe.c.award_id).desc(), partition_by=v.c.country).label('country_rank'),
             # 6  country_percent_rank_index
@@ -159,11 +165,15 @@ class ByNumberWineryReport(TableWineryReport, ABC):
             func.count(awe.c.award_id).label('entity_value'),
             # 10 entity_id_index
             v.c.id.label('entity_id'),
+            # 11 position in the ranking
+            func.row_number().over(order_by=func.count(awe.c.award_id).desc()).label('position'),
         ).select_from(v) \
             .join(w, w.c.winery == v.c.id) \
             .join(we, we.c.wine == w.c.id) \
-            .join(awe, awe.c.wine_entity_id == we.c.id) \
-            .group_by(v.c.id) \
+            .join(awe, awe.c.wine_entity_id == we.c.id)
+
+        query = self.join_continent(query, v.c.country) \
+            .group_by(v.c.id, v.c.name, v.c.country, continent) \
             .order_by(func.count(awe.c.award_id).desc())
 
         if event_year is not None:
@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByRedStillBlendNumberWineryReport(ByNumberWineryReport):
-    @property
-    def title(self):
-        return "8.1 Your Winery Position by number of awarded Red Still Blends"
+    title = "8.1 Your Winery Position by number of awarded Red Still Blends"
+    weight = 80
 
     @property
     def parameter_title(self):
         return "Awarded Red Still Blends"
 
-    @property
-    def weight(self):
-        return 80
-
     def format_entity_value(self, value):
         return value
 
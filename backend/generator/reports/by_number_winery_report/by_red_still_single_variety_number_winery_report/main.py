@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByRedStillSingleVarietyNumberWineryReport(ByNumberWineryReport):
-    @property
-    def title(self):
-        return "8.1 Your Winery Position by number of awarded Red Still Single Variety"
+    title = "8.1 Your Winery Position by number of awarded Red Still Single Variety"
+    weight = 90
 
     @property
     def parameter_title(self):
         return "Awarded Red Still Single Variety"
 
-    @property
-    def weight(self):
-        return 90
-
     def format_entity_value(self, value):
         return value
 
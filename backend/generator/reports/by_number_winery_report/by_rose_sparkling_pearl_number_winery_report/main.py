@@ -4,18 +4,13 @@ from generator.enum import WineType
 
 
 class ByRoseSparklingPearlNumberWineryReport(ByNumberWineryReport):
-    @property
-    def title(self):
-        return "8.1 Your Winery Position by number of awarded Rose Sparkling & Pearl"
+    title = "8.1 Your Winery Position by number of awarded Rose Sparkling & Pearl"
+    weight = 150
 
     @property
     def parameter_title(self):
         return "Awarded Rose Sparkling & Pearl"
 
-    @property
-    def weight(self):
-        return 150
-
     def format_entity_value(self, value):
         return value
 
@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByRoseStillBlendsNumberWineryReport(ByNumberWineryReport):
-    @property
-    def title(self):
-        return "8.1 Your Winery Position by number of awarded Rose Still Blends"
+    title = "8.1 Your Winery Position by number of awarded Rose Still Blends"
+    weight = 120
 
     @property
     def parameter_title(self):
         return "Awarded Rose Still Blends"
 
-    @property
-    def weight(self):
-        return 120
-
     def format_entity_value(self, value):
         return value
 
@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByRoseStillSingleVarietyNumberWineryReport(ByNumberWineryReport):
-    @property
-    def title(self):
-        return "8.1 Your Winery Position by number of awarded Rose Still Single Variety"
+    title = "8.1 Your Winery Position by number of awarded Rose Still Single Variety"
+    weight = 130
 
     @property
     def parameter_title(self):
         return "Awarded Rose Still Single Variety"
 
-    @property
-    def weight(self):
-        return 130
-
     def format_entity_value(self, value):
         return value
 
@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor
 
 
 class ByWhiteSparklingPearlNumberWineryReport(ByNumberWineryReport):
-    @property
-    def title(self):
-        return "8.1 Your Winery Position by number of awarded White Sparkling & Pearl"
+    title = "8.1 Your Winery Position by number of awarded White Sparkling & Pearl"
+    weight = 140
 
     @property
     def parameter_title(self):
         return "Awarded White Sparkling & Pearl"
 
-    @property
-    def weight(self):
-        return 140
-
     def format_entity_value(self, value):
         return value
 
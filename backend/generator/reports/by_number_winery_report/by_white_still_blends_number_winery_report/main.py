@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByWhiteStillBlendsNumberWineryReport(ByNumberWineryReport):
-    @property
-    def title(self):
-        return "8.1 Your Winery Position by number of awarded White Still Blends"
+    title = "8.1 Your Winery Position by number of awarded White Still Blends"
+    weight = 100
 
     @property
     def parameter_title(self):
         return "Awarded White Still Blends"
 
-    @property
-    def weight(self):
-        return 100
-
     def format_entity_value(self, value):
         return value
 
@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByWhiteStillSingleVarietyNumberWineryReport(ByNumberWineryReport):
-    @property
-    def title(self):
-        return "8.1 Your Winery Position by number of awarded White Still Single Variety"
+    title = "8.1 Your Winery Position by number of awarded White Still Single Variety"
+    weight = 110
 
     @property
     def parameter_title(self):
         return "Awarded White Still Single Variety"
 
-    @property
-    def weight(self):
-        return 110
-
     def format_entity_value(self, value):
         return value
 
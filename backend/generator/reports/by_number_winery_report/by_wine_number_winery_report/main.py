@@ -3,18 +3,13 @@ from generator.reports.by_number_winery_report.by_number_winery_report import \
 
 
 class ByWineNumberWineryReport(ByNumberWineryReport):
-    @property
-    def title(self):
-        return "8.1 Your Winery Position by number of Total awarded wines"
+    title = "8.1 Your Winery Position by number of Total awarded wines"
+    weight = 70
 
     @property
     def parameter_title(self):
         return "Total awarded wines"
 
-    @property
-    def weight(self):
-        return 70
-
     def format_entity_value(self, value):
         return value
 
@@ -8,13 +8,8 @@ from generator.reports.report import Report
 
 
 class StillSparklingPearlWinesRatio(Report):
-    @property
-    def title(self):
-        return "4.1 Still / Sparkling & Pearl wines ratio"
-
-    @property
-    def weight(self):
-        return 10
+    title = "4.1 Still / Sparkling & Pearl wines ratio"
+    weight = 10
 
     def render(self):
         wine_ratio_category = {
@@ -33,9 +28,9 @@ class StillSparklingPearlWinesRatio(Report):
                 "INNER JOIN event ON event.id = award.event_id "
                 "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
                 "INNER JOIN wine ON wine.id = wine_entity.wine "
-                f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"co2\"')) IN ({self.STILL_WINE_ID}, {', '.join(self.SPARKLING_PEARL_WINE_IDS)}) "
+                f"WHERE (event.year BETWEEN :year_from AND :year_to) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"co2\"')) IN ({self.STILL_WINE_ID}, {', '.join(self.SPARKLING_PEARL_WINE_IDS)}) "
                 "GROUP BY WINE_PRODUCT_TYPE"
-            ))
+            ).bindparams(year_from=self.year_from, year_to=self.year_to))
 
             df = pd.DataFrame(res.fetchall(), columns=["", "WINE_PRODUCT_TYPE"])
 
@@ -48,4 +43,3 @@ class StillSparklingPearlWinesRatio(Report):
             page_info.append(result)
 
         return self.render_template("wines_pie_ratio.html", page_info=page_info)
-
@@ -5,6 +5,8 @@ from generator.reports.top_wineries_report import TopWineriesReport
 
 
 class StillWinesTopWineriesInTheWorldByMedalCount(TopWineriesReport):
+    title = "4.1.1 Still Wines: Top Wineries in the World by Medal Count"
+    weight = 60
 
     @property
     def value_name(self) -> str:
@@ -15,12 +17,3 @@ class StillWinesTopWineriesInTheWorldByMedalCount(TopWineriesReport):
             event_year=(self.year_from, self.year_to),
             wine_type=WineType.STILL,
         )
-
-    @property
-    def title(self) -> str:
-        return "4.1.1 Still Wines: Top Wineries in the World by Medal Count"
-
-
-    @property
-    def weight(self) -> int:
-        return 60
@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByRedStillBlendWineAwardsWineryReport(ByWineWineryReport):
-    @property
-    def title(self):
-        return "8.2 Your Best Red Still Blend Wine position by Total number of medals"
+    title = "8.2 Your Best Red Still Blend Wine position by Total number of medals"
+    weight = 40
 
     @property
     def parameter_title(self):
         return "Best Red Still Blend Number of Medals"
 
-    @property
-    def weight(self):
-        return 40
-
     def format_entity_value(self, value):
         if value is None:
             return None
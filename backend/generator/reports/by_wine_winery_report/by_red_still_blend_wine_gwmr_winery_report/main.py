@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByRedStillBlendWineGWMRWineryReport(ByWineWineryReport):
-    @property
-    def title(self):
-        return "8.2 Your Best Red Still Blend Wine Position by GWMR score"
+    title = "8.2 Your Best Red Still Blend Wine Position by GWMR score"
+    weight = 30
 
     @property
     def parameter_title(self):
         return "Best Red Still Blend GWMR Score"
 
-    @property
-    def weight(self):
-        return 30
-
     def format_entity_value(self, value):
         if value is None:
             return None
@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByRedStillSingleVarietyWineAwardsWineryReport(ByWineWineryReport):
-    @property
-    def title(self):
-        return "8.2 Your Best Red Still Single Variety Wine position by Total number of medals"
+    title = "8.2 Your Best Red Still Single Variety Wine position by Total number of medals"
+    weight = 100
 
     @property
     def parameter_title(self):
         return "Best Red Still Single Variety Number of Medals"
 
-    @property
-    def weight(self):
-        return 100
-
     def format_entity_value(self, value):
         if value is None:
             return None
@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByRedStillSingleWineGWMRWineryReport(ByWineWineryReport):
-    @property
-    def title(self):
-        return "8.2 Your Best Red Still Single Variety Wine Position by GWMR score"
+    title = "8.2 Your Best Red Still Single Variety Wine Position by GWMR score"
+    weight = 90
 
     @property
     def parameter_title(self):
         return "Best Red Still Single Variety GWMR Score"
 
-    @property
-    def weight(self):
-        return 90
-
     def format_entity_value(self, value):
         if value is None:
             return None
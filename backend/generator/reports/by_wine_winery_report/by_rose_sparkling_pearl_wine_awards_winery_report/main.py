@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor
 
 
 class ByRoseSparklingPearlWineAwardsWineryReport(ByWineWineryReport):
-    @property
-    def title(self):
-        return "8.2 Your Best Rose Sparkling & Pearl Wine Position by Total number of medals"
+    title = "8.2 Your Best Rose Sparkling & Pearl Wine Position by Total number of medals"
+    weight = 180
 
     @property
     def parameter_title(self):
         return "Best Rose Sparkling & Pearl Number of Medals"
 
-    @property
-    def weight(self):
-        return 180
-
     def format_entity_value(self, value):
         if value is None:
             return None
@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor
 
 
 class ByRoseSparklingPearlWineGWMRWineryReport(ByWineWineryReport):
-    @property
-    def title(self):
-        return "8.2 Your Best Rose Sparkling & Pearl Wine Position by GWMR score"
+    title = "8.2 Your Best Rose Sparkling & Pearl Wine Position by GWMR score"
+    weight = 170
 
     @property
     def parameter_title(self):
         return "Best Rose Sparkling & Pearl GWMR Score"
 
-    @property
-    def weight(self):
-        return 170
-
     def format_entity_value(self, value):
         if value is None:
             return None
@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByRoseStillBlendWineAwardsWineryReport(ByWineWineryReport):
-    @property
-    def title(self):
-        return "8.2 Your Best Rose Still Blend Wine position by Total number of medals"
+    title = "8.2 Your Best Rose Still Blend Wine position by Total number of medals"
+    weight = 80
 
     @property
     def parameter_title(self):
         return "Best Rose Still Blend Number of Medals"
 
-    @property
-    def weight(self):
-        return 80
-
     def format_entity_value(self, value):
         if value is None:
             return None
@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByRoseStillBlendWineGWMRWineryReport(ByWineWineryReport):
-    @property
-    def title(self):
-        return "8.2 Your Best Rose Still Blend Wine Position by GWMR score"
+    title = "8.2 Your Best Rose Still Blend Wine Position by GWMR score"
+    weight = 70
 
     @property
     def parameter_title(self):
         return "Best Rose Still Blend GWMR Score"
 
-    @property
-    def weight(self):
-        return 70
-
     def format_entity_value(self, value):
         if value is None:
             return None
@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor
 
 
 class ByWhiteSparklingPearlWineGWMRWineryReport(ByWineWineryReport):
-    @property
-    def title(self):
-        return "8.2 Your Best White Sparkling & Pearl Wine Position by GWMR score"
+    title = "8.2 Your Best White Sparkling & Pearl Wine Position by GWMR score"
+    weight = 150
 
     @property
     def parameter_title(self):
         return "Best White Sparkling & Pearl White GWMR Score"
 
-    @property
-    def weight(self):
-        return 150
-
     def format_entity_value(self, value):
         if value is None:
             return None
@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByWhiteStillBlendWineAwardsWineryReport(ByWineWineryReport):
-    @property
-    def title(self):
-        return "8.2 Your Best White Still Blend Wine position by Total number of medals"
+    title = "8.2 Your Best White Still Blend Wine position by Total number of medals"
+    weight = 60
 
     @property
     def parameter_title(self):
         return "Best White Still Blend Number of Medals"
 
-    @property
-    def weight(self):
-        return 60
-
     def format_entity_value(self, value):
         if value is None:
             return None
@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByWhiteStillBlendWineGWMRWineryReport(ByWineWineryReport):
-    @property
-    def title(self):
-        return "8.2 Your Best White Still Blend Wine Position by GWMR score"
+    title = "8.2 Your Best White Still Blend Wine Position by GWMR score"
+    weight = 50
 
     @property
     def parameter_title(self):
         return "Best White Still Blend GWMR Score"
 
-    @property
-    def weight(self):
-        return 50
-
     def format_entity_value(self, value):
         if value is None:
             return None
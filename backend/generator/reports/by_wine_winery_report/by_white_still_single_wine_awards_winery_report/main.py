@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByWhiteStillSingleWineAwardsWineryReport(ByWineWineryReport):
-    @property
-    def title(self):
-        return "8.2 Your Best White Still Single Variety Wine position by Total number of medals"
+    title = "8.2 Your Best White Still Single Variety Wine position by Total number of medals"
+    weight = 120
 
     @property
     def parameter_title(self):
         return "Best White Still Single Variety Number of Medals"
 
-    @property
-    def weight(self):
-        return 120
-
     def format_entity_value(self, value):
         if value is None:
             return None
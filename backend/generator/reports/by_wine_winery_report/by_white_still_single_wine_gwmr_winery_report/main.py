@@ -4,18 +4,13 @@ from generator.enum import WineType, WineColor, GrapeVariety
 
 
 class ByWhiteStillSingleWineGWMRWineryReport(ByWineWineryReport):
-    @property
-    def title(self):
-        return "8.2 Your Best White Still Single Variety Wine Position by GWMR score"
+    title = "8.2 Your Best White Still Single Variety Wine Position by GWMR score"
+    weight = 110
 
     @property
     def parameter_title(self):
         return "Best White Still Single Variety GWMR Score"
 
-    @property
-    def weight(self):
-        return 110
-
     def format_entity_value(self, value):
         if value is None:
             return None
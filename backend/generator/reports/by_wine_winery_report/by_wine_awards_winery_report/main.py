@@ -3,18 +3,13 @@ from generator.reports.by_wine_winery_report.by_wine_winery_report import (
 
 
 class ByWineAwardsWineryReport(ByWineWineryReport):
-    @property
-    def title(self):
-        return "8.2 Your Best Wine Position by Total number of medals"
+    title = "8.2 Your Best Wine Position by Total number of medals"
+    weight = 20
 
     @property
     def parameter_title(self):
         return "Best wine Number of Medals"
 
-    @property
-    def weight(self):
-        return 20
-
     def format_entity_value(self, value):
         if value is None:
             return None
@@ -3,18 +3,13 @@ from generator.reports.by_wine_winery_report.by_wine_winery_report import (
 
 
 class ByWineGWMRWineryReport(ByWineWineryReport):
-    @property
-    def title(self):
-        return "8.2 Your Best Wine Position by GWMR score"
+    title = "8.2 Your Best Wine Position by GWMR score"
+    weight = 10
 
     @property
     def parameter_title(self):
         return "Best wine GWMR Score"
 
-    @property
-    def weight(self):
-        return 10
-
     def format_entity_value(self, value):
         if value is None:
             return None
@@ -54,16 +54,15 @@ class ByWineWineryReport(TableWineryReport, ABC):
             'wine_photo': get_absolute_url(wine_photo),
         }
 
+    def get_rating_indices(self):
+        return self.__get_query_get_winery_rating_by_wine_indices(self.continent_id, self.country_id, self.winery_id)
+
     def render(self, throw_exception=False):
         self.fill_continent_and_country()
 
         with self.database.connect() as connection:
             try:
-                result = connection.execute(self.get_query())
-                self.get_ratings_by_query_result(
-                    result,
-                    *self.__get_query_get_winery_rating_by_wine_indices(self.continent_id, self.country_id, self.winery_id),
-                )
+                self.fill_ratings(connection)
             except DataNotFoundException as e:
                 wg = wine_gwmr.alias('wg')
                 query = select(wg).select_from(wg).where(wg.c.year_from == self.year_from, wg.c.year_to == self.year_to)
@@ -134,17 +133,18 @@ class ByWineWineryReport(TableWineryReport, ABC):
             awe1 = award_wine_entity.alias("awe1")
             criteria = func.count(awe1.c.award_id)
 
+        continent = self.build_continent(v1.c.country)
         query = select(
             # 0  world_rank_index
             func.rank().over(order_by=criteria.desc()).label('world_rank'),
             # 1  world_percent_rank_index
             func.percent_rank().over(order_by=criteria.desc()).label('world_percent_rank'),
             # 2  continent_rank_index
-            func.rank().over(order_by=criteria.desc(), partition_by=self.build_continent_case(v1.c.country)).label('continent_rank'),
+            func.rank().over(order_by=criteria.desc(), partition_by=continent).label('continent_rank'),
             # 3  continent_percent_rank_index
-            func.percent_rank().over(order_by=criteria.desc(), partition_by=self.build_continent_case(v1.c.country)).label('continent_percent_rank'),
+            func.percent_rank().over(order_by=criteria.desc(), partition_by=continent).label('continent_percent_rank'),
             # 4  continent_id_index
-            self.build_continent_case(v1.c.country).label('continent_id'),
+            continent.label('continent_id'),
             # 5  country_rank_index
             func.rank().over(order_by=criteria.desc(), partition_by=v1.c.country).label('country_rank'),
             # 6  country_percent_rank_index
@@ -163,6 +163,8 @@ class ByWineWineryReport(TableWineryReport, ABC):
             v1.c.id.label('entity_id'),
             # 13
             we1.c.id.label('wine_entity_id'),
+            # 14 position in the ranking
+            func.row_number().over(order_by=criteria.desc()).label('position'),
         ).select_from(v1) \
             .join(we1, we1.c.winery == v1.c.id) \
             .order_by(criteria.desc()) \
@@ -187,7 +189,7 @@ class ByWineWineryReport(TableWineryReport, ABC):
                 .join(e2, e2.c.id == a1.c.event_id) \
                 .where(e2.c.year.between(self.year_from, self.year_to))
 
-        return query
+        return self.join_continent(query, v1.c.country)
 
     @staticmethod
     def __get_query_get_winery_rating_by_wine_indices(continent_id: Continent, country_id: int, entity_id: int):
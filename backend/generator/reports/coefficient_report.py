@@ -1,6 +1,5 @@
 from abc import ABC
 
-from django.forms import Form
 from django.http import HttpRequest
 
 from generator.forms import CoefficientReportForm
@@ -12,13 +11,11 @@ class CoefficientReport(Report, ABC):
     """
     Report for coefficients.
     """
+    form_class = CoefficientReportForm
+
     def __init__(self, request: HttpRequest):
         super().__init__(request)
 
-    def get_form(self, *args, **kwargs) -> Form:
-        self.form = CoefficientReportForm(*args, **kwargs)
-        return self.form
-
     @property
     def coefficient(self):
         if self.form is not None:
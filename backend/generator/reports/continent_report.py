@@ -7,13 +7,11 @@ from generator.reports.report import Report
 
 
 class ContinentReport(Report, ABC):
+    form_class = ContinentReportForm
+
     def __init__(self, request: HttpRequest):
         super().__init__(request)
 
-    def get_form(self, *args, **kwargs):
-        self.form = ContinentReportForm(*args, **kwargs)
-        return self.form
-
     @property
     def continent(self):
         if self.form is not None:
@@ -1,11 +1,13 @@
 from abc import abstractmethod
-from typing import Tuple, Any
+from functools import partial
+from typing import Any, Callable, List, Mapping, Tuple
 
 from django.http import HttpRequest
 from sqlalchemy import Select, func, distinct, select
 
 from generator.reports.report import Report
 from generator.enum import WineType, WineColor, GrapeVariety, Continent
+from generator.utils.award_facts import AwardFactFrame
 from generator.utils.database import apply_range_filter
 from gustos.models import (
     wine, wine_grapes, taxonomy_term,
@@ -47,6 +49,9 @@ class ContinentsTabReport(Report):
         self.south_america_tab_name: str | None = None
         """This name will be used as name of South America table."""
 
+        self.fact_aggregation: Callable[[AwardFactFrame], List[Mapping[str, Any]]] | None = None
+        """Aggregation of the award fact frame which computes rows of the query, it is set by query builders."""
+
     @property
     def continent_column_name(self) -> str:
         """
@@ -94,12 +99,21 @@ class ContinentsTabReport(Report):
             event_year=event_year,
         ).alias("we_subquery")
 
+        if select_fields is None and event_year == (self.year_from, self.year_to):
+            self.fact_aggregation = partial(
+                AwardFactFrame.count_wineries_medals_wines_by_continent,
+                continent_column_name=self.continent_column_name,
+                wine_color=wine_color,
+                wine_type=wine_type,
+                grape_variety=grape_variety,
+            )
+
         if select_fields is None:
             select_fields = (
                 func.count(distinct(winery.c.id)).label("MANUFACTURES"),
                 func.count(distinct(award_wine_entity.c.wine_entity_id)).label("MEDAL WINES"),
                 func.count(award_wine_entity.c.award_id).label("MEDALS"),
-                self.build_continent_case(winery.c.country).label(self.continent_column_name),
+                self.build_continent(winery.c.country).label(self.continent_column_name),
             )
 
         query = apply_range_filter(
@@ -118,7 +132,7 @@ class ContinentsTabReport(Report):
             event_year,
         )
 
-        return query.group_by(
+        return self.join_continent(query, winery.c.country).group_by(
             self.continent_column_name
         )
 
@@ -136,16 +150,27 @@ class ContinentsTabReport(Report):
             event_year=event_year,
         ).alias("we_subquery")
 
+        if event_year == (self.year_from, self.year_to):
+            self.fact_aggregation = partial(
+                AwardFactFrame.best_grape_varieties_by_continent,
+                tab_title_column_name=self.tab_title_column_name,
+                continent_column_name=self.continent_column_name,
+                wine_color=wine_color,
+                wine_type=wine_type,
+                grape_variety=grape_variety,
+            )
+
         position_label = "POSITION"
         award_count_label = "MEDALS"
+        continent = self.build_continent(wine.c.country)
 
-        subquery = apply_range_filter(
+        subquery = self.join_continent(apply_range_filter(
             select(
                 taxonomy_term.c.name.label(self.tab_title_column_name),
                 func.count(award_wine_entity.c.award_id).label(award_count_label),
-                self.build_continent_case(wine.c.country).label(self.continent_column_name),
+                continent.label(self.continent_column_name),
                 func.rank().over(
-                    partition_by=self.build_continent_case(wine.c.country),
+                    partition_by=continent,
                     order_by=func.count(award_wine_entity.c.award_id).desc()
                 ).label(position_label)
             ).select_from(wine_grapes) \
@@ -163,7 +188,7 @@ class ContinentsTabReport(Report):
             ),
             event.c.year,
             event_year,
-        )
+        ), wine.c.country)
 
         query = select(
             getattr(subquery.c, self.tab_title_column_name),
@@ -184,20 +209,31 @@ class ContinentsTabReport(Report):
             grape_variety: GrapeVariety = None,
             event_year: Tuple[int, int] = None,
     ) -> Select:
+        if event_year == (self.year_from, self.year_to):
+            self.fact_aggregation = partial(
+                AwardFactFrame.most_awarded_vintage_by_continent,
+                tab_title_column_name=self.tab_title_column_name,
+                continent_column_name=self.continent_column_name,
+                wine_color=wine_color,
+                wine_type=wine_type,
+                grape_variety=grape_variety,
+            )
+
         position_label = "POSITION"
         award_count_label = "MEDALS"
 
         we = wine_entity.alias("we")
         w = wine.alias("w")
+        continent = self.build_continent(w.c.country)
 
-        subquery = apply_range_filter(
+        subquery = self.join_continent(apply_range_filter(
             self.build_query_for_wine_entity(
                 select_fields=(
                     we.c.vintage.label(self.tab_title_column_name),
                     func.count(award_wine_entity.c.award_id).label(award_count_label),
-                    self.build_continent_case(w.c.country).label(self.continent_column_name),
+                    continent.label(self.continent_column_name),
                     func.rank().over(
-                        partition_by=self.build_continent_case(w.c.country),
+                        partition_by=continent,
                         order_by=func.count(award_wine_entity.c.award_id).desc()
                     ).label(position_label)
                 ),
@@ -220,7 +256,7 @@ class ContinentsTabReport(Report):
                 ),
             event.c.year,
             event_year,
-        )
+        ), w.c.country)
 
         return select(
             getattr(subquery.c, self.tab_title_column_name),
@@ -232,22 +268,37 @@ class ContinentsTabReport(Report):
             getattr(subquery.c, position_label) == 1
         )
 
+    def aggregate_award_facts(self) -> List[Mapping[str, Any]] | None:
+        """
+        :return: Rows of the query computed from the award fact frame or None if the query has to be executed.
+        """
+        if self.fact_aggregation is None:
+            return None
+
+        frame = self.get_award_fact_frame()
+        if frame is None:
+            return None
+        return self.fact_aggregation(frame)
+
     def render(self):
         query = self.get_query()
 
-        with self.database.connect() as connection:
-            result = connection.execute(query).mappings()
-            for row in result:
-                params = list(row.keys())
-                params.remove(self.continent_column_name)
-                try:
-                    if self.use_tab_title:
-                        params.remove(self.tab_title_column_name)
-                        setattr(self, f"{Continent(int(row[self.continent_column_name])).name.lower()}_tab_name", str(row[self.tab_title_column_name]))
-                    for param in params:
-                        getattr(self, f"{Continent(int(row[self.continent_column_name])).name.lower()}_tab")[param] = row[param]
-                except ValueError:
-                    pass
+        rows = self.aggregate_award_facts()
+        if rows is None:
+            with self.database.connect() as connection:
+                rows = connection.execute(query).mappings().all()
+
+        for row in rows:
+            params = list(row.keys())
+            params.remove(self.continent_column_name)
+            try:
+                if self.use_tab_title:
+                    params.remove(self.tab_title_column_name)
+                    setattr(self, f"{Continent(int(row[self.continent_column_name])).name.lower()}_tab_name", str(row[self.tab_title_column_name]))
+                for param in params:
+                    getattr(self, f"{Continent(int(row[self.continent_column_name])).name.lower()}_tab")[param] = row[param]
+            except ValueError:
+                pass
 
         return self.render_template(
             "continents_tab_report.html",
@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from typing import Any, List, Mapping
 
 from django.http import HttpRequest
 from sqlalchemy import Select
@@ -45,6 +46,12 @@ class ContinentsValueReport(Report):
         """
         pass
 
+    def aggregate_award_facts(self) -> List[Mapping[str, Any]] | None:
+        """
+        :return: Rows of the query computed from the award fact frame or None if the query has to be executed.
+        """
+        return None
+
     def format_value(self, value: str | None) -> str | None:
         """
         :param value: Value to format.
@@ -57,13 +64,16 @@ class ContinentsValueReport(Report):
     def render(self):
         query = self.get_query()
 
-        with self.database.connect() as connection:
-            result = connection.execute(query).mappings()
-            for row in result:
-                try:
-                    setattr(self, f"{Continent(int(row[self.continent_column_name])).name.lower()}_value", self.format_value(row[self.value_column_name]))
-                except ValueError:
-                    pass
+        rows = self.aggregate_award_facts()
+        if rows is None:
+            with self.database.connect() as connection:
+                rows = connection.execute(query).mappings().all()
+
+        for row in rows:
+            try:
+                setattr(self, f"{Continent(int(row[self.continent_column_name])).name.lower()}_value", self.format_value(row[self.value_column_name]))
+            except ValueError:
+                pass
 
         return self.render_template(
             "continents_value_report.html",
@@ -4,10 +4,10 @@ from io import BytesIO
 from typing import List, Tuple
 
 from django.http import HttpRequest
-from matplotlib import pyplot as plt
 from sqlalchemy import Select, select, func
 
 from generator.reports.report import Report
+from generator.utils.charts import get_pyplot
 from generator.utils.database import apply_range_filter
 
 from gustos.models import (
@@ -133,6 +133,8 @@ class CorrelationReport(Report):
         pass
 
     def render(self):
+        plt = get_pyplot()
+
         query = self.get_query()
 
         with self.database.connect() as connection:
@@ -6,13 +6,8 @@ from gustos.utils.file_managed import get_absolute_url
 
 
 class CountryRegionComparisonByAverageGwmrScorePerEachRedStillWine(WineryReport):
-    @property
-    def title(self):
-        return "8.3 Country/Region comparison by average GWMR Score per each Red Still wine"
-
-    @property
-    def weight(self):
-        return 40
+    title = "8.3 Country/Region comparison by average GWMR Score per each Red Still wine"
+    weight = 40
 
     def render(self, throw_exception=False):
         """Country/Region comparison by average GWMR Score per each Red Still wine"""
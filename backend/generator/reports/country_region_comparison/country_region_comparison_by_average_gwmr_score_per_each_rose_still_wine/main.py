@@ -6,13 +6,8 @@ from gustos.utils.file_managed import get_absolute_url
 
 
 class CountryRegionComparisonByAverageGwmrScorePerEachRoseStillWine(WineryReport):
-    @property
-    def title(self):
-        return "8.3 Country/Region comparison by average GWMR Score per each Rose Still wine"
-
-    @property
-    def weight(self):
-        return 60
+    title = "8.3 Country/Region comparison by average GWMR Score per each Rose Still wine"
+    weight = 60
 
     def render(self, throw_exception=False):
         """Country/Region comparison by average GWMR Score per each Rose Still wine"""
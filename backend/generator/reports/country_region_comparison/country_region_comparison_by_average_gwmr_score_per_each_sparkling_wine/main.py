@@ -6,13 +6,8 @@ from gustos.utils.file_managed import get_absolute_url
 
 
 class CountryRegionComparisonByAverageGwmrScorePerEachSparklingWine(WineryReport):
-    @property
-    def title(self):
-        return "8.3 Country/Region comparison by average GWMR Score per each Sparkling wine"
-
-    @property
-    def weight(self):
-        return 70
+    title = "8.3 Country/Region comparison by average GWMR Score per each Sparkling wine"
+    weight = 70
 
     def render(self, throw_exception=False):
         """Country/Region comparison by average GWMR Score per each sparkling wine"""
@@ -6,13 +6,8 @@ from gustos.utils.file_managed import get_absolute_url
 
 
 class CountryRegionComparisonByAverageGwmrScorePerEachWine(WineryReport):
-    @property
-    def title(self):
-        return "8.3 Country/Region comparison by average GWMR Score per each wine"
-
-    @property
-    def weight(self):
-        return 30
+    title = "8.3 Country/Region comparison by average GWMR Score per each wine"
+    weight = 30
 
     def render(self, throw_exception=False):
         """Country/Region comparison by average GWMR Score per each wine"""
@@ -6,13 +6,8 @@ from gustos.utils.file_managed import get_absolute_url
 
 
 class CountryRegionComparisonByTotalNumberOfMedalsForWinery(WineryReport):
-    @property
-    def title(self):
-        return "8.3 Country/Region comparison by Total number of medals for winery"
-
-    @property
-    def weight(self):
-        return 10
+    title = "8.3 Country/Region comparison by Total number of medals for winery"
+    weight = 10
 
     def render(self, throw_exception=False):
         """Country/Region comparison by Total number of medals for winery"""
@@ -54,10 +49,10 @@ class CountryRegionComparisonByTotalNumberOfMedalsForWinery(WineryReport):
                     WHERE (event.year BETWEEN :year_from AND :year_to) AND wine_entity.region = :region_id\
                     GROUP BY winery.id"
                 ).bindparams(year_from=year1, year_to=year2, region_id=region_id)
-                data_region = connection.execute(query).fetchall()
+                data_region = self.get_medal_counts(connection, query, "winery_id", region_id=region_id)
                 count_medal_by_wine_region = 0
                 for m in data_region:
-                    count_medal_by_wine_region += m[0]
+                    count_medal_by_wine_region += m
                 region_average_number_of_medal = count_medal_by_wine_region / len(data_region)
                 if total_number_of_medal >= region_average_number_of_medal:
                     region_higher_lower_than_the_average = self.higher_than_the_average(total_number_of_medal, region_average_number_of_medal)
@@ -96,10 +91,10 @@ class CountryRegionComparisonByTotalNumberOfMedalsForWinery(WineryReport):
                     WHERE winery.id = :winery_id)\
                 GROUP BY winery.id"
             ).bindparams(year_from=year1, year_to=year2, winery_id=winery)
-            data_country = connection.execute(query).fetchall()
+            data_country = self.get_medal_counts(connection, query, "winery_id", winery_country_id=country_id)
         count_medal_by_wine_country = 0
         for m in data_country:
-            count_medal_by_wine_country += m[0]
+            count_medal_by_wine_country += m
         if throw_exception and count_medal_by_wine_country == 0:
             raise DataNotFoundException("No data found.")
         country_average_number_of_medal = count_medal_by_wine_country / len(data_country)
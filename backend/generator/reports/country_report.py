@@ -7,13 +7,11 @@ from generator.reports.report import Report
 
 
 class CountryReport(Report, ABC):
+    form_class = CountryReportForm
+
     def __init__(self, request: HttpRequest):
         super().__init__(request)
 
-    def get_form(self, *args, **kwargs):
-        self.form = CountryReportForm(*args, **kwargs)
-        return self.form
-
     @property
     def country(self):
         if self.form is not None:
@@ -7,13 +7,8 @@ from generator.reports.histogram_report import HistogramReport
 
 
 class AverageRatingForWorldRegions(HistogramReport):
-    @property
-    def title(self) -> str:
-        return "3.1 Global S & S: Average rating for World Regions"
-
-    @property
-    def weight(self) -> int:
-        return 100
+    title = "3.1 Global S & S: Average rating for World Regions"
+    weight = 100
 
     @property
     def get_query_args(self) -> Dict[Any, str]:
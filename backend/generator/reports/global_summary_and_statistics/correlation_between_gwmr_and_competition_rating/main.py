@@ -4,14 +4,8 @@ from generator.reports.correlation_report import CorrelationReport
 
 
 class CorrelationBetweenGwmrAndCompetitionRating(CorrelationReport):
-    @property
-    def title(self) -> str:
-        return "3.1 Global S & S: Correlation between GWMR and Competition rating"
-
-    @property
-    def weight(self) -> int:
-        return 40
-
+    title = "3.1 Global S & S: Correlation between GWMR and Competition rating"
+    weight = 40
 
     @property
     def x_column_name(self) -> str:
@@ -4,6 +4,8 @@ from generator.reports.correlation_report import CorrelationReport
 
 
 class CorrelationBetweenGwmrAndMedalsCount(CorrelationReport):
+    title = "3.1 Global S & S: Correlation between GWMR and Medals Count"
+    weight = 50
 
     @property
     def x_column_name(self) -> str:
@@ -17,11 +19,3 @@ class CorrelationBetweenGwmrAndMedalsCount(CorrelationReport):
         return self.build_query_for_correlation_between_gwmr_and_medal_count(
             event_year=(self.year_from, self.year_to),
         )
-
-    @property
-    def title(self) -> str:
-        return "3.1 Global S & S: Correlation between GWMR and Medals Count"
-
-    @property
-    def weight(self) -> int:
-        return 50
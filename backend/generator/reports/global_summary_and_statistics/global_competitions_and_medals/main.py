@@ -13,13 +13,8 @@ from gustos.models import (
 
 
 class GlobalCompetitionsAndMedals(CoefficientReport, ContinentsTabReport):
-    @property
-    def title(self):
-        return "3.1 Global S & S: Global Competitions and Medals"
-
-    @property
-    def weight(self):
-        return 10
+    title = "3.1 Global S & S: Global Competitions and Medals"
+    weight = 10
 
     def get_query(self):
         case_list = []
@@ -8,10 +8,8 @@ from gustos.models import wine, wine_gwmr, wine_entity
 
 
 class GlobalIconicWinesDistribution(ContinentsValueReport):
-
-    @property
-    def title(self) -> str:
-        return "3.1 Global S & S: Global “Iconic wines” wines distribution"
+    title = "3.1 Global S & S: Global “Iconic wines” wines distribution"
+    weight = 30
 
     def format_value(self, value: float | None) -> float | None:
         return format_percent(value)
@@ -19,12 +17,13 @@ class GlobalIconicWinesDistribution(ContinentsValueReport):
     def get_query(self) -> Select:
         we = wine_entity.alias("we")
         w = wine.alias("w")
+        continent = self.build_continent(w.c.country)
 
-        return apply_range_filter(
+        query = apply_range_filter(
             self.build_query_for_wine_entity(
                 select_fields=(
                     (func.count(case((wine_gwmr.c.rating > 90, 1))) / func.count() * 100).label(self.value_column_name),
-                    self.build_continent_case(w.c.country).label(self.continent_column_name),
+                    continent.label(self.continent_column_name),
                 ),
                 we=we,
                 w=w,
@@ -32,8 +31,6 @@ class GlobalIconicWinesDistribution(ContinentsValueReport):
                 .join(wine_gwmr, wine_gwmr.c.wine_entity_id == we.c.id),
             (wine_gwmr.c.year_from, wine_gwmr.c.year_to),
             (self.year_from, self.year_to),
-        ).group_by(self.build_continent_case(w.c.country))
+        ).group_by(continent)
 
-    @property
-    def weight(self) -> int:
-        return 30
\ No newline at end of file
+        return self.join_continent(query, w.c.country)
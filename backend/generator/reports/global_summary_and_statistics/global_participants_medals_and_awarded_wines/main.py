@@ -7,13 +7,8 @@ from gustos.models import winery, award_wine_entity
 
 
 class GlobalGlobalParticipantsMedalsAndAwardedWines(CoefficientReport, ContinentsTabReport):
-    @property
-    def title(self):
-        return "3.1 Global S & S: Global participants, Medals and Awarded wines"
-
-    @property
-    def weight(self):
-        return 20
+    title = "3.1 Global S & S: Global participants, Medals and Awarded wines"
+    weight = 20
 
     def get_query(self):
         return self.build_query_for_count_wineries_medals_wines_by_continent(
@@ -25,6 +20,6 @@ class GlobalGlobalParticipantsMedalsAndAwardedWines(CoefficientReport, Continent
                 (func.count(distinct(award_wine_entity.c.wine_entity_id)) * literal(self.coefficient)).label("POSSIBLE MEDAL WINES"),
                 (func.count(award_wine_entity.c.award_id) * literal(self.coefficient)).label("POSSIBLE MEDALS"),
                 func.round(func.count(award_wine_entity.c.award_id) / func.count(distinct(award_wine_entity.c.wine_entity_id)), 1).label("AVERAGE MEDALS PER WINE"),
-                self.build_continent_case(winery.c.country).label(self.continent_column_name),
+                self.build_continent(winery.c.country).label(self.continent_column_name),
             )
         )
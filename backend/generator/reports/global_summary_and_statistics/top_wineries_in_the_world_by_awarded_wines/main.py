@@ -5,13 +5,8 @@ from generator.reports.report import Report
 
 
 class TopWineriesInTheWorldByAwardedWines(Report):
-    @property
-    def title(self):
-        return "3.1 Global S & S: Top Wineries in the World by Awarded wines"
-
-    @property
-    def weight(self):
-        return 90
+    title = "3.1 Global S & S: Top Wineries in the World by Awarded wines"
+    weight = 90
 
     def render(self):
         with self.database.connect() as connection:
@@ -25,11 +20,11 @@ class TopWineriesInTheWorldByAwardedWines(Report):
                     "SELECT * FROM award_wine_entity "
                     "INNER JOIN award ON award.id = award_wine_entity.award_id "
                     "INNER JOIN event ON event.id = award.event_id "
-                    f"WHERE award_wine_entity.wine_entity_id = wine_entity.id AND (event.year BETWEEN {self.year_from} AND {self.year_to}) "
+                    "WHERE award_wine_entity.wine_entity_id = wine_entity.id AND (event.year BETWEEN :year_from AND :year_to) "
                     ") AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) "
                     "GROUP BY winery.id "
                     "ORDER BY AWARDED_WINES DESC "
-                    "LIMIT 5"))
+                    "LIMIT 5").bindparams(year_from=self.year_from, year_to=self.year_to))
 
         df = pd.DataFrame(res.fetchall(), columns=["WINERY_NAME", "COUNTRY", "AWARDED_WINES"])
 
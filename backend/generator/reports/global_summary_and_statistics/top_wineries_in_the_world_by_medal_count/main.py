@@ -4,6 +4,9 @@ from generator.reports.top_wineries_report import TopWineriesReport
 
 
 class TopWineriesInTheWorldByMedalCount(TopWineriesReport):
+    title = "3.1 Global S & S: Top Wineries in the World by Medal Count"
+    weight = 80
+
     @property
     def value_name(self) -> str:
         return "Medals"
@@ -11,13 +14,4 @@ class TopWineriesInTheWorldByMedalCount(TopWineriesReport):
     def get_query(self) -> Select:
         return self.build_query_for_top_wineries_by_medal_count(
             event_year=(self.year_from, self.year_to),
-        )
-
-    @property
-    def title(self) -> str:
-        return "3.1 Global S & S: Top Wineries in the World by Medal Count"
-
-
-    @property
-    def weight(self) -> int:
-        return 80
\ No newline at end of file
+        )
\ No newline at end of file
@@ -3,12 +3,11 @@ from abc import abstractmethod
 from io import BytesIO
 from typing import Dict, Any, Tuple, List
 
-import matplotlib.pyplot as plt
-import seaborn as sns
 from django.http import HttpRequest
 from sqlalchemy import Select, func
 
 from generator.reports.report import Report
+from generator.utils.charts import get_pyplot
 from generator.utils.database import apply_range_filter
 from gustos.models import wine_gwmr, wine_entity
 
@@ -56,6 +55,10 @@ class HistogramReport(Report):
         ).group_by(func.round(wg.c.rating, 2))
 
     def render(self) -> str:
+        import seaborn as sns
+
+        plt = get_pyplot()
+
         for argument, name in self.get_query_args.items():
             print(name)
             query = self.get_query(argument)
@@ -8,13 +8,8 @@ from generator.reports.report import Report
 
 
 class CompetitionsAndParticipants(Report):
-    @property
-    def title(self):
-        return "3.2 Industry Dynamics: Competitions and Participants"
-
-    @property
-    def weight(self):
-        return 10
+    title = "3.2 Industry Dynamics: Competitions and Participants"
+    weight = 10
 
     def render(self):
         page_info = []
@@ -27,9 +22,9 @@ class CompetitionsAndParticipants(Report):
                     "INNER JOIN award_wine_entity ON award_wine_entity.wine_entity_id = wine_entity.id "
                     "INNER JOIN award ON award.id = award_wine_entity.award_id "
                     "INNER JOIN event ON award.event_id = event.id "
-                    f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) "
+                    "WHERE (event.year BETWEEN :year_from AND :year_to) AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) "
                     "GROUP BY event.year "
-                    "ORDER BY event.year DESC"))
+                    "ORDER BY event.year DESC").bindparams(year_from=self.year_from, year_to=self.year_to))
 
         df = pd.DataFrame(res.fetchall(), columns=["AMOUNT_OF_COMPETITION", "AMOUNT_OF_PARTICIPANTS", "YEAR"],
                           dtype=int).set_index("YEAR")
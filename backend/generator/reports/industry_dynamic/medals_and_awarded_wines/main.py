@@ -8,13 +8,8 @@ from generator.reports.report import Report
 
 
 class MedalsAndAwardedWines(Report):
-    @property
-    def title(self):
-        return "3.2 Industry Dynamics: Medals and Awarded wines"
-
-    @property
-    def weight(self):
-        return 20
+    title = "3.2 Industry Dynamics: Medals and Awarded wines"
+    weight = 20
 
     def render(self):
         page_info = []
@@ -25,9 +20,9 @@ class MedalsAndAwardedWines(Report):
                     "SELECT COUNT(DISTINCT award_wine_entity.wine_entity_id) AS AWARDED_WINES_COUNT, COUNT(award_wine_entity.award_id) AS MEDAL_COUNT, event.year AS YEAR FROM award_wine_entity "
                     "INNER JOIN award ON award.id = award_wine_entity.award_id "
                     "INNER JOIN event ON event.id = award.event_id "
-                    f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) "
+                    "WHERE (event.year BETWEEN :year_from AND :year_to) "
                     "GROUP BY event.year "
-                    "ORDER BY event.year DESC"))
+                    "ORDER BY event.year DESC").bindparams(year_from=self.year_from, year_to=self.year_to))
 
         df = pd.DataFrame(res.fetchall(), columns=["AWARDED_WINES_COUNT", "MEDAL_COUNT", "YEAR"], dtype=int).set_index(
             "YEAR")
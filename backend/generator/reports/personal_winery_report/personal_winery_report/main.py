@@ -3,17 +3,9 @@ from generator.reports.winery_report import WineryReport
 
 
 class PersonalWineryReport(WineryReport):
-    @property
-    def title(self):
-        return "Personal Winery Report"
-
-    @property
-    def weight(self):
-        return 0
+    title = "Personal Winery Report"
+    weight = 0
+    form_class = WineryReportForm
 
     def render(self):
         return ""
-
-    def get_form(self, *args, **kwargs):
-        self.form = WineryReportForm(*args, **kwargs)
-        return self.form
@@ -2,22 +2,23 @@ import os
 import re
 from abc import ABC, abstractmethod
 from hashlib import sha1
-from typing import Any, Sequence, Tuple, List, IO
+from typing import Any, Dict, Hashable, Mapping, Sequence, Tuple, List, IO, Type, TYPE_CHECKING
 from urllib.parse import urlencode, urlunsplit
 
-import matplotlib as mpl
-import pandas as pd
 from django.conf import settings
 from django.forms import Form
 from django.http import HttpRequest
 from django.template.loader import render_to_string
-from matplotlib import pyplot as plt
-from sqlalchemy import Integer, select, Select, case, Case, Column
+from sqlalchemy import Alias, Integer, bindparam, select, Select, case, Case, Column, ColumnElement, text
 from sqlalchemy.sql import func
 
 from generator.forms import DefaultReportForm
 from generator.enum import WineType, WineColor, GrapeVariety, Continent, GWMRUrlRatingType, BeverageType
+from generator.utils.award_facts import AwardFactFrame, AwardFacts
+from generator.utils.charts import get_pyplot
 from generator.utils.database import apply_range_filter, Database
+from generator.utils.facts import country_continent, facts_enabled, wine_entity_fact
+from generator.utils.query_cache import CachedDatabase
 from gustos.models import (
     wine, wine_entity,
     wine_grapes, taxonomy_term,
@@ -25,11 +26,22 @@ from gustos.models import (
     event, wine_gwmr,
 )
 
+# Dataframe and plotting libraries are imported when a chart is rendered.
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class Report(ABC):
     """
     Abstract class for reports.
     """
+    title: str = None
+    """The title of the report."""
+    weight: int = None
+    """The weight of the report for ordering."""
+    form_class: Type[Form] = DefaultReportForm
+    """The class of the report form."""
+
     STILL_WINE_ID = "1358"
     SPARKLING_PEARL_WINE_IDS = ["1359", "1360"]
     STILL_WINE_WHERE_CLAUSE = f"JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"co2\"')) IN ({STILL_WINE_ID})"
@@ -102,7 +114,9 @@ class Report(ABC):
             result = connection.execute(query)
             return result.fetchone()
 
-    def pie_plot(self, output: IO, df: pd.DataFrame, figsize, title: str = "", legend: bool or str = False, startangle: int = 240, show_labels=True):
+    def pie_plot(self, output: IO, df: "pd.DataFrame", figsize, title: str = "", legend: bool or str = False, startangle: int = 240, show_labels=True):
+        plt = get_pyplot()
+
         if show_labels:
             labels = df.index
         else:
@@ -118,7 +132,9 @@ class Report(ABC):
         plt.savefig(output, bbox_inches="tight")
         plt.close()
 
-    def bar_plot(self, output: IO, df: pd.DataFrame, figsize, title: str = "", legend: bool or str = False):
+    def bar_plot(self, output: IO, df: "pd.DataFrame", figsize, title: str = "", legend: bool or str = False):
+        plt = get_pyplot()
+
         try:
             ax = df.plot.bar(rot=0, figsize=figsize, title=title, legend=legend)
         except Exception as e:
@@ -149,43 +165,57 @@ class Report(ABC):
             a=award.alias("a"),
             e=event.alias("e"),
             wgwmr=wine_gwmr.alias("wgwmr"),
+            wef=wine_entity_fact.alias("wef"),
     ) -> Select:
         """
         Builds SQLAlchemy query which selects information about wine entities.
+
+        If WINE_ENTITY_FACTS_SCHEMA setting is set, wine entities are filtered by indexed columns of the facts table
+        instead of JSON "category" column of "wine" table.
         """
         if select_fields is None:
             select_fields = (we,)
 
+        use_facts = facts_enabled()
+
         query = select(
             *select_fields
         ).select_from(we) \
-            .join(w, w.c.id == we.c.wine) \
-            .where(func.json_value(w.c.category, "$.beverageType").cast(Integer) == BeverageType.WINE)
+            .join(w, w.c.id == we.c.wine)
+
+        if use_facts:
+            query = query.join(wef, wef.c.wine_entity_id == we.c.id) \
+                .where(wef.c.beverage_type == BeverageType.WINE)
+        else:
+            query = query.where(func.json_value(w.c.category, "$.beverageType").cast(Integer) == BeverageType.WINE)
 
         if countries is not None:
             if not isinstance(countries, Sequence):
                 countries = (countries,)
 
-            query = query.where(w.c.country.in_(countries))
+            query = query.where((wef.c.country_id if use_facts else w.c.country).in_(countries))
 
         if wine_color is not None:
             if not isinstance(wine_color, Sequence):
                 wine_color = (wine_color,)
             wine_color = tuple((wc.value if isinstance(wc, WineColor) else wc for wc in wine_color))
             if len(wine_color) > 0:
-                query = query.where(func.json_value(w.c.category, "$.color").in_(wine_color))
+                query = query.where((wef.c.color if use_facts else func.json_value(w.c.category, "$.color")).in_(wine_color))
 
         if wine_type is not None:
             if not isinstance(wine_type, Sequence):
                 wine_type = (wine_type,)
             wine_type = tuple((wt.value if isinstance(wt, WineType) else wt for wt in wine_type))
             if len(wine_type) > 0:
-                query = query.where(func.json_value(w.c.category, "$.co2").in_(wine_type))
+                query = query.where((wef.c.co2 if use_facts else func.json_value(w.c.category, "$.co2")).in_(wine_type))
 
         if grape_variety is not None:
-            query = query.join(wg, wg.c.wine_entity == we.c.id) \
-                .group_by(we.c.id) \
-                .having(func.max(wg.c.percent) > 85 if grape_variety == GrapeVariety.SINGLE else func.max(wg.c.percent) <= 85)
+            if use_facts:
+                query = query.where(wef.c.is_blend == (grape_variety == GrapeVariety.BLEND))
+            else:
+                query = query.join(wg, wg.c.wine_entity == we.c.id) \
+                    .group_by(we.c.id) \
+                    .having(func.max(wg.c.percent) > 85 if grape_variety == GrapeVariety.SINGLE else func.max(wg.c.percent) <= 85)
 
         if event_year is not None:
             subquery = select(
@@ -295,13 +325,36 @@ class Report(ABC):
         graphics_path = os.path.join(settings.MEDIA_ROOT, "graphics")
         if not os.path.exists(graphics_path):
             os.makedirs(graphics_path, mode=0o755)
-        self.database = Database()
+        # Results of queries are cached until Gustos data changes.
+        self.database = CachedDatabase(Database(), type(self).__name__)
         self.request = request
         self.request_values = request.GET
 
         self.form: Form | None = None  # Form instance.
+        # Award fact frames are provided by report generation tasks.
+        self.award_facts: AwardFacts | None = None
+        # Aliases of the lookup table of continents by country fields.
+        self.continent_lookups: Dict[Column, Alias] = {}
 
-        mpl.use('Agg')
+    def get_award_fact_frame(self) -> AwardFactFrame | None:
+        """
+        :return: Frame of awards of the year range of the report or None if the task does not provide award facts.
+        """
+        if self.award_facts is None:
+            return None
+        return self.award_facts.get(self.year_from, self.year_to)
+
+    @classmethod
+    def get_country_continents(cls) -> Dict[int, int]:
+        """
+        Returns continents by identifiers of countries, a country listed by several continents belongs to the first one,
+        the same as in "build_continent_case".
+        """
+        continents = {}
+        for continent, countries in cls.CONTINENTS.items():
+            for country in countries:
+                continents.setdefault(country, continent)
+        return continents
 
     def build_continent_case(self, country_field: Column) -> Case:
         """
@@ -309,6 +362,92 @@ class Report(ABC):
         """
         return case(*[(country_field.in_(self.CONTINENTS[continent]), continent) for continent in self.CONTINENTS], else_=None)
 
+    def build_continent(self, country_field: Column) -> ColumnElement:
+        """
+        Returns the continent of the given country.
+
+        If WINE_ENTITY_FACTS_SCHEMA setting is set, it is the column of the lookup table of continents, which
+        "join_continent" joins to the query, otherwise a case statement.
+        """
+        if not facts_enabled():
+            return self.build_continent_case(country_field)
+        return self.get_continent_lookup(country_field).c.continent_id
+
+    def join_continent(self, query: Select, country_field: Column) -> Select:
+        """
+        Joins the lookup table of continents of the given country to the query if "build_continent" has used it.
+        """
+        # Facts may become outdated between both calls.
+        lookup = self.continent_lookups.get(country_field)
+        if lookup is None:
+            return query
+        return query.outerjoin(lookup, lookup.c.country_id == country_field)
+
+    def get_continent_lookup(self, country_field: Column) -> Alias:
+        """
+        :return: Alias of the lookup table of continents of the given country, it is the same for all queries of the report.
+        """
+        if country_field not in self.continent_lookups:
+            self.continent_lookups[country_field] = country_continent.alias(f"{country_field.table.name}_continent")
+        return self.continent_lookups[country_field]
+
+    def get_grape_medal_distributions(
+            self,
+            connection,
+            categories: Mapping[Hashable, Tuple[Sequence[int], str, str | None]],
+            grape_having_clause: str = None,
+            countries_ids: Sequence[int] = None,
+    ) -> Dict[Tuple[Hashable, int], List[Tuple[str, int]]]:
+        """
+        Counts awards by medals of wines of the given grapes in all categories of the report by one grouped query.
+
+        :param connection: Connection to Gustos database.
+        :param categories: Grapes, WHERE clause of "wine" table and optional HAVING clause of all grapes of a wine
+        entity by keys of categories, e.g. colors.
+        :param grape_having_clause: Optional HAVING clause of the grape of a wine entity, e.g. its percent.
+        :param countries_ids: Optional countries of wines.
+
+        :return: Medals and their counts by keys of categories and grapes.
+        """
+        branches = []
+        binds = [bindparam("year_from", self.year_from), bindparam("year_to", self.year_to)]
+        if countries_ids is not None:
+            binds.append(bindparam("countries_ids", list(countries_ids), expanding=True))
+        keys = list(categories)
+        for i, key in enumerate(keys):
+            grapes_ids, wine_where_clause, wine_entity_having_clause = categories[key]
+            if not grapes_ids:
+                continue
+
+            binds.append(bindparam(f"grapes_ids_{i}", list(grapes_ids), expanding=True))
+            branches.append(
+                f"SELECT {i} AS CATEGORY, grapes.grape AS GRAPE, award.value AS MEDAL_NAME, COUNT(award.value) AS MEDAL_COUNT FROM award_wine_entity "
+                "INNER JOIN award ON award.id = award_wine_entity.award_id "
+                "INNER JOIN event ON event.id = award.event_id "
+                "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
+                "INNER JOIN ( "
+                "SELECT wine_grapes.wine_entity, wine_grapes.grape FROM wine_grapes "
+                f"WHERE wine_grapes.grape IN :grapes_ids_{i} "
+                "GROUP BY wine_grapes.wine_entity, wine_grapes.grape"
+                f"{f' HAVING {grape_having_clause}' if grape_having_clause else ''}"
+                ") AS grapes ON grapes.wine_entity = wine_entity.id "
+                "WHERE (event.year BETWEEN :year_from AND :year_to) AND EXISTS( "
+                "SELECT * FROM wine "
+                f"WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {wine_where_clause}"
+                f"{' AND wine.country IN :countries_ids' if countries_ids is not None else ''})"
+                f"{f' AND EXISTS(SELECT * FROM wine_grapes WHERE wine_grapes.wine_entity = wine_entity.id GROUP BY wine_grapes.wine_entity HAVING {wine_entity_having_clause})' if wine_entity_having_clause else ''} "
+                "GROUP BY grapes.grape, award.value"
+            )
+
+        distributions = {}
+        if not branches:
+            return distributions
+
+        res = connection.execute(text(" UNION ALL ".join(branches)).bindparams(*binds))
+        for category, grape_id, medal_name, medal_count in res.fetchall():
+            distributions.setdefault((keys[category], grape_id), []).append((medal_name, medal_count))
+        return distributions
+
     def format_file_name(self, *args: str) -> str:
         """
         Formats file name to be used as a file name using SHA1 hash.
@@ -329,16 +468,6 @@ class Report(ABC):
         """
         return render_to_string(template_name, kwargs, self.request)
 
-    @property
-    @abstractmethod
-    def title(self) -> str:
-        """
-        Returns the title of the report.
-
-        :return: The title of the report.
-        """
-        pass
-
     @abstractmethod
     def render(self) -> str:
         """
@@ -357,19 +486,9 @@ class Report(ABC):
 
         :return: Form instance.
         """
-        self.form = DefaultReportForm(*args, **kwargs)
+        self.form = self.form_class(*args, **kwargs)
         return self.form
 
-    @property
-    @abstractmethod
-    def weight(self) -> int:
-        """
-        Returns the weight of the report for ordering.
-
-        :return: Weight of the report.
-        """
-        pass
-
     @property
     def year_from(self):
         if self.form is not None:
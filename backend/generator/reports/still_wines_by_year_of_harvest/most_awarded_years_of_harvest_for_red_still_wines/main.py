@@ -5,13 +5,8 @@ from generator.enum import WineType, WineColor
 
 
 class MostAwardedYearsOfHarvestForRedStillWines(ContinentsTabReport):
-    @property
-    def title(self):
-        return "4.4 Most awarded years of harvest for Red Still wines"
-
-    @property
-    def weight(self):
-        return 10
+    title = "4.4 Most awarded years of harvest for Red Still wines"
+    weight = 10
 
     @property
     def use_tab_title(self) -> bool:
@@ -5,13 +5,8 @@ from generator.enum import WineType, WineColor
 
 
 class MostAwardedYearsOfHarvestForRoseStillWines(ContinentsTabReport):
-    @property
-    def title(self):
-        return "4.4 Most awarded years of harvest for Rose Still wines"
-
-    @property
-    def weight(self):
-        return 16
+    title = "4.4 Most awarded years of harvest for Rose Still wines"
+    weight = 16
 
     @property
     def use_tab_title(self) -> bool:
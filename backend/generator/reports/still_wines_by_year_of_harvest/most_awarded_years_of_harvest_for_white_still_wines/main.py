@@ -5,13 +5,8 @@ from generator.enum import WineType, WineColor
 
 
 class MostAwardedYearsOfHarvestForWhiteStillWines(ContinentsTabReport):
-    @property
-    def title(self):
-        return "4.4 Most awarded years of harvest for White Still wines"
-
-    @property
-    def weight(self):
-        return 13
+    title = "4.4 Most awarded years of harvest for White Still wines"
+    weight = 13
 
     @property
     def use_tab_title(self) -> bool:
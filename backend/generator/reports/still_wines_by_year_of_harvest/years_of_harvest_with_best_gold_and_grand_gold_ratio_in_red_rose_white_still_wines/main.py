@@ -9,13 +9,8 @@ from generator.reports.report import Report
 
 
 class YearsOfHarvestWithBestGoldAndGrandGoldRatioInRedRoseWhiteStillWines(Report):
-    @property
-    def title(self):
-        return "4.4 Years of harvest with best Gold and Grand Gold ratio in Red / Rose / White Still wine"
-
-    @property
-    def weight(self):
-        return 20
+    title = "4.4 Years of harvest with best Gold and Grand Gold ratio in Red / Rose / White Still wine"
+    weight = 20
 
     def render(self):
         colors_ids = {
@@ -43,7 +38,7 @@ class YearsOfHarvestWithBestGoldAndGrandGoldRatioInRedRoseWhiteStillWines(Report
                         "        from event e "
                         "        where "
                         "            e.id = a.event_id and "
-                        f"           (e.year between {self.year_from} and {self.year_to}) "
+                        "           (e.year between :year_from and :year_to) "
                         "    ) and "
                         "    exists( "
                         "        select * "
@@ -59,7 +54,7 @@ class YearsOfHarvestWithBestGoldAndGrandGoldRatioInRedRoseWhiteStillWines(Report
                         "having count(a.value) >= 20 "
                         "order by count(case when a.value in ('GRAND', 'GOLD') then 1 end) / count(a.value) desc "
                         "limit 16"
-                    ),
+                    ).bindparams(year_from=self.year_from, year_to=self.year_to),
                 )
 
             for vintage in res.fetchall():
@@ -83,11 +78,11 @@ class YearsOfHarvestWithBestGoldAndGrandGoldRatioInRedRoseWhiteStillWines(Report
                             "INNER JOIN award ON award.id = award_wine_entity.award_id "
                             "INNER JOIN event ON event.id = award.event_id "
                             "INNER JOIN wine_entity ON wine_entity.id = award_wine_entity.wine_entity_id "
-                            f"WHERE (event.year BETWEEN {self.year_from} AND {self.year_to}) AND EXISTS( "
+                            "WHERE (event.year BETWEEN :year_from AND :year_to) AND EXISTS( "
                             "SELECT * FROM wine "
-                            f"WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors_ids[color][0]} AND {self.STILL_WINE_WHERE_CLAUSE}) AND wine_entity.vintage = {vintage[0]} "
+                            f"WHERE wine.id = wine_entity.wine AND JSON_UNQUOTE(JSON_EXTRACT(wine.category, '$.\"beverageType\"')) IN (1425) AND {colors_ids[color][0]} AND {self.STILL_WINE_WHERE_CLAUSE}) AND wine_entity.vintage = :vintage "
                             "GROUP BY MEDAL_NAME"
-                        ),
+                        ).bindparams(year_from=self.year_from, year_to=self.year_to, vintage=vintage[0]),
                     )
 
                 df = pd.DataFrame(res.fetchall(), columns=["MEDAL_NAME", "MEDAL_COUNT"]).set_index("MEDAL_NAME")
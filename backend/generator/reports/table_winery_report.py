@@ -1,14 +1,18 @@
 from abc import abstractmethod
 from enum import Enum
-from typing import Any, Sequence
+from inspect import signature
+from typing import Any, Dict, Sequence, Tuple
 
+from django.conf import settings
 from django.http import HttpRequest
-from sqlalchemy import CursorResult, select
+from sqlalchemy import Connection, CursorResult, select
 
 from generator.exceptions import DataNotFoundException
 from generator.enum import Continent
 from generator.reports.winery_report import WineryReport
+from generator.utils.batch import RowsResult, SharedQueryResults
 from generator.utils.formatting import format_continent_name
+from generator.utils.rankings import build_neighbour_query, get_ranking_rows, rankings_enabled
 
 from gustos.models import taxonomy_term, winery
 
@@ -49,9 +53,19 @@ class TableWineryReport(WineryReport):
     def get_template_kwargs(self):
         pass
 
+    @abstractmethod
+    def get_rating_indices(self) -> Tuple[Any, ...]:
+        """
+        Returns the arguments of "get_ratings_by_query_result" method which follow the query result.
+        """
+        pass
+
     def __init__(self, request: HttpRequest):
         super().__init__(request)
 
+        self.shared_results: SharedQueryResults | None = None
+        """Rows of rating queries shared by personal reports of many wineries."""
+
         self.continent_id = None
         """The machine name of the continent of the searched (current) entity."""
         self.continent_name = None
@@ -144,16 +158,49 @@ class TableWineryReport(WineryReport):
             query = select(
                 winery.c.country.label('country_id'),
                 taxonomy_term.c.name.label('country_name'),
-                self.build_continent_case(winery.c.country).label('continent_id'),
+                self.build_continent(winery.c.country).label('continent_id'),
             ).select_from(winery) \
                 .join(taxonomy_term, winery.c.country == taxonomy_term.c.tid) \
                 .where(winery.c.id == self.winery_id)
+            query = self.join_continent(query, winery.c.country)
             self.country_id, self.country_name, self.continent_id = connection.execute(query).fetchone()
             self.continent_name = format_continent_name(self.continent_id)
 
+    def execute_rating_query(self, connection: Connection) -> CursorResult | RowsResult:
+        """
+        Executes the rating query of the report.
+
+        The query does not depend on the winery, so its rows are reused if the report is rendered in a batch.
+        """
+        if self.shared_results is not None:
+            return self.shared_results.execute(connection, self.get_query())
+        return connection.execute(self.get_query())
+
+    def get_rating_arguments(self) -> Dict[str, Any]:
+        """
+        Returns the arguments of "get_ratings_by_query_result" method by their names, except the query result.
+        """
+        arguments = signature(self.get_ratings_by_query_result).bind(None, *self.get_rating_indices()).arguments
+        del arguments["cursor_result"]
+        return arguments
+
+    def fill_ratings(self, connection: Connection):
+        """
+        Finds ratings of the winery in the ranking snapshot or, if it is not ready yet, in rows of the rating query.
+        """
+        arguments = self.get_rating_arguments()
+        cursor_result = get_ranking_rows(self, arguments) if rankings_enabled() else None
+        if cursor_result is None:
+            # Rows of a rating query shared by a batch are fetched once for all wineries.
+            if settings.RATING_NEIGHBOUR_QUERIES and self.shared_results is None:
+                cursor_result = connection.execute(build_neighbour_query(self.get_query(), arguments))
+            else:
+                cursor_result = self.execute_rating_query(connection)
+        self.get_ratings_by_query_result(cursor_result, **arguments)
+
     def get_ratings_by_query_result(
             self,
-            cursor_result: CursorResult,
+            cursor_result: CursorResult | RowsResult,
             world_rank_index: int,
             world_percent_rank_index: int,
             continent_rank_index: int,
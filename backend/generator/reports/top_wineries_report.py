@@ -1,11 +1,13 @@
 from abc import abstractmethod
-from typing import List, Tuple, Sequence
+from functools import partial
+from typing import Any, Callable, List, Mapping, Tuple, Sequence
 
 from django.http import HttpRequest
 from sqlalchemy import Select, select, func, case
 
 from generator.reports.report import Report
 from generator.enum import WineType, WineColor, GrapeVariety
+from generator.utils.award_facts import AwardFactFrame
 from generator.utils.database import apply_range_filter
 
 from gustos.models import (
@@ -24,6 +26,9 @@ class TopWineriesReport(Report):
         """List of top wineries. Each dict contains information about winery, where keys are parameters names and values are values of parameters."""
         """Required keys: image (link to winery logo), name (winery name), country (country name), value (value of parameter), value_name (name of parameter)."""
 
+        self.fact_aggregation: Callable[[AwardFactFrame], List[Mapping[str, Any]]] | None = None
+        """Aggregation of the award fact frame which computes rows of the query, it is set by query builders."""
+
     @property
     def image_column_name(self) -> str:
         """
@@ -93,6 +98,19 @@ class TopWineriesReport(Report):
             we=wine_entity,
         ).alias("we_subquery")
 
+        if event_year == (self.year_from, self.year_to):
+            self.fact_aggregation = partial(
+                AwardFactFrame.top_wineries_by_medal_count,
+                winery_column_name=self.winery_column_name,
+                image_column_name=self.image_column_name,
+                country_column_name=self.country_column_name,
+                value_column_name=self.value_column_name,
+                countries_ids=countries_ids,
+                wine_color=wine_color,
+                wine_type=wine_type,
+                grape_variety=grape_variety,
+            )
+
         subquery = apply_range_filter(
             select(
                 winery.c.name.label(self.winery_column_name),
@@ -110,7 +128,7 @@ class TopWineriesReport(Report):
                 .join(winery, winery.c.id == wine.c.winery) \
                 .join(taxonomy_term, taxonomy_term.c.tid == winery.c.country) \
                 .outerjoin(file_managed, file_managed.c.fid == winery.c.logo) \
-                .group_by(winery.c.id),
+                .group_by(winery.c.id, winery.c.name, taxonomy_term.c.name, file_managed.c.uri),
             event.c.year,
             event_year,
         )
@@ -130,19 +148,34 @@ class TopWineriesReport(Report):
             .where(subquery.c.position <= 8) \
             .order_by(subquery.c.position)
 
+    def aggregate_award_facts(self) -> List[Mapping[str, Any]] | None:
+        """
+        :return: Rows of the query computed from the award fact frame or None if the query has to be executed.
+        """
+        if self.fact_aggregation is None:
+            return None
+
+        frame = self.get_award_fact_frame()
+        if frame is None:
+            return None
+        return self.fact_aggregation(frame)
+
     def render(self):
         query = self.get_query()
 
-        with self.database.connect() as connection:
-            result = connection.execute(query).mappings()
-            for row in result:
-                self.top_wineries.append({
-                    "image": row[self.image_column_name] if row[self.image_column_name] else None,
-                    "name": row[self.winery_column_name],
-                    "country": row[self.country_column_name],
-                    "value": row[self.value_column_name],
-                    "value_name": self.value_name,
-                })
+        rows = self.aggregate_award_facts()
+        if rows is None:
+            with self.database.connect() as connection:
+                rows = connection.execute(query).mappings().all()
+
+        for row in rows:
+            self.top_wineries.append({
+                "image": row[self.image_column_name] if row[self.image_column_name] else None,
+                "name": row[self.winery_column_name],
+                "country": row[self.country_column_name],
+                "value": row[self.value_column_name],
+                "value_name": self.value_name,
+            })
 
         if not self.top_wineries:
             return self.render_template(
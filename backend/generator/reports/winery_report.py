@@ -1,20 +1,21 @@
-import threading
 import base64
 from abc import ABC
+from datetime import timedelta
 from io import BytesIO
-from typing import IO
+from typing import Any, IO, List, Tuple
 
-import numpy as np
+from django.conf import settings
+from django.db import IntegrityError, transaction
 from django.http import HttpRequest
-from matplotlib import pyplot as plt
-from sqlalchemy import select
+from django.utils import timezone
+from sqlalchemy import Connection, select, TextClause
 from sqlalchemy.sql import func
 
 from generator.forms import SectionWineryReportForm
 from generator.models import Task, TaskStatus
 from generator.reports.report import Report
-from generator.tasks import generate_personal_report
-from generator.utils.formatting import format_entity_name
+from generator.utils.charts import get_pyplot, pyplot_lock, render_bars, render_chart, render_pie_chart
+from generator.utils.database import get_data_version
 from gustos.models import (
     wine, wine_entity,
     taxonomy_term, award,
@@ -23,12 +24,10 @@ from gustos.models import (
 )
 from main.utils.serialization import serialize_request
 
-# Global lock for matplotlib.
-# Charts are rendered in separate threads, but 'pyplot' is static class, so we need to lock the rendering process.
-pyplot_lock = threading.Lock()
-
 
 class WineryReport(Report, ABC):
+    form_class = SectionWineryReportForm
+
     def higher_than_the_average(self, a, b):
         return (a - b) * 100 / b
 
@@ -36,13 +35,7 @@ class WineryReport(Report, ABC):
         return (b - a) * 100 / b
 
     def build_bars(self, a, b, winery, country_or_region, output: IO):
-        with pyplot_lock:
-            x = np.array([format_entity_name(winery), country_or_region])
-            y = np.array([a, b])
-
-            plt.bar(x, y, color=("steelblue", "silver"))
-            plt.savefig(output, format="png")
-            plt.close()
+        output.write(render_chart(render_bars, a, b, winery, country_or_region))
 
     def build_bars_base64(self, a, b, winery, country_or_region):
         buffer = BytesIO()
@@ -50,6 +43,10 @@ class WineryReport(Report, ABC):
         return f"data:image/png;base64,{base64.b64encode(buffer.getvalue()).decode('utf-8')}"
 
     def build_scatter(self, x, y, name_x, name_y, name_file):
+        import numpy as np
+
+        plt = get_pyplot()
+
         with pyplot_lock:
             x = np.array(x)
             y = np.array(y)
@@ -94,22 +91,7 @@ class WineryReport(Report, ABC):
         - x - count
         - color - color for x ring sector
         """
-        with pyplot_lock:
-            # Dependencies
-            if x < 1:
-                x = 1
-            vals = [100 - x, x]
-            labels = ["", ""]
-
-            # Build chart
-            fig, ax = plt.subplots(figsize=(3, 3))
-            fig.subplots_adjust(left=-0.1, bottom=-0.1, right=1.1, top=1.1, wspace=2, hspace=2)
-            plt.text(0, 0, f"{x}%", horizontalalignment='center', verticalalignment='center', fontsize=30, color=color)
-            ax.pie(vals, labels=labels, wedgeprops=dict(width=0.35), colors=("#7e1538", color))
-
-            # Save chart
-            plt.savefig(output, format="png")
-            plt.close()
+        output.write(render_chart(render_pie_chart, x, color))
 
     def build_pie_chart_base64(self, x: int, color: str):
         buffer = BytesIO()
@@ -140,25 +122,92 @@ class WineryReport(Report, ABC):
         total_number_of_medals, = result.fetchone()
         return total_number_of_medals
 
+    def get_medal_counts(self, connection: Connection, query: TextClause, by: str, **conditions: Any) -> List[int]:
+        """
+        Returns numbers of medals of the year range of wineries or wine entities.
+
+        The numbers are counted from the award fact frame of the task if there is one, otherwise by the query.
+
+        :param connection: Connection to Gustos database.
+        :param query: Query which selects the numbers of medals.
+        :param by: "winery_id" or "wine_entity_id" column of award facts which the query groups by.
+        :param conditions: Values of columns of award facts which the query filters by.
+
+        :return: Numbers of medals.
+        """
+        frame = self.get_award_fact_frame()
+        if frame is not None:
+            return frame.count_medals(by, **conditions)
+        return [count for count, in connection.execute(query).fetchall()]
+
     def __init__(self, request: HttpRequest):
         super().__init__(request)
         self.form = None
 
-    def get_form(self, *args, **kwargs):
-        self.form = SectionWineryReportForm(*args, **kwargs)
-        return self.form
-
-    def enqueue_report_generation(self):
-        task = Task()
-        task.request = serialize_request(self.request)
-        task.winery = self.winery_id
-        task.year_from = self.year_from
-        task.year_to = self.year_to
-        task.status = TaskStatus.PENDING
-        task.clean()
-        task.save()
-        generate_personal_report.delay(task.id)
-        return task
+    def get_report_generation_task(self, data_version: str = None) -> Tuple[Task, bool]:
+        """
+        Returns the task of the personal report generation without starting it.
+
+        If a report with the same parameters has already been generated (or is being generated) from the current
+        version of Gustos data, its task is reused instead. A failed task is resumed, so its completed subsections are
+        not rendered again, as well as a pending or running task which has not updated its progress for
+        PERSONAL_REPORT_TASK_TIMEOUT seconds, since its worker has most likely been lost.
+
+        Concurrent requests get the same task, but only one of them starts it.
+
+        :param data_version: Version of Gustos data, the current one by default.
+
+        :return: Tuple of the task and a boolean specifying whether the generation has to be started.
+        """
+        if data_version is None:
+            data_version = get_data_version()
+
+        lookup = {
+            "winery": self.winery_id,
+            "year_from": self.year_from,
+            "year_to": self.year_to,
+            "data_version": data_version,
+        }
+
+        task = Task.objects.filter(**lookup).first()
+        if task is None:
+            task = Task(**lookup)
+            task.request = serialize_request(self.request)
+            task.status = TaskStatus.PENDING
+            task.clean()
+            try:
+                with transaction.atomic():
+                    task.save(force_insert=True)
+                return task, True
+            except IntegrityError:
+                # Another request has created the task in the meantime.
+                task = Task.objects.get(**lookup)
+
+        stale = timezone.now() - timedelta(seconds=settings.PERSONAL_REPORT_TASK_TIMEOUT)
+        if task.status == TaskStatus.FAILED or (task.status != TaskStatus.FINISHED and task.updated < stale):
+            # The update matches the state read above, so only one of concurrent requests resumes the task.
+            updated = timezone.now()
+            if Task.objects.filter(id=task.id, status=task.status, updated=task.updated).update(status=TaskStatus.PENDING, updated=updated):
+                task.status = TaskStatus.PENDING
+                task.updated = updated
+                return task, True
+            task.refresh_from_db()
+
+        return task, False
+
+    def enqueue_report_generation(self) -> Tuple[Task, bool]:
+        """
+        Enqueues generation of the personal report, see "get_report_generation_task".
+
+        :return: Tuple of the task and a boolean specifying whether the generation was started.
+        """
+        # Celery and the task module are imported only when a report is requested.
+        from generator.tasks import generate_personal_report
+
+        task, started = self.get_report_generation_task()
+        if started:
+            generate_personal_report.delay(task.id)
+        return task, started
 
     @property
     def winery_id(self):
@@ -15,13 +15,8 @@ from gustos.utils.file_managed import get_absolute_url
 
 
 class YourWineryProfile(WineryReport):
-    @property
-    def title(self):
-        return "8 Your Winery Profile"
-
-    @property
-    def weight(self):
-        return 10
+    title = "8 Your Winery Profile"
+    weight = 10
 
     def render(self):
         year1 = self.year_from
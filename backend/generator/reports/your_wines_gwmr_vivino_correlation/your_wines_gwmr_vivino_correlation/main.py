@@ -7,13 +7,8 @@ from generator.reports.winery_report import WineryReport
 
 
 class YourWinesGwmrVivinoCorrelation(WineryReport):
-    @property
-    def title(self):
-        return "8.4 Your Wines GWMR/Vivino correlation"
-
-    @property
-    def weight(self):
-        return 10
+    title = "8.4 Your Wines GWMR/Vivino correlation"
+    weight = 10
 
     def render(self):
         type_report = "get_gwmr_vivino_correlation"
@@ -1,25 +1,357 @@
 import logging
+import os
+import shutil
+import tempfile
+import time
 from inspect import signature
-from io import BytesIO
-from queue import Queue
-from threading import Lock, Thread
+from typing import List, Mapping, Sequence, Set, Tuple
 
+from celery import chord
+from celery.signals import worker_process_init, worker_process_shutdown
 from django.conf import settings
-from django.core.files.base import ContentFile
+from django.core.files import File
+from django.http import HttpRequest
+from django.utils.module_loading import import_string
 from django.utils.translation import gettext
-from pypdf import PdfMerger
 
 from generator.exceptions import DataNotFoundException, RatingNotFoundException
-from generator.models import Task, TaskStatus
-from generator.utils.report import generating_pdf_report, get_report, SubsectionsBySections
+from generator.logging import flush_task_log_handlers
+from generator.models import RankingSnapshot, RankingSnapshotStatus, Task, TaskStatus, TaskSubsection, TaskSubsectionStatus
+from generator.reports.report import Report
+from generator.reports.table_winery_report import TableWineryReport
+from generator.utils.rankings import fail_ranking_snapshot, get_ranking_snapshot, materialize_ranking_snapshot, rankings_enabled
+from generator.utils.award_facts import award_facts_enabled, AwardFacts
+from generator.utils.batch import build_personal_report_request, SharedQueryResults
+from generator.utils.charts import shutdown_chart_executor
+from generator.utils.database import Database, PoolMetrics
+from generator.utils.executor import execute, host_semaphore, shutdown_executor
+from generator.utils.progress import TaskProgress
+from generator.utils.query_cache import QueryCache
+from generator.utils.report import generating_batch_pdf_report, get_report, spool_html, SubsectionsBySections
+from generator.utils.scheduling import record_render_times, sort_by_render_time
 from main.celery import app
 from main.utils.serialization import deserialize_request
 
+PERSONAL_REPORT_SECTIONS = (
+    "your_winery_profile",
+    "by_number_winery_report",
+    "by_wine_winery_report",
+    "country_region_comparison",
+)
 
-@app.task(bind=True)
+logger = logging.getLogger(__name__)
+# Records of the logger are not stored as log entries of a task.
+batch_logger = logging.getLogger("generator.batch")
+
+
+@worker_process_init.connect
+def dispose_inherited_engine(**kwargs):
+    # Connections of the engine created before the fork belong to the parent process.
+    Database.dispose()
+
+
+@worker_process_shutdown.connect
+def shutdown_executors(**kwargs):
+    shutdown_executor()
+    shutdown_chart_executor()
+    flush_task_log_handlers()
+    QueryCache.flush_stats()
+    QueryCache.log_stats()
+    PoolMetrics.log_stats()
+
+
+def get_personal_report_subsections(request: HttpRequest) -> List[Tuple[int, str, str, Report]]:
+    """
+    Collects subsections of the personal report.
+
+    :param request: Deserialized request of the task.
+
+    :return: List of (weight, section, subsection, report) tuples.
+    """
+    SubsectionsBySections.get_subsections_by_sections()
+
+    sections_info = {
+        section: subsections for section, subsections in
+                     SubsectionsBySections.subsections_by_sections.items() if section in PERSONAL_REPORT_SECTIONS
+    }
+
+    result = []
+    weight = 0
+    for section, subsections in sections_info.items():
+        for subsection in subsections:
+            report = get_report(request, section, subsection)
+            result.append((report.weight + 1000 * weight, section, subsection, report))
+        weight += 1
+    return result
+
+
+def render_subsection(report: Report, logger_extra: dict) -> Tuple[TaskSubsectionStatus, str | None]:
+    """
+    Renders a subsection of the personal report and logs the problems occurred.
+
+    :param report: Report object of the subsection.
+    :param logger_extra: Extra values of log records.
+
+    :return: Status and HTML code of the subsection, HTML code is None if the subsection cannot be rendered.
+    """
+    try:
+        render = report.render
+        # TODO: Remove "throw_exception" parameter from all "render" methods.
+        render_sig = signature(render)
+        if len(render_sig.parameters) == 0:
+            return TaskSubsectionStatus.FINISHED, render()
+        else:
+            return TaskSubsectionStatus.FINISHED, render(True)
+    except RatingNotFoundException:
+        # TODO: Link to the report page.
+        # TODO: Storing translatable log entries in the database.
+        # TODO: Do not store rich value in console log.
+        logger.warning(
+            'An error for the "%(report)s" report occurred: %(message)s' % {
+                "report": report.title,
+                "message": f'<em>{gettext("Missing GWMR ratings for selected period. It seems that GWMR for selected period must be calculated in Gustos application first.")}</em>',
+            },
+            extra=logger_extra
+        )
+        return TaskSubsectionStatus.NO_DATA, None
+    except DataNotFoundException:
+        # TODO: Link to the report page.
+        # TODO: Storing translatable log entries in the database.
+        # TODO: Do not store rich value in console log.
+        logger.warning(
+            'An error for the "%(report)s" report occurred: %(message)s' % {
+                "report": report.title,
+                "message": f'<em>{gettext("Winery is missing in result data. It seems that winery does not have awarded wines which satisfy the criteria.")}</em>',
+            },
+            extra=logger_extra
+        )
+        return TaskSubsectionStatus.NO_DATA, None
+    except Exception as e:
+        # TODO: Link to the report page.
+        # TODO: Storing translatable log entries in the database.
+        # TODO: Do not store rich value in console log.
+        logger.error(
+            'An unexpected error occurred for the "%(report)s" report: %(message)s' % {
+                "report": report.title,
+                "message": str(e),
+            },
+            extra=logger_extra,
+            exc_info=e,
+            stack_info=True,
+        )
+        return TaskSubsectionStatus.FAILED, None
+
+
+def save_subsection(task_id: str, section: str, subsection: str, weight: int, status: TaskSubsectionStatus, path: str | None):
+    """
+    Persists the outcome of rendering of the subsection, so it is reused if the task is resumed.
+
+    :param task_id: Identifier of the task.
+    :param section: Name of the section.
+    :param subsection: Name of the subsection.
+    :param weight: Weight of the subsection in the report.
+    :param status: Status of rendering.
+    :param path: Path to spooled HTML code of the subsection.
+    """
+    task_subsection, _ = TaskSubsection.objects.get_or_create(
+        task_id=task_id,
+        section=section,
+        subsection=subsection,
+        defaults={
+            "weight": weight,
+            "status": status,
+        },
+    )
+    task_subsection.weight = weight
+    task_subsection.status = status
+    if path is not None:
+        with open(path, "rb") as file:
+            task_subsection.file.save(f"{task_id}_{section}_{subsection}.html", File(file), save=False)
+    task_subsection.save()
+
+
+def get_completed_subsections(task_id: str) -> Set[Tuple[str, str]]:
+    """
+    :param task_id: Identifier of the task.
+
+    :return: (section, subsection) tuples of subsections which do not have to be rendered again.
+    """
+    return set(
+        TaskSubsection.objects.filter(
+            task_id=task_id,
+            status__in=(TaskSubsectionStatus.FINISHED, TaskSubsectionStatus.NO_DATA),
+        ).values_list("section", "subsection")
+    )
+
+
+def load_subsections(task_id: str, directory: str, paths: Mapping[int, str] = None) -> List[str]:
+    """
+    Collects HTML code of all rendered subsections of the task.
+
+    :param task_id: Identifier of the task.
+    :param directory: Temporary directory to copy subsections from the storage to.
+    :param paths: Paths to spooled HTML code of subsections by their weights, which do not have to be copied.
+
+    :return: Paths to HTML code of subsections in weight order.
+    """
+    paths = dict(paths or {})
+
+    task_subsections = TaskSubsection.objects.filter(task_id=task_id, status=TaskSubsectionStatus.FINISHED).exclude(weight__in=paths.keys())
+    for task_subsection in task_subsections:
+        path = os.path.join(directory, f"{task_subsection.weight}.html")
+        with task_subsection.file.open("rb") as source, open(path, "wb") as destination:
+            shutil.copyfileobj(source, destination)
+        paths[task_subsection.weight] = path
+
+    return [path for weight, path in sorted(paths.items(), key=lambda x: x[0])]
+
+
+def delete_subsections(task_id: str):
+    """
+    Deletes the persisted subsections of the task which is not going to be resumed anymore.
+    """
+    for task_subsection in TaskSubsection.objects.filter(task_id=task_id):
+        if task_subsection.file:
+            task_subsection.file.delete(save=False)
+        task_subsection.delete()
+
+
+def save_personal_report(task: Task, paths: Sequence[str], directory: str, logger_extra: dict):
+    """
+    Converts rendered subsections to PDF, attaches it to the task and marks the task as finished.
+
+    :param task: Task of report generation.
+    :param paths: Paths to spooled HTML code of subsections in weight order.
+    :param directory: Temporary directory to generate PDF in.
+    :param logger_extra: Extra values of log records.
+    """
+    output_filename = f"personal_report_{task.winery}_{task.year_from}_{task.year_to}.pdf"
+    output_path = os.path.join(directory, output_filename)
+
+    # All subsections are converted to PDF by a single wkhtmltopdf run.
+    generating_batch_pdf_report(paths, output_path)
+
+    # The storage copies the file by chunks.
+    with open(output_path, "rb") as file:
+        task.file.save(output_filename, File(file), save=False)
+    task.status = TaskStatus.FINISHED
+    # "current" is maintained by "TaskProgress".
+    task.save(update_fields=("file", "status", "updated"))
+    # TODO: Storing translatable log entries in the database.
+    # TODO: Do not store rich value in console log.
+    logger.info(
+        'Successfully finished the task. The report has been generated: %(file)s' % {
+            "file": f'<a href="{task.file.url}" target="_blank">{task.file.name}</a>' if hasattr(task.file, "url") else task.file.name,
+        },
+        extra=logger_extra,
+    )
+
+
+def start_personal_report(task: Task, celery_id: str, logger_extra: dict) -> List[Tuple[int, str, str, Report]]:
+    """
+    Marks the task as started and collects subsections of the personal report which have to be rendered.
+
+    :param task: Task of report generation.
+    :param celery_id: Identifier of the Celery task which generates the report.
+    :param logger_extra: Extra values of log records.
+
+    :return: (weight, section, subsection, report) tuples in order the subsections should be started.
+    """
+    task.celery_id = celery_id
+    task.status = TaskStatus.IN_PROGRESS
+    task.save()
+
+    logger.info(
+        "The task of report generation has been started successfully.",
+        extra=logger_extra
+    )
+
+    request = deserialize_request(task.request)
+
+    subsections = get_personal_report_subsections(request)
+    # Subsections completed by the previous run of the task are reused.
+    completed = get_completed_subsections(str(task.id))
+    task.total = len(subsections)
+    task.current = len(completed)
+    # Save "task.total" and "task.current".
+    task.save()
+
+    if rankings_enabled():
+        # Snapshots are refreshed by Celery workers, so they are ready for reports generated later.
+        for _, _, _, report in subsections:
+            if isinstance(report, TableWineryReport):
+                try:
+                    get_ranking_snapshot(report)
+                except Exception as e:
+                    logger.warning("Ranking snapshot of %s cannot be refreshed: %s", type(report).__name__, e, extra=logger_extra)
+
+    # Subsections are started in order of their expected render duration, but merged in order of their weight.
+    return sort_by_render_time([s for s in subsections if (s[1], s[2]) not in completed])
+
+
+def render_personal_report(task: Task, subsections: Sequence[Tuple[int, str, str, Report]], logger_extra: dict):
+    """
+    Renders subsections of the personal report in the process-wide thread pool and saves the report.
+
+    :param task: Task of report generation.
+    :param subsections: (weight, section, subsection, report) tuples of subsections which have to be rendered.
+    :param logger_extra: Extra values of log records.
+    """
+    task_id = str(task.id)
+    progress = TaskProgress(task_id)
+
+    # Rendered subsections are spooled to files as soon as they are finished.
+    with tempfile.TemporaryDirectory(prefix="personal_report_") as directory:
+        results = {}
+        durations = {}
+
+        def worker(weight: int, section: str, subsection: str, report: Report):
+            try:
+                with host_semaphore("render", settings.HOST_RENDER_CONCURRENCY):
+                    started = time.monotonic()
+                    status, result_data = render_subsection(report, logger_extra)
+                    durations[(section, subsection)] = time.monotonic() - started
+                if result_data is not None:
+                    results[weight] = spool_html(result_data, directory)
+                save_subsection(task_id, section, subsection, weight, status, results.get(weight))
+            finally:
+                progress.increment()
+
+        try:
+            for _ in execute(worker, subsections, settings.TASK_CONCURRENCY):
+                pass
+        finally:
+            progress.flush()
+            record_render_times(durations)
+
+        save_personal_report(task, load_subsections(task_id, directory, results), directory, logger_extra)
+
+    delete_subsections(task_id)
+
+
+def fail_personal_report(task: Task | None, e: Exception, logger_extra: dict):
+    """
+    Logs the unexpected error and marks the task as failed.
+    """
+    # TODO: Storing translatable log entries in the database.
+    # TODO: Do not store rich value in console log.
+    logger.critical(
+        "An unexpected error occurred: %(message)s" % {
+            "message": f'<em>{str(e)}</em>',
+        },
+        extra=logger_extra,
+        exc_info=e,
+        stack_info=True,
+    )
+    if task is not None:
+        task.status = TaskStatus.FAILED
+        task.save(update_fields=("status", "updated"))
+
+
+# The task is delivered again if the worker dies, completed subsections are not rendered again then.
+@app.task(bind=True, acks_late=True, reject_on_worker_lost=True)
 def generate_personal_report(self, task_id: str):
     # TODO: May be add logger handler manually?
-    logger = logging.getLogger(__name__)
     logger_extra = {
         "task_id": task_id
     }
@@ -27,143 +359,195 @@ def generate_personal_report(self, task_id: str):
 
     try:
         task = Task.objects.get(id=task_id)
-        task.celery_id = self.request.id
-        task.status = TaskStatus.IN_PROGRESS
-        task.save()
+        subsections = start_personal_report(task, self.request.id, logger_extra)
 
-        logger.info(
-            "The task of report generation has been started successfully.",
-            extra=logger_extra
-        )
+        if settings.PERSONAL_REPORT_EXECUTOR == "celery":
+            if not subsections:
+                assemble_personal_report.delay([], task_id)
+                return None
 
-        request = deserialize_request(task.request)
+            # Subsections are rendered by separate Celery tasks, so they may be spread across worker nodes.
+            chord(
+                render_personal_report_subsection.s(task_id, section, subsection, weight)
+                for weight, section, subsection, _ in subsections
+            )(
+                assemble_personal_report.s(task_id).on_error(personal_report_subsection_failed.s(task_id))
+            )
+            return None
 
-        SubsectionsBySections.get_subsections_by_sections()
+        if award_facts_enabled():
+            # Awards of the year range are loaded once for all subsections of the report.
+            award_facts = AwardFacts()
+            for _, _, _, report in subsections:
+                report.award_facts = award_facts
 
-        sections_info = {
-            section: subsections for section, subsections in
-                         SubsectionsBySections.subsections_by_sections.items() if section in [
-                             "your_winery_profile",
-                             "by_number_winery_report",
-                             "by_wine_winery_report",
-                             "country_region_comparison",
-                         ]
-        }
+        render_personal_report(task, subsections, logger_extra)
 
-        reports = Queue()
-        lock = Lock()
+        return task.file.name
 
-        weight = 0
-        for section, subsections in sections_info.items():
-            for subsection in subsections:
-                report = get_report(request, section, subsection)
-                reports.put((report.weight + 1000 * weight, report))
-                task.total += 1
-            weight += 1
-        # Save "task.total".
-        task.save()
+    except Exception as e:
+        fail_personal_report(task, e, logger_extra)
+        raise e
 
-        results = {}
+    finally:
+        flush_task_log_handlers()
 
-        def worker():
-            while True:
-                worker_task = reports.get()
-                if task is None:
-                    break
-                weight, report = worker_task
-                try:
-                    render = report.render
-                    # TODO: Remove "throw_exception" parameter from all "render" methods.
-                    render_sig = signature(render)
-                    if len(render_sig.parameters) == 0:
-                        result_data = render()
-                    else:
-                        result_data = render(True)
-
-                    output = BytesIO()
-                    generating_pdf_report(result_data, output)
-                    results[weight] = output
-                except RatingNotFoundException:
-                    # TODO: Link to the report page.
-                    # TODO: Storing translatable log entries in the database.
-                    # TODO: Do not store rich value in console log.
-                    logger.warning(
-                        'An error for the "%(report)s" report occurred: %(message)s' % {
-                            "report": report.title,
-                            "message": f'<em>{gettext("Missing GWMR ratings for selected period. It seems that GWMR for selected period must be calculated in Gustos application first.")}</em>',
-                        },
-                        extra=logger_extra
-                    )
-                except DataNotFoundException:
-                    # TODO: Link to the report page.
-                    # TODO: Storing translatable log entries in the database.
-                    # TODO: Do not store rich value in console log.
-                    logger.warning(
-                        'An error for the "%(report)s" report occurred: %(message)s' % {
-                            "report": report.title,
-                            "message": f'<em>{gettext("Winery is missing in result data. It seems that winery does not have awarded wines which satisfy the criteria.")}</em>',
-                        },
-                        extra=logger_extra
-                    )
-                except Exception as e:
-                    # TODO: Link to the report page.
-                    # TODO: Storing translatable log entries in the database.
-                    # TODO: Do not store rich value in console log.
-                    logger.error(
-                        'An unexpected error occurred for the "%(report)s" report: %(message)s' % {
-                            "report": report.title,
-                            "message": str(e),
-                        },
-                        extra=logger_extra,
-                        exc_info=e,
-                        stack_info=True,
-                    )
-                finally:
-                    with lock:
-                        task.current += 1
-                        task.save()
-                    reports.task_done()
-
-        thread_pool = [Thread(target=worker, daemon=True) for _ in range(settings.THREAD_POOL_SIZE)]
-        for thread in thread_pool:
-            thread.start()
-        reports.join()
-        thread_pool.clear()
-
-        results = [r[1] for r in sorted(results.items(), key=lambda x: x[0])]
-
-        output_filename = f"personal_report_{request.POST['winery']}_{request.POST['year_from']}_{request.POST['year_to']}.pdf"
-
-        with BytesIO() as io:
-            with PdfMerger(fileobj=io) as pdf:
-                for file in results:
-                    pdf.append(file)
-                    file.close()
-            task.file = ContentFile(io.getvalue(), name=output_filename)
-            task.status = TaskStatus.FINISHED
-            task.save()
-            # TODO: Storing translatable log entries in the database.
-            # TODO: Do not store rich value in console log.
-            logger.info(
-                'Successfully finished the task. The report has been generated: %(file)s' % {
-                    "file": f'<a href="{task.file.url}" target="_blank">{task.file.name}</a>' if hasattr(task.file, "url") else task.file.name,
-                },
-                extra=logger_extra,
-            )
+
+@app.task(acks_late=True, reject_on_worker_lost=True)
+def render_personal_report_subsection(task_id: str, section: str, subsection: str, weight: int):
+    """
+    Renders a single subsection of the personal report and persists it against the task.
+
+    :return: Weight and status of the subsection.
+    """
+    logger_extra = {
+        "task_id": task_id
+    }
+
+    try:
+        task = Task.objects.get(id=task_id)
+        report = get_report(deserialize_request(task.request), section, subsection)
+        with host_semaphore("render", settings.HOST_RENDER_CONCURRENCY):
+            started = time.monotonic()
+            status, result_data = render_subsection(report, logger_extra)
+            record_render_times({(section, subsection): time.monotonic() - started})
+
+        with tempfile.TemporaryDirectory(prefix="personal_report_") as directory:
+            path = spool_html(result_data, directory) if result_data is not None else None
+            save_subsection(task_id, section, subsection, weight, status, path)
+
+        return weight, status
+    finally:
+        TaskProgress(task_id, interval=0).increment()
+
+
+@app.task
+def assemble_personal_report(results: List[Tuple[int, str]], task_id: str):
+    """
+    Chord callback which merges subsections persisted by "render_personal_report_subsection" tasks in weight order.
+    """
+    logger_extra = {
+        "task_id": task_id
+    }
+    task = None
+
+    try:
+        task = Task.objects.get(id=task_id)
+
+        with tempfile.TemporaryDirectory(prefix="personal_report_") as directory:
+            save_personal_report(task, load_subsections(task_id, directory), directory, logger_extra)
+
+        delete_subsections(task_id)
 
         return task.file.name
 
     except Exception as e:
-        # TODO: Storing translatable log entries in the database.
-        # TODO: Do not store rich value in console log.
-        logger.critical(
-            "An unexpected error occurred: %(message)s" % {
-                "message": f'<em>{str(e)}</em>',
-            },
-            extra=logger_extra,
-            exc_info=e,
-            stack_info=True,
-        )
-        task.status = TaskStatus.FAILED
-        task.save()
+        fail_personal_report(task, e, logger_extra)
+        raise e
+
+    finally:
+        flush_task_log_handlers()
+
+
+@app.task
+def personal_report_subsection_failed(request, exc, traceback, task_id: str):
+    """
+    Error callback of the chord, marks the task as failed if any of subsection tasks has failed.
+    """
+    fail_personal_report(Task.objects.filter(id=task_id).first(), exc, {"task_id": task_id})
+    flush_task_log_handlers()
+
+
+@app.task(bind=True)
+def generate_personal_reports(self, task_ids: List[str]):
+    """
+    Generates personal reports of many wineries with the same year range.
+
+    Rating queries do not depend on the winery, so each of them is executed once for the whole batch and its rows are
+    shared by reports of all wineries. Reports are generated one by one, subsections of each report are rendered in the
+    process-wide thread pool regardless of PERSONAL_REPORT_EXECUTOR setting.
+
+    :param task_ids: Identifiers of tasks of report generation.
+
+    :return: Statistics of the batch.
+    """
+    shared_results = SharedQueryResults()
+    # Awards of the year range are loaded once for the whole batch.
+    award_facts = AwardFacts() if award_facts_enabled() else None
+    pool_stats = PoolMetrics.get_stats()
+    started = time.monotonic()
+    finished = 0
+
+    for task_id in task_ids:
+        logger_extra = {
+            "task_id": task_id
+        }
+        task = None
+
+        try:
+            task = Task.objects.get(id=task_id)
+            subsections = start_personal_report(task, self.request.id, logger_extra)
+            # Only reports of rating tables support shared query results.
+            for _, _, _, report in subsections:
+                if hasattr(report, "shared_results"):
+                    report.shared_results = shared_results
+                report.award_facts = award_facts
+
+            render_personal_report(task, subsections, logger_extra)
+            finished += 1
+
+        # A failed report does not stop the batch.
+        except Exception as e:
+            fail_personal_report(task, e, logger_extra)
+
+        finally:
+            flush_task_log_handlers()
+
+    duration = time.monotonic() - started
+    pool_stats = {name: value - pool_stats[name] for name, value in PoolMetrics.get_stats().items() if name in ("checkouts", "saturated", "wait_total")}
+    statistics = {
+        "wineries": len(task_ids),
+        "finished": finished,
+        "duration": duration,
+        "wineries_per_minute": len(task_ids) * 60 / duration if duration > 0 else 0,
+        "shared_query_hits": shared_results.hits,
+        "shared_query_misses": shared_results.misses,
+        "pool_checkouts": pool_stats["checkouts"],
+        "pool_saturated_checkouts": pool_stats["saturated"],
+        "pool_wait": pool_stats["wait_total"],
+    }
+    batch_logger.info(
+        "Generated %(finished)s of %(wineries)s personal reports in %(duration).1f s (%(wineries_per_minute).2f wineries per minute), "
+        "shared rating queries: %(shared_query_misses)s executed, %(shared_query_hits)s reused, "
+        "connections: %(pool_checkouts)s checked out, %(pool_saturated_checkouts)s of them from a saturated pool, %(pool_wait).2f s waited." % statistics
+    )
+    return statistics
+
+
+@app.task(acks_late=True)
+def refresh_ranking_snapshot(snapshot_id: int, report_path: str):
+    """
+    Materializes rows of the rating query of a table winery report in the ranking snapshot.
+
+    :param snapshot_id: Identifier of the snapshot.
+    :param report_path: Dotted path of the report class.
+
+    :return: Number of stored rows.
+    """
+    snapshot = RankingSnapshot.objects.filter(id=snapshot_id).first()
+    if snapshot is None or snapshot.status != RankingSnapshotStatus.IN_PROGRESS:
+        return 0
+
+    # Rating queries do not depend on the winery.
+    report = import_string(report_path)(build_personal_report_request(0, snapshot.year_from, snapshot.year_to))
+
+    started = time.monotonic()
+    try:
+        count = materialize_ranking_snapshot(snapshot, report.get_query(), report.get_rating_arguments())
+    except Exception as e:
+        # Reports execute the rating query until a later report generation task refreshes the snapshot again.
+        fail_ranking_snapshot(snapshot)
         raise e
+
+    batch_logger.info("Stored %s rows of the ranking snapshot of %s in %.1f s.", count, snapshot.report, time.monotonic() - started)
+    return count
@@ -1,3 +1,1084 @@
-from django.test import TestCase
+import contextlib
+import importlib.util
+import io
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+import zlib
+from collections import Counter, OrderedDict
+from datetime import timedelta
+from typing import Any, Dict
+from decimal import Decimal
+from unittest import mock, skipUnless
+
+from celery import Signature
+from celery.result import EagerResult
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.management import call_command, CommandError
+from django.db import OperationalError
+from django.http import HttpRequest, QueryDict
+from django.test import override_settings, SimpleTestCase, TestCase
+from django.utils import timezone
+from sqlalchemy import case, Column, create_engine, event, func, insert, Integer, literal, MetaData, Numeric, select, Table, text, union_all
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import StaticPool
+
+from generator.utils import facts
+from generator.utils.batch import build_personal_report_request, SharedQueryResults
+from generator.utils.charts import get_chart_executor, render_chart, render_pie_chart, shutdown_chart_executor
+from generator.utils.database import Database, DataVersion, get_data_version, get_gustos_data_version, MeasuredQueuePool, PoolMetrics
+from generator.utils.executor import execute, get_executor, host_semaphore, shutdown_executor
+from generator.enum import BeverageType, Continent, WineColor, WineType
+from generator.exceptions import DataNotFoundException
+from generator.logging import TaskLogHandler
+from generator.models import RankingSnapshot, RankingSnapshotStatus, SubsectionRenderTime, Task, TaskLogEntry, TaskStatus, TaskSubsection, TaskSubsectionStatus
+from generator.reports.by_color.white_wines_global_participants_medals_and_awarded_wines.main import WhiteWinesGlobalParticipantsMedalsAndAwardedWines
+from generator.reports.by_number_winery_report.by_award_number_winery_report.main import ByAwardNumberWineryReport
+from generator.reports.by_number_winery_report.by_event_number_wine_report.main import ByEventNumberWineryReport
+from generator.reports.by_number_winery_report.by_wine_number_winery_report.main import ByWineNumberWineryReport
+from generator.reports.continent_report import ContinentReport
+from generator.reports.continents_tab_report import ContinentsTabReport
+from generator.reports.continents_value_report import ContinentsValueReport
+from generator.reports.global_summary_and_statistics.top_wineries_in_the_world_by_medal_count.main import TopWineriesInTheWorldByMedalCount
+from generator.reports.personal_winery_report.personal_winery_report.main import PersonalWineryReport
+from generator.reports.report import Report
+from generator.reports.table_winery_report import TableWineryReport
+from generator.reports.top_wineries_report import TopWineriesReport
+from generator.tasks import generate_personal_report, generate_personal_reports, save_subsection
+from generator.utils.award_facts import AwardFacts
+from generator.utils.query_cache import CachedDatabase, QueryCache, REDIS_KEY_PREFIX
+from generator.utils.progress import TaskProgress
+from generator.utils.scheduling import record_render_times, sort_by_render_time
+from generator.utils.report import generating_batch_pdf_report, get_section, ReportRegistry, spool_html, SubsectionsBySections
+from generator.utils.snapshot import create_snapshot_engine, export_snapshot
+from generator.utils.rankings import fail_ranking_snapshot, get_ranking_rows, get_ranking_snapshot, lookup_ranking_rows, materialize_ranking_snapshot
+from gustos import models as gustos_models
+from main.utils.serialization import serialize_request
 
 # Create your tests here.
+
+
+def create_sqlite_functions(dbapi_connection, connection_record):
+    """
+    Creates MySQL functions used by report queries which SQLite does not have.
+    """
+    def json_value(document, path):
+        return None if document is None else json.loads(document).get(path[2:])
+
+    def concat_ws(separator, *values):
+        return separator.join(str(value) for value in values if value is not None)
+
+    dbapi_connection.create_function("json_value", 2, json_value)
+    # "json_extract" of SQLite already returns unquoted values.
+    dbapi_connection.create_function("json_unquote", 1, lambda value: value)
+    dbapi_connection.create_function("concat", -1, lambda *values: None if None in values else "".join(str(value) for value in values))
+    dbapi_connection.create_function("concat_ws", -1, concat_ws)
+    dbapi_connection.create_function("crc32", 1, lambda value: None if value is None else zlib.crc32(str(value).encode()))
+
+
+class GustosTestCase(SimpleTestCase):
+    """
+    Runs report queries in an in-memory SQLite database with empty Gustos and facts tables instead of the Gustos database.
+    """
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+        event.listen(self.engine, "connect", create_sqlite_functions)
+
+        # Foreign keys of Gustos tables refer to columns by names only, SQLite does not need them.
+        metadata = MetaData()
+        for table in (*gustos_models.metadata_obj.tables.values(), *facts.metadata_obj.tables.values()):
+            Table(table.name, metadata, *(Column(column.name, column.type, primary_key=column.primary_key, autoincrement=False) for column in table.c))
+        metadata.create_all(self.engine)
+
+        for target, name, value in ((Database, "_Database__instance", self.engine), (DataVersion, "version", None), (DataVersion, "checked_at", None)):
+            patcher = mock.patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.engine.dispose)
+
+    def insert_awards(self, seed: int = 0):
+        """
+        Fills Gustos tables with random wineries, wines and their awards of events in 2018-2021.
+        """
+        randomizer = random.Random(seed)
+        # Report queries fail on countries of no continent.
+        countries = [country for countries in Report.CONTINENTS.values() for country in countries[:2]]
+        grapes = list(range(5000, 5012))
+        colors = [color.value for color in WineColor]
+        wine_types = [wine_type.value for wine_type in WineType]
+
+        with self.engine.begin() as connection:
+            for term in countries + grapes:
+                connection.execute(insert(gustos_models.taxonomy_term).values(tid=term, name=f"Term {term}"))
+            for file_id in range(1, 5):
+                connection.execute(insert(gustos_models.file_managed).values(
+                    fid=file_id, uid=1, filename="logo.png", uri=f"public://logo{file_id}.png", filemime="image/png", filesize=1, status=True, timestamp=0,
+                ))
+            for winery_id in range(1, 41):
+                connection.execute(insert(gustos_models.winery).values(
+                    id=winery_id, uid=1, name=f"Winery {winery_id}", country=randomizer.choice(countries + [None]), logo=randomizer.choice((None, 1, 2, 3, 4)),
+                    phone="", created=0, updated=0,
+                ))
+            connection.execute(insert(gustos_models.competition).values(id=1, name="Competition", region="MULTIPLE", google_page_rating=1, correction_factor=1, rating=1, created=0, updated=0))
+            for event_id in range(1, 31):
+                connection.execute(insert(gustos_models.event).values(
+                    id=event_id, competition_id=1, year=randomizer.choice((2018, 2019, 2020, 2021)), wine_count=0, medal_count=0, created=0, updated=0,
+                ))
+
+            wine_entity_id = 0
+            for wine_id in range(1, 121):
+                category = {"beverageType": randomizer.choice((BeverageType.WINE, BeverageType.WINE, BeverageType.BEER)), "color": randomizer.choice(colors), "co2": randomizer.choice(wine_types)}
+                connection.execute(insert(gustos_models.wine).values(
+                    id=wine_id, name=f"Wine {wine_id}", winery=randomizer.randint(1, 40), country=randomizer.choice(countries), category=json.dumps(category), created=0, updated=0,
+                ))
+                for _ in range(randomizer.randint(1, 3)):
+                    wine_entity_id += 1
+                    connection.execute(insert(gustos_models.wine_entity).values(id=wine_entity_id, wine=wine_id, vintage=randomizer.choice((2015, 2016, 2017)), created=0, updated=0))
+                    for grape in randomizer.sample(grapes, randomizer.randint(0, 3)):
+                        connection.execute(insert(gustos_models.wine_grapes).values(wine=wine_id, wine_entity=wine_entity_id, grape=grape, percent=randomizer.choice((100, 90, 85, 60, 30))))
+
+            for award_id in range(1, 401):
+                connection.execute(insert(gustos_models.award).values(
+                    id=award_id, name="Award", event_id=randomizer.randint(1, 30), value=randomizer.choice(("GRAND", "GOLD", "SILVER", "BRONZE")),
+                    weight=0, min_rating=0, max_rating=100, created=0, updated=0,
+                ))
+                connection.execute(insert(gustos_models.award_wine_entity).values(award_id=award_id, wine_entity_id=randomizer.randint(1, wine_entity_id)))
+
+    @staticmethod
+    def build_report(report_class: type, **values) -> Report:
+        request = HttpRequest()
+        request.GET = QueryDict(mutable=True)
+        request.GET.update({"year_from": 2019, "year_to": 2020, **values})
+        request.user = None
+        return report_class(request)
+
+
+class ImportTimeTest(SimpleTestCase):
+    """
+    Keeps cold start of web and worker processes cheap.
+    """
+
+    HEAVY_MODULES = ("matplotlib", "pandas", "seaborn", "celery", "generator.tasks")
+    """Modules which must not be imported before a report is rendered or requested."""
+
+    SCRIPT = (
+        "import sys\n"
+        "import django\n"
+        "django.setup()\n"
+        "import main.urls\n"
+        "print(' '.join(name for name in {modules!r} if name in sys.modules))\n"
+    )
+
+    def test_heavy_modules_are_not_imported(self):
+        process = subprocess.run(
+            (sys.executable, "-X", "importtime", "-c", self.SCRIPT.format(modules=self.HEAVY_MODULES)),
+            cwd=settings.BASE_DIR,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "main.settings")},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        imported = process.stdout.splitlines()[-1]
+
+        # "-X importtime" reports "self | cumulative | module" lines, the slowest ones help to find the culprit.
+        lines = [line.split("|") for line in process.stderr.splitlines() if line.startswith("import time:") and "cumulative" not in line]
+        slowest = sorted(lines, key=lambda line: int(line[1]), reverse=True)[:10]
+        report = "\n".join(f"{int(cumulative) / 1000:.1f} ms {module.strip()}" for _, cumulative, module in slowest)
+
+        self.assertEqual(imported, "", f"Heavy modules are imported at startup:\n{report}")
+
+
+class HostSemaphoreTest(SimpleTestCase):
+    def test_limits_concurrent_threads(self):
+        name = f"test-{uuid.uuid4().hex}"
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def worker():
+            with host_semaphore(name, 2):
+                with lock:
+                    running.append(1)
+                    peak.append(len(running))
+                time.sleep(0.05)
+                with lock:
+                    running.pop()
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        self.assertEqual(len(peak), 6)
+        self.assertLessEqual(max(peak), 2)
+
+
+class ChartTest(SimpleTestCase):
+    def test_process_pool_renders_same_charts(self):
+        with override_settings(CHART_PROCESS_POOL_SIZE=0):
+            expected = render_chart(render_pie_chart, 40, "r")
+            self.assertIsNone(get_chart_executor())
+
+        with override_settings(CHART_PROCESS_POOL_SIZE=1):
+            self.addCleanup(shutdown_chart_executor)
+            self.assertIsNotNone(get_chart_executor())
+            self.assertIs(get_chart_executor(), get_chart_executor())
+            self.assertEqual(render_chart(render_pie_chart, 40, "r"), expected)
+
+        self.assertTrue(expected.startswith(b"\x89PNG"))
+
+
+class ExecutorTest(SimpleTestCase):
+    def test_closes_database_connections_around_calls(self):
+        events = []
+
+        with mock.patch("generator.utils.executor.close_old_connections", side_effect=lambda: events.append("close")):
+            results = sorted(execute(lambda value: events.append(value) or value * 2, [(1, ), (2, ), (3, )], 1))
+
+        self.assertEqual(results, [2, 4, 6])
+        self.assertEqual(events, ["close", 1, "close", "close", 2, "close", "close", 3, "close"])
+
+    @override_settings(THREAD_POOL_SIZE=4)
+    def test_quota_limits_calls_of_task_in_shared_pool(self):
+        shutdown_executor()
+        self.addCleanup(shutdown_executor)
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def worker(value):
+            with lock:
+                running.append(value)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.remove(value)
+            return threading.current_thread().name
+
+        threads = list(execute(worker, [(i, ) for i in range(6)], 2))
+
+        self.assertEqual(len(threads), 6)
+        self.assertLessEqual(max(peak), 2)
+        self.assertTrue(all(thread.startswith("report") for thread in threads))
+        self.assertIs(get_executor(), get_executor())
+
+
+class TaskLogHandlerTest(SimpleTestCase):
+    def log(self, handler: TaskLogHandler, count: int):
+        for i in range(count):
+            record = logging.LogRecord("generator.tasks", logging.INFO, __file__, 0, "Message %d", (i, ), None)
+            record.task_id = "task"
+            handler.handle(record)
+
+    def test_writes_records_in_batches(self):
+        handler = TaskLogHandler(batch_size=2, interval=60)
+        self.addCleanup(handler.close)
+
+        with mock.patch("django.db.close_old_connections"), \
+                mock.patch.object(TaskLogEntry.objects, "bulk_create") as bulk_create:
+            self.log(handler, 5)
+            handler.flush()
+
+            self.assertEqual([len(call.args[0]) for call in bulk_create.call_args_list], [2, 2, 1])
+            self.assertEqual([entry.message for call in bulk_create.call_args_list for entry in call.args[0]], [f"Message {i}" for i in range(5)])
+
+    def test_retries_failed_batch_with_new_connection(self):
+        handler = TaskLogHandler(batch_size=10, interval=60)
+        self.addCleanup(handler.close)
+
+        with mock.patch("django.db.close_old_connections") as close_old_connections, \
+                mock.patch("django.db.connection") as connection, \
+                mock.patch.object(TaskLogEntry.objects, "bulk_create", side_effect=[OperationalError("gone away"), None]) as bulk_create:
+            self.log(handler, 3)
+            handler.flush()
+
+            self.assertEqual(close_old_connections.call_count, 1)
+            connection.close.assert_called_once()
+            self.assertEqual(bulk_create.call_count, 2)
+            self.assertEqual(len(bulk_create.call_args.args[0]), 3)
+
+
+class BatchPdfReportTest(SimpleTestCase):
+    @mock.patch("sass_processor.processor.SassProcessor.__call__", lambda self, path: path.replace(".scss", ".css"))
+    def test_uses_page_options_of_template(self):
+        commands = []
+
+        def to_pdf(report, path):
+            commands.append(report.command(path))
+            with open(report.source.to_s(), "r", encoding="utf-8") as file:
+                commands.append(file.read())
+
+        with tempfile.TemporaryDirectory() as directory, \
+                mock.patch("pdfkit.PDFKit.to_pdf", autospec=True, side_effect=to_pdf), \
+                mock.patch("pdfkit.pdfkit.Configuration", return_value=mock.Mock(wkhtmltopdf="wkhtmltopdf", environ={})):
+            paths = [spool_html(f"<p>Report {i}</p>", directory) for i in range(2)]
+            generating_batch_pdf_report(paths, os.path.join(directory, "report.pdf"))
+
+            self.assertEqual(os.listdir(directory).count("report.pdf.html"), 0)
+
+        command, document = commands
+        self.assertIn("--orientation Landscape", " ".join(command))
+        self.assertIn("--page-size", command)
+        self.assertLess(document.index("page-break-after"), document.index("Report 0"))
+        self.assertLess(document.index("Report 0"), document.index("Report 1"))
+
+
+    def test_spooled_reports_refer_to_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = spool_html(f'<img src="{settings.MEDIA_URL}charts/chart.png" />', directory)
+
+            self.assertEqual(os.path.dirname(path), directory)
+            with open(path, "r", encoding="utf-8") as file:
+                self.assertEqual(file.read(), f'<img src="{os.path.join(settings.MEDIA_ROOT, "charts/chart.png")}"/>')
+
+
+class ReportRegistryTest(SimpleTestCase):
+    def test_imports_report_modules_once(self):
+        ReportRegistry.load()
+        with mock.patch("importlib.import_module") as import_module:
+            report_class = ReportRegistry.get_report_class("by_color", "red_rose_white_wines_ratio_awarded_wines_and_medals")
+            ReportRegistry.load()
+
+        import_module.assert_not_called()
+        self.assertEqual((report_class.title, report_class.weight), ("4.2 Red / Rose / White wines ratio: Awarded wines and Medal", 10))
+        self.assertEqual(ReportRegistry.get_section("by_color").weight, 40)
+        self.assertIsNone(ReportRegistry.get_report_class("by_color", "unknown"))
+
+    def test_broken_subsection_raises_its_error_on_lookup(self):
+        ReportRegistry.load()
+        error = ImportError("broken")
+        with mock.patch.dict(ReportRegistry.errors, {("by_color", "broken"): error}):
+            with self.assertRaises(ImportError) as raised:
+                ReportRegistry.get_report_class("by_color", "broken")
+
+        self.assertIs(raised.exception, error)
+
+    def test_catalog_is_ordered_by_weight(self):
+        catalog = ReportRegistry.get_catalog("by_color")
+
+        self.assertEqual(len(catalog), len(ReportRegistry.subsections["by_color"]))
+        report_classes = [ReportRegistry.get_report_class("by_color", subsection) for subsection, _ in catalog]
+        self.assertEqual([title for _, title in catalog], [report_class.title for report_class in report_classes])
+        self.assertEqual([report_class.weight for report_class in report_classes], sorted(report_class.weight for report_class in report_classes))
+        self.assertEqual(ReportRegistry.get_catalog("unknown"), ())
+
+    def test_navigation_tree_is_built_once(self):
+        with mock.patch.multiple(SubsectionsBySections, got_subsections_by_sections=False, subsections_by_sections={}, got_sections_by_chapters=False, sections_by_chapters={}), \
+                mock.patch("generator.utils.report.get_section", wraps=get_section) as get_section_mock:
+            SubsectionsBySections.get_sections_by_chapters()
+            SubsectionsBySections.get_sections_by_chapters()
+            SubsectionsBySections.get_subsections_by_sections()
+
+            self.assertEqual(get_section_mock.call_count, len(ReportRegistry.sections))
+            self.assertEqual(list(SubsectionsBySections.subsections_by_sections), sorted(ReportRegistry.sections, key=lambda section: ReportRegistry.sections[section].weight))
+            for sections in SubsectionsBySections.sections_by_chapters.values():
+                self.assertEqual([section["weight"] for section in sections], sorted(section["weight"] for section in sections))
+
+
+class SharedQueryResultsTest(SimpleTestCase):
+    def test_keeps_most_recently_used_queries(self):
+        results = SharedQueryResults(size=2)
+        engine = create_engine("sqlite://")
+        with engine.connect() as connection:
+            for value in (1, 2, 1, 3, 2):
+                self.assertEqual(results.execute(connection, select(literal(value))).fetchall(), [(value, )])
+
+        # The query of 2 has been released by the query of 3.
+        self.assertEqual((results.hits, results.misses), (1, 4))
+        self.assertEqual(len(results.results), 2)
+
+    def test_builds_personal_report_request(self):
+        request = build_personal_report_request(7, 2020, 2022)
+
+        self.assertEqual(request.method, "POST")
+        self.assertEqual(request.POST.dict(), {"winery": "7", "year_from": "2020", "year_to": "2022"})
+        self.assertEqual(request.resolver_match.url_name, "personal_report")
+
+
+class DataVersionTest(GustosTestCase):
+    def test_version_is_read_once_per_ttl(self):
+        with override_settings(DATA_VERSION_TTL=60):
+            version = get_data_version()
+            with self.engine.begin() as connection:
+                connection.execute(insert(gustos_models.taxonomy_term).values(tid=1, name="Term"))
+            self.assertEqual(get_data_version(), version)
+
+        with override_settings(DATA_VERSION_TTL=0):
+            self.assertNotEqual(get_data_version(), version)
+
+
+class FactsVersionTest(GustosTestCase):
+    def test_facts_are_current_only_for_refreshed_data(self):
+        with self.engine.begin() as connection:
+            connection.execute(insert(gustos_models.wine_gwmr).values(wine_entity_id=1, year_from=2020, year_to=2022, rating=1.5))
+            data_version = get_gustos_data_version(connection)
+            self.assertIsNone(facts.get_facts_version(connection, data_version))
+            self.assertFalse(facts.FactsVersion.current)
+
+            connection.execute(insert(facts.wine_entity_fact_version).values(id=1, data_version=data_version, continents_version=facts.get_continents_version()))
+            facts_version = facts.get_facts_version(connection, data_version)
+            self.assertTrue(facts.FactsVersion.current)
+
+            # Tables without "updated" column are tracked by checksums.
+            connection.execute(gustos_models.wine_gwmr.update().values(rating=2.5))
+            changed_version = get_gustos_data_version(connection)
+            self.assertNotEqual(changed_version, data_version)
+            self.assertEqual(facts.get_facts_version(connection, changed_version), facts_version)
+            self.assertFalse(facts.FactsVersion.current)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.hashes = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    def hincrby(self, key, field, amount=1):
+        self.hashes.setdefault(key, Counter())[field] += amount
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def execute(self):
+        pass
+
+
+@override_settings(QUERY_CACHE_SIZE=2, DATA_VERSION_TTL=0, QUERY_CACHE_REDIS_URL="", QUERY_CACHE_STATS_INTERVAL=60)
+class QueryCacheTest(GustosTestCase):
+    def setUp(self):
+        super().setUp()
+        for name, value in (("local", OrderedDict()), ("version", None), ("stats", {}), ("pending_stats", Counter()), ("stats_flushed_at", None), ("redis", None)):
+            patcher = mock.patch.object(QueryCache, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.database = CachedDatabase(self.engine, "test")
+
+    def count_wineries(self) -> int:
+        with self.database.connect() as connection:
+            return connection.execute(select(func.count()).select_from(gustos_models.winery)).scalar()
+
+    def add_winery(self, winery_id: int):
+        with self.engine.begin() as connection:
+            connection.execute(insert(gustos_models.winery).values(id=winery_id, uid=1, name=f"Winery {winery_id}", phone="", created=0, updated=winery_id))
+
+    def test_changed_data_invalidates_results(self):
+        self.assertEqual(self.count_wineries(), 0)
+        self.assertEqual(self.count_wineries(), 0)
+        self.add_winery(1)
+        self.assertEqual(self.count_wineries(), 1)
+
+        self.assertEqual(QueryCache.get_stats()["test"], {"miss": 2, "local_hit": 1})
+
+    def test_local_tier_keeps_most_recently_used_results(self):
+        with self.database.connect() as connection:
+            for value in (1, 2, 1, 3, 2):
+                self.assertEqual(connection.execute(select(literal(value))).scalar(), value)
+
+        self.assertEqual(QueryCache.get_stats()["test"], {"miss": 4, "local_hit": 1})
+        self.assertEqual(len(QueryCache.local), 2)
+
+    def test_redis_tier_shares_results_as_json(self):
+        redis = FakeRedis()
+        query = text("SELECT 1 AS id, 'Gold' AS name, 2.5 AS rating")
+        with override_settings(QUERY_CACHE_REDIS_URL="redis://redis:6379/1"), mock.patch.object(QueryCache, "redis", redis):
+            with self.database.connect() as connection:
+                connection.execute(query)
+            value, = redis.values.values()
+            json.loads(value)
+
+            # Another process has an empty local tier.
+            QueryCache.local.clear()
+            with self.database.connect() as connection:
+                row = connection.execute(query).mappings().one()
+                self.assertEqual(dict(row), {"id": 1, "name": "Gold", "rating": 2.5})
+                connection.execute(select(literal(Decimal("1.25")).label("value")))
+
+            QueryCache.local.clear()
+            with self.database.connect() as connection:
+                value = connection.execute(select(literal(Decimal("1.25")).label("value"))).scalar()
+                self.assertIsInstance(value, Decimal)
+                self.assertEqual(value, Decimal("1.25"))
+
+        self.assertEqual(QueryCache.get_stats()["test"], {"miss": 2, "redis_hit": 2})
+
+    def test_redis_counters_are_incremented_in_batches(self):
+        redis = FakeRedis()
+        with override_settings(QUERY_CACHE_REDIS_URL="redis://redis:6379/1"), mock.patch.object(QueryCache, "redis", redis):
+            with self.database.connect() as connection:
+                for _ in range(3):
+                    connection.execute(select(literal(1)))
+            self.assertEqual(redis.hashes, {})
+
+            QueryCache.flush_stats()
+
+        self.assertEqual(redis.hashes, {f"{REDIS_KEY_PREFIX}:stats": {"test:miss": 1, "test:local_hit": 2}})
+
+
+class BenchmarkReportQueriesTest(GustosTestCase):
+    @override_settings(QUERY_CACHE_SIZE=100, QUERY_CACHE_REDIS_URL="")
+    def test_repeated_year_range_executes_cached_statements(self):
+        self.insert_awards()
+        stdout, stderr = io.StringIO(), io.StringIO()
+
+        # Histogram reports print names of continents.
+        with mock.patch.object(QueryCache, "local", OrderedDict()), contextlib.redirect_stdout(io.StringIO()):
+            call_command("benchmark_report_queries", "global_summary_and_statistics", years=["2020-2021", "2020-2021"], stdout=stdout, stderr=stderr)
+
+        self.assertEqual(stderr.getvalue(), "")
+        first, second = stdout.getvalue().splitlines()[:2]
+        count = int(first.split()[1])
+        self.assertGreater(count, 0)
+        # The query cache does not hide queries of the second pass.
+        self.assertEqual(second, f"2020-2021: {count} queries, compiled cache hit rate 100%.")
+
+
+class MeasuredQueuePoolTest(SimpleTestCase):
+    def test_records_saturated_checkouts(self):
+        engine = create_engine("sqlite:///file::memory:?uri=true", poolclass=MeasuredQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.1)
+        stats = PoolMetrics.get_stats()
+
+        with engine.connect():
+            with self.assertRaises(TimeoutError):
+                engine.connect()
+        with engine.connect():
+            pass
+
+        changes = {name: PoolMetrics.get_stats()[name] - stats[name] for name in ("checkouts", "saturated", "timeouts")}
+        self.assertEqual(changes, {"checkouts": 3, "saturated": 1, "timeouts": 1})
+        self.assertGreaterEqual(PoolMetrics.get_stats()["wait_max"], 0.1)
+
+
+class RatingReport:
+    """
+    Rating query of a table winery report over fixed rows.
+    """
+
+    ROWS = [
+        (10, 1, 100, 1, 1, 1, Decimal("9.50")),
+        (11, 1, 100, 2, 2, 2, Decimal("8.25")),
+        (12, 2, 200, 2, 1, 1, Decimal("8.25")),
+        (13, 2, 201, 4, 2, 1, Decimal("7.00")),
+        (14, 1, 101, 5, 3, 1, None),
+        (15, 1, 101, 6, 4, 2, Decimal("6.75")),
+    ]
+    year_from = 2020
+    year_to = 2022
+
+    def get_query(self):
+        columns = (
+            ("entity_id", Integer()), ("continent_id", Integer()), ("country_id", Integer()), ("world_rank", Integer()),
+            ("continent_rank", Integer()), ("country_rank", Integer()), ("rating", Numeric(10, 2)),
+        )
+        ratings = union_all(*(select(*(literal(value, type_).label(name) for value, (name, type_) in zip(row, columns))) for row in self.ROWS)).subquery("ratings")
+        return select(ratings)
+
+    @staticmethod
+    def get_rating_arguments():
+        return {
+            "entity_id_index": 0, "continent_id_index": 1, "country_id_index": 2,
+            "world_rank_index": 3, "continent_rank_index": 4, "country_rank_index": 5,
+            "entity_id": 13, "continent_id": 2, "country_id": 201,
+        }
+
+
+class GeneratePersonalReportsTest(GustosTestCase, TestCase):
+    def clean_task(self, task: Task):
+        if task.winery == 2:
+            raise ValidationError({"winery": "Winery does not exist."})
+        task.winery_name = f"Winery {task.winery}"
+
+    def test_invalid_winery_creates_no_tasks(self):
+        with mock.patch.object(Task, "clean", autospec=True, side_effect=self.clean_task), \
+                mock.patch("generator.management.commands.generate_personal_reports.get_data_version", return_value="version"), \
+                mock.patch("celery.utils.functional.logger"), \
+                mock.patch("generator.tasks.generate_personal_reports.delay") as delay:
+            with self.assertRaisesMessage(CommandError, "Winery 2: Winery does not exist."):
+                call_command("generate_personal_reports", "1", "2", "3", year_from=2020, year_to=2021)
+
+            self.assertFalse(Task.objects.exists())
+            delay.assert_not_called()
+
+            call_command("generate_personal_reports", "1", "3", year_from=2020, year_to=2021, stdout=io.StringIO())
+
+        self.assertEqual(sorted(Task.objects.values_list("winery", flat=True)), [1, 3])
+        delay.assert_called_once()
+
+
+class TaskSubsectionsTest(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        patcher = override_settings(MEDIA_ROOT=directory.name)
+        patcher.enable()
+        self.addCleanup(patcher.disable)
+        self.directory = directory.name
+
+    def create_task(self, status: TaskStatus, data_version: str, age: timedelta = timedelta()) -> Task:
+        task = Task.objects.create(request={}, winery=Task.objects.count() + 1, winery_name="Winery", year_from=2020, year_to=2021, status=status, data_version=data_version)
+        Task.objects.filter(id=task.id).update(updated=timezone.now() - age)
+        with open(os.path.join(self.directory, "fragment.html"), "w", encoding="utf-8") as file:
+            file.write(f"<p>{task.id}</p>")
+        save_subsection(str(task.id), "section", "subsection", 1, TaskSubsectionStatus.FINISHED, file.name)
+        return task
+
+    def test_deletes_subsections_of_failed_tasks_which_are_not_resumed(self):
+        outdated = self.create_task(TaskStatus.FAILED, "old")
+        old = self.create_task(TaskStatus.FAILED, "current", timedelta(days=8))
+        kept = [
+            self.create_task(TaskStatus.FAILED, "current", timedelta(days=6)),
+            self.create_task(TaskStatus.IN_PROGRESS, "old", timedelta(days=8)),
+        ]
+        paths = {task_subsection.task_id: task_subsection.file.path for task_subsection in TaskSubsection.objects.all()}
+
+        with mock.patch("generator.management.commands.delete_failed_task_subsections.get_data_version", return_value="current"):
+            call_command("delete_failed_task_subsections", stdout=io.StringIO())
+
+        self.assertEqual(set(TaskSubsection.objects.values_list("task_id", flat=True)), {task.id for task in kept})
+        for task in (outdated, old):
+            self.assertFalse(os.path.exists(paths[task.id]))
+        for task in kept:
+            self.assertTrue(os.path.exists(paths[task.id]))
+
+
+class TaskProgressTest(TestCase):
+    def test_coalesces_increments(self):
+        task = Task.objects.create(request={}, winery=1, winery_name="Winery", year_from=2020, year_to=2021)
+
+        progress = TaskProgress(str(task.id), interval=60000)
+        with self.assertNumQueries(0):
+            for _ in range(5):
+                progress.increment()
+        with self.assertNumQueries(1):
+            progress.flush()
+        task.refresh_from_db()
+        self.assertEqual(task.current, 5)
+
+        progress = TaskProgress(str(task.id), interval=0)
+        with self.assertNumQueries(2):
+            progress.increment()
+            progress.increment(2)
+        task.refresh_from_db()
+        self.assertEqual(task.current, 8)
+
+
+class SchedulingTest(TestCase):
+    def test_starts_longest_subsections_first(self):
+        record_render_times({("section", "fast"): 1.0, ("section", "slow"): 5.0})
+        record_render_times({("section", "fast"): 11.0})
+        self.assertAlmostEqual(SubsectionRenderTime.objects.get(subsection="fast").duration, 4.0)
+
+        subsections = [(1, "section", "fast"), (2, "section", "slow"), (3, "section", "new")]
+        # Subsections which have never been rendered go first.
+        self.assertEqual(sort_by_render_time(subsections), [(3, "section", "new"), (2, "section", "slow"), (1, "section", "fast")])
+
+
+class FakeReport:
+    """
+    Subsection of the personal report which records its renders.
+    """
+
+    def __init__(self, subsection: str, renders: list):
+        self.title = subsection
+        self.renders = renders
+
+    def render(self):
+        self.renders.append(self.title)
+        return f"<p>{self.title}</p>"
+
+
+class PersonalReportTest(TestCase):
+    SUBSECTIONS = ("first", "second", "third")
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.renders = []
+        self.documents = []
+        self.pdf_error = None
+        self.task = Task.objects.create(
+            request=serialize_request(build_personal_report_request(1, 2020, 2021)), winery=1, winery_name="Winery", year_from=2020, year_to=2021, data_version="version",
+        )
+
+        settings_override = override_settings(MEDIA_ROOT=directory.name, PERSONAL_REPORT_EXECUTOR="threads")
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        # Threads of the pool would use separate connections to the test database.
+        for patcher in (
+            mock.patch("generator.tasks.execute", lambda function, arguments, quota: (function(*args) for args in arguments)),
+            mock.patch("generator.tasks.get_personal_report_subsections", lambda request: [(weight, "section", subsection, FakeReport(subsection, self.renders)) for weight, subsection in enumerate(self.SUBSECTIONS)]),
+            mock.patch("generator.tasks.get_report", lambda request, section, subsection: FakeReport(subsection, self.renders)),
+            mock.patch("generator.tasks.generating_batch_pdf_report", side_effect=self.generate_pdf),
+            mock.patch("celery.utils.functional.logger"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def generate_pdf(self, paths, output_path):
+        if self.pdf_error is not None:
+            raise self.pdf_error
+        document = ""
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as file:
+                document += file.read()
+        self.documents.append(document)
+        with open(output_path, "w", encoding="utf-8") as file:
+            file.write(document)
+
+    def apply(self, signature: Signature) -> EagerResult:
+        # Celery logs the outcome of the task.
+        with self.assertLogs("celery.app.trace"):
+            return signature.apply(throw=False)
+
+    def generate(self) -> EagerResult:
+        with self.assertLogs("generator.tasks"):
+            return self.apply(generate_personal_report.s(str(self.task.id)))
+
+    def test_converts_all_subsections_by_single_pdf_run(self):
+        self.assertTrue(self.generate().successful())
+
+        self.assertEqual(self.documents, ["<p>first</p><p>second</p><p>third</p>"])
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.status, self.task.current, self.task.total), (TaskStatus.FINISHED, 3, 3))
+        with self.task.file.open("r") as file:
+            self.assertEqual(file.read(), self.documents[0])
+        self.assertFalse(TaskSubsection.objects.exists())
+
+    def test_resumed_task_renders_only_missing_subsections(self):
+        self.pdf_error = OSError("wkhtmltopdf has failed")
+        self.assertTrue(self.generate().failed())
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.status, TaskStatus.FAILED)
+        self.assertEqual(set(TaskSubsection.objects.values_list("subsection", flat=True)), set(self.SUBSECTIONS))
+
+        TaskSubsection.objects.get(subsection="second").delete()
+        self.renders.clear()
+        self.pdf_error = None
+        self.assertTrue(self.generate().successful())
+
+        self.assertEqual(self.renders, ["second"])
+        self.assertEqual(self.documents, ["<p>first</p><p>second</p><p>third</p>"])
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.status, self.task.current, self.task.total), (TaskStatus.FINISHED, 3, 3))
+        self.assertFalse(TaskSubsection.objects.exists())
+
+    def test_batch_shares_query_results_across_wineries(self):
+        reports = []
+
+        def get_subsections(request):
+            subsections = [(weight, "section", subsection, FakeReport(subsection, self.renders)) for weight, subsection in enumerate(self.SUBSECTIONS)]
+            for _, _, _, report in subsections:
+                report.shared_results = None
+                reports.append(report)
+            return subsections
+
+        other = Task.objects.create(
+            request=serialize_request(build_personal_report_request(2, 2020, 2021)), winery=2, winery_name="Other", year_from=2020, year_to=2021, data_version="version",
+        )
+        with mock.patch("generator.tasks.get_personal_report_subsections", get_subsections), \
+                self.assertLogs("generator.tasks"), self.assertLogs("generator.batch") as logs:
+            result = self.apply(generate_personal_reports.s([str(self.task.id), str(other.id)]))
+
+        self.assertEqual((result.get()["wineries"], result.get()["finished"]), (2, 2))
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(len(reports), 6)
+        self.assertIsInstance(reports[0].shared_results, SharedQueryResults)
+        self.assertTrue(all(report.shared_results is reports[0].shared_results for report in reports))
+        self.assertEqual(len(self.documents), 2)
+        self.assertEqual(set(Task.objects.values_list("status", flat=True)), {TaskStatus.FINISHED})
+
+    def test_chord_renders_subsections_as_separate_tasks(self):
+        with override_settings(PERSONAL_REPORT_EXECUTOR="celery"), mock.patch("generator.tasks.chord") as chord:
+            self.assertTrue(self.generate().successful())
+        header = list(chord.call_args.args[0])
+        callback = chord.return_value.call_args.args[0]
+        self.assertEqual(self.renders, [])
+        self.assertEqual(sorted(signature.args[3] for signature in header), [0, 1, 2])
+
+        results = [self.apply(signature).get() for signature in header]
+        self.assertEqual(sorted(self.renders), sorted(self.SUBSECTIONS))
+        self.assertEqual(self.documents, [])
+        with self.assertLogs("generator.tasks"):
+            self.assertTrue(self.apply(callback.clone(args=(results, ))).successful())
+
+        self.assertEqual(self.documents, ["<p>first</p><p>second</p><p>third</p>"])
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.status, self.task.current), (TaskStatus.FINISHED, 3))
+        self.assertFalse(TaskSubsection.objects.exists())
+
+
+class ReportGenerationTaskTest(GustosTestCase, TestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(Task, "clean", autospec=True, side_effect=lambda task: setattr(task, "winery_name", "Winery"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.report = PersonalWineryReport(build_personal_report_request(1, 2020, 2021))
+
+    def test_reuses_tasks_of_same_data_version(self):
+        task, started = self.report.get_report_generation_task("version")
+        self.assertTrue(started)
+        self.assertEqual(self.report.get_report_generation_task("version"), (task, False))
+
+        Task.objects.filter(id=task.id).update(status=TaskStatus.FINISHED)
+        self.assertEqual(self.report.get_report_generation_task("version"), (task, False))
+
+        other_task, started = self.report.get_report_generation_task("other")
+        self.assertTrue(started)
+        self.assertNotEqual(other_task, task)
+
+    def test_resumes_failed_and_stale_tasks_once(self):
+        task, _ = self.report.get_report_generation_task("version")
+
+        Task.objects.filter(id=task.id).update(status=TaskStatus.FAILED)
+        self.assertEqual(self.report.get_report_generation_task("version"), (task, True))
+        self.assertEqual(self.report.get_report_generation_task("version"), (task, False))
+
+        Task.objects.filter(id=task.id).update(status=TaskStatus.IN_PROGRESS, updated=timezone.now() - timedelta(seconds=settings.PERSONAL_REPORT_TASK_TIMEOUT + 1))
+        resumed_task, started = self.report.get_report_generation_task("version")
+        self.assertEqual((resumed_task, started, resumed_task.status), (task, True, TaskStatus.PENDING))
+        self.assertEqual(self.report.get_report_generation_task("version"), (task, False))
+        self.assertEqual(Task.objects.count(), 1)
+
+    def test_concurrently_created_task_is_reused(self):
+        task, _ = self.report.get_report_generation_task("version")
+
+        # The other request has not found the task yet when it is created.
+        with mock.patch("django.db.models.query.QuerySet.first", return_value=None):
+            self.assertEqual(self.report.get_report_generation_task("version"), (task, False))
+        self.assertEqual(Task.objects.count(), 1)
+
+
+@override_settings(RANKING_SNAPSHOT_RETRY_DELAY=600)
+class RankingSnapshotTest(GustosTestCase, TestCase):
+    def setUp(self):
+        super().setUp()
+        # Celery logs the signature of the task the first time its "delay" method is patched.
+        for patcher in (mock.patch.object(QueryCache, "get_version", return_value="version"), mock.patch("celery.utils.functional.logger")):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.report = RatingReport()
+
+    @override_settings(RANKING_SNAPSHOT_BATCH_SIZE=2)
+    def test_stores_rows_in_batches(self):
+        with mock.patch("generator.tasks.refresh_ranking_snapshot.delay"):
+            snapshot = get_ranking_snapshot(self.report)
+
+        self.assertEqual(materialize_ranking_snapshot(snapshot, self.report.get_query(), self.report.get_rating_arguments()), 6)
+        self.assertEqual(snapshot.status, RankingSnapshotStatus.FINISHED)
+        # The first row, the entity, its world neighbours 11 and 14 and its continent neighbour 12.
+        self.assertEqual(lookup_ranking_rows(snapshot, self.report.get_rating_arguments()), self.report.ROWS[:5])
+        self.assertIsNotNone(get_ranking_rows(self.report, self.report.get_rating_arguments()))
+
+    def test_rendering_does_not_create_snapshots(self):
+        self.assertIsNone(get_ranking_rows(self.report, self.report.get_rating_arguments()))
+        self.assertFalse(RankingSnapshot.objects.exists())
+
+    def test_failed_refresh_is_retried_after_delay(self):
+        with mock.patch("generator.tasks.refresh_ranking_snapshot.delay", side_effect=ConnectionError("broker")) as delay, \
+                self.assertLogs("generator.utils.rankings", "WARNING") as logs:
+            snapshot = get_ranking_snapshot(self.report)
+        self.assertEqual(delay.call_count, 1)
+        self.assertEqual(logs.output, ["WARNING:generator.utils.rankings:Refresh of the ranking snapshot of RatingReport cannot be enqueued: broker"])
+        self.assertEqual(snapshot.status, RankingSnapshotStatus.FAILED)
+
+        with mock.patch("generator.tasks.refresh_ranking_snapshot.delay") as delay:
+            self.assertEqual(get_ranking_snapshot(self.report).status, RankingSnapshotStatus.FAILED)
+            RankingSnapshot.objects.update(retry_after=timezone.now())
+            self.assertEqual(get_ranking_snapshot(self.report).status, RankingSnapshotStatus.IN_PROGRESS)
+            self.assertEqual(get_ranking_snapshot(self.report).status, RankingSnapshotStatus.IN_PROGRESS)
+        self.assertEqual(delay.call_count, 1)
+
+        fail_ranking_snapshot(RankingSnapshot.objects.get())
+        self.assertIsNone(get_ranking_rows(self.report, self.report.get_rating_arguments()))
+
+
+class WineryRatingReport(TableWineryReport):
+    """
+    Ranks wineries by their "uid" column, the same way as the rating queries of table winery reports.
+    """
+
+    parameter_title = "Rating"
+
+    def get_query(self):
+        winery = gustos_models.winery
+        continent = case((winery.c.country < 3, 1), (winery.c.country < 6, 2), else_=None)
+        return select(
+            func.rank().over(order_by=winery.c.uid.desc()).label("world_rank"),
+            func.percent_rank().over(order_by=winery.c.uid.desc()).label("world_percent_rank"),
+            func.rank().over(order_by=winery.c.uid.desc(), partition_by=continent).label("continent_rank"),
+            func.percent_rank().over(order_by=winery.c.uid.desc(), partition_by=continent).label("continent_percent_rank"),
+            continent.label("continent_id"),
+            func.rank().over(order_by=winery.c.uid.desc(), partition_by=winery.c.country).label("country_rank"),
+            func.percent_rank().over(order_by=winery.c.uid.desc(), partition_by=winery.c.country).label("country_percent_rank"),
+            winery.c.country.label("country_id"),
+            winery.c.name.label("entity_name"),
+            winery.c.uid.label("entity_value"),
+            winery.c.id.label("entity_id"),
+            func.row_number().over(order_by=(winery.c.uid.desc(), winery.c.name, winery.c.id)).label("position"),
+        ).order_by(winery.c.uid.desc(), winery.c.name, winery.c.id)
+
+    def format_entity_name(self, name):
+        return name
+
+    def format_entity_value(self, value):
+        return value
+
+    def get_template_kwargs(self):
+        return {}
+
+    def get_rating_indices(self):
+        return 0, 1, 2, 3, 4, self.continent_id, 5, 6, 7, self.country_id, 8, 9, 10, self.winery_id
+
+    def render(self, throw_exception=False):
+        return None
+
+
+@override_settings(RANKING_SNAPSHOTS=False)
+class NeighbourQueryTest(GustosTestCase):
+    def get_ratings(self, winery_id: int, country_id: int | None) -> Dict[str, Any] | None:
+        report = WineryRatingReport(build_personal_report_request(winery_id, 2020, 2022))
+        report.country_id = country_id
+        report.continent_id = None if country_id is None else 1 if country_id < 3 else 2 if country_id < 6 else None
+        try:
+            with self.engine.connect() as connection:
+                report.fill_ratings(connection)
+        except DataNotFoundException:
+            return None
+        return {**report.to_template_kwargs(), "percent_ranks": (report.world_percent_rank, report.continent_percent_rank, report.country_percent_rank)}
+
+    def test_neighbour_query_finds_the_same_ratings_as_the_whole_ranking(self):
+        for seed in range(10):
+            randomizer = random.Random(seed)
+            countries = {winery_id: randomizer.choice((None, 1, 2, 3, 4, 5, 6, 7)) for winery_id in range(1, randomizer.randint(1, 40))}
+            with self.engine.begin() as connection:
+                connection.execute(gustos_models.winery.delete())
+                for winery_id, country_id in countries.items():
+                    # Few distinct values make many ties of ranks.
+                    connection.execute(insert(gustos_models.winery).values(
+                        id=winery_id, uid=randomizer.randint(0, 5), name=f"Winery {randomizer.randint(1, 9)}", country=country_id, phone="", created=0, updated=0,
+                    ))
+
+            for winery_id, country_id in countries.items():
+                with self.subTest(seed=seed, winery_id=winery_id):
+                    with override_settings(RATING_NEIGHBOUR_QUERIES=False):
+                        expected = self.get_ratings(winery_id, country_id)
+                    with override_settings(RATING_NEIGHBOUR_QUERIES=True):
+                        self.assertEqual(self.get_ratings(winery_id, country_id), expected)
+                    self.assertIsNotNone(expected)
+
+
+@override_settings(QUERY_CACHE_SIZE=0)
+class AwardFactFrameTest(GustosTestCase):
+    def setUp(self):
+        super().setUp()
+        self.insert_awards()
+        ReportRegistry.load()
+
+    def render(self, report_class: type, award_facts: AwardFacts | None, **values) -> Report:
+        report = self.build_report(report_class, **values)
+        report.award_facts = award_facts
+        report.render()
+        return report
+
+    def assertSameReport(self, actual: Report, expected: Report):
+        if isinstance(expected, TopWineriesReport):
+            # Wineries with the same value may be ordered differently.
+            self.assertCountEqual(actual.top_wineries, expected.top_wineries)
+        elif isinstance(expected, ContinentsTabReport):
+            for continent in Continent:
+                name = continent.name.lower()
+                self.assertEqual(getattr(actual, f"{name}_tab"), getattr(expected, f"{name}_tab"))
+                # Tab titles may differ if several rows have the same value.
+                self.assertEqual(getattr(actual, f"{name}_tab_name") is None, getattr(expected, f"{name}_tab_name") is None)
+        else:
+            self.assertEqual(actual.to_template_kwargs(), expected.to_template_kwargs())
+
+    def test_frames_compute_the_same_rows_as_queries(self):
+        report_classes = [
+            report_class for _, report_class in sorted(ReportRegistry.reports.items())
+            if issubclass(report_class, (ContinentsTabReport, ContinentsValueReport, TopWineriesReport))
+        ]
+        self.assertTrue(report_classes)
+
+        award_facts = AwardFacts()
+        for report_class in report_classes:
+            continents = list(Continent) if issubclass(report_class, ContinentReport) else [None]
+            for continent in continents:
+                values = {} if continent is None else {"continent": continent.value}
+                with self.subTest(report=report_class.__name__, **values):
+                    expected = self.render(report_class, None, **values)
+                    self.assertSameReport(self.render(report_class, award_facts, **values), expected)
+
+
+@skipUnless(all(importlib.util.find_spec(name) for name in ("duckdb", "duckdb_engine", "pyarrow")), "DuckDB is not installed.")
+@override_settings(QUERY_CACHE_SIZE=0, WINE_ENTITY_FACTS_SCHEMA="")
+class SnapshotTest(GustosTestCase):
+    REPORTS = (
+        (ByWineNumberWineryReport, {"winery": 1}),
+        (ByAwardNumberWineryReport, {"winery": 2}),
+        (ByEventNumberWineryReport, {"winery": 3}),
+        (TopWineriesInTheWorldByMedalCount, {}),
+        (WhiteWinesGlobalParticipantsMedalsAndAwardedWines, {}),
+    )
+    """Reports rendered from the exported snapshot, with parameters of their requests."""
+
+    def setUp(self):
+        super().setUp()
+        self.insert_awards()
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(GUSTOS_SNAPSHOT_DIR=directory.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def export_snapshot(self):
+        # SQLite has no REPEATABLE READ isolation level of exports, its SERIALIZABLE one is used instead. The in-memory
+        # database must outlive the export, which disposes its engine.
+        isolation_levels = {**self.engine.dialect._isolation_lookup, "REPEATABLE READ": 0}
+        with mock.patch("generator.utils.snapshot.create_mysql_engine", return_value=self.engine), \
+                mock.patch.object(self.engine, "dispose"), \
+                mock.patch.object(self.engine.dialect, "_isolation_lookup", isolation_levels), \
+                self.assertLogs("generator.utils.snapshot", "INFO"):
+            return export_snapshot()
+
+    @staticmethod
+    def fetch_rows(report: Report) -> list:
+        """
+        :return: Sorted rows of the query of the report without positions, which differ between rows of the same value.
+        """
+        with Database().connect() as connection:
+            rows = connection.execute(report.get_query()).mappings().all()
+        return sorted((sorted((key, value) for key, value in row.items() if key != "position") for row in rows), key=repr)
+
+    def test_reports_read_exported_snapshot(self):
+        name, counts = self.export_snapshot()
+        self.assertEqual(counts["award"], 400)
+        self.assertEqual(counts["wine"], 120)
+
+        expected = {report_class: self.fetch_rows(self.build_report(report_class, **values)) for report_class, values in self.REPORTS}
+
+        snapshot_engine = create_snapshot_engine()
+        self.addCleanup(snapshot_engine.dispose)
+        with override_settings(GUSTOS_BACKEND="duckdb"), mock.patch.object(Database, "_Database__instance", snapshot_engine):
+            self.assertEqual(get_data_version(), name)
+            for report_class, values in self.REPORTS:
+                with self.subTest(report=report_class.__name__):
+                    self.assertTrue(expected[report_class])
+                    self.assertEqual(self.fetch_rows(self.build_report(report_class, **values)), expected[report_class])
+                    self.assertTrue(self.build_report(report_class, **values).render())
@@ -0,0 +1,366 @@
+import threading
+from typing import Any, Dict, List, Sequence, Tuple, TYPE_CHECKING
+
+from django.conf import settings
+from sqlalchemy import func, Integer, select
+
+from generator.enum import BeverageType, GrapeVariety, WineColor, WineType
+from generator.utils.database import Database
+from gustos.models import (
+    award, award_wine_entity,
+    event, file_managed,
+    taxonomy_term, wine,
+    wine_entity, wine_grapes,
+    winery,
+)
+
+# Dataframe libraries are imported when a frame is loaded.
+if TYPE_CHECKING:
+    import pandas as pd
+
+CATEGORICAL_COLUMNS = (
+    "winery_name", "winery_country_name", "winery_logo_uri",
+    "beverage_type", "color", "co2",
+    "continent", "winery_continent",
+)
+"""Columns with few distinct values, which are stored as categorical codes."""
+
+
+def award_facts_enabled() -> bool:
+    """
+    :return: Whether report generation tasks compute aggregates of awards from award fact frames.
+    """
+    return settings.AWARD_FACT_FRAMES
+
+
+def to_python(value: Any) -> Any:
+    """
+    :return: Value of a frame converted to the type of the same value of a query result.
+    """
+    import pandas as pd
+
+    if pd.isna(value):
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+
+def to_values(values: Tuple[Any, ...] | Any, enum: type) -> Tuple[Any, ...]:
+    """
+    :return: Values of the filter of "Report.build_query_for_wine_entity".
+    """
+    if not isinstance(values, Sequence):
+        values = (values,)
+    return tuple((v.value if isinstance(v, enum) else v for v in values))
+
+
+class AwardFactFrame:
+    """
+    Awards of wine entities of a year range loaded into a columnar frame.
+
+    The frame contains one row per award of a wine entity in the year range, the same rows as the join of
+    "award_wine_entity", "award", "event", "wine_entity", "wine" and "winery" tables which queries of reports reduce,
+    so their aggregates are computed by vectorized groupby operations instead of separate queries.
+    """
+
+    def __init__(self, awards: "pd.DataFrame", grapes: "pd.DataFrame"):
+        """
+        :param awards: Awards of wine entities.
+        :param grapes: Grapes of the wine entities.
+        """
+        self.awards = awards
+        self.grapes = grapes
+
+    @staticmethod
+    def load(year_from: int, year_to: int) -> "AwardFactFrame":
+        """
+        Loads awards of the year range from Gustos database.
+
+        :param year_from: Start of the year range.
+        :param year_to: End of the year range.
+
+        :return: Frame of awards.
+        """
+        import pandas as pd
+
+        from generator.reports.report import Report
+
+        wg = select(
+            wine_grapes.c.wine_entity,
+            func.max(wine_grapes.c.percent).label("max_grape_percent"),
+        ).group_by(wine_grapes.c.wine_entity).subquery("wg")
+        winery_country = taxonomy_term.alias("winery_country")
+
+        awards_query = select(
+            award_wine_entity.c.award_id,
+            award_wine_entity.c.wine_entity_id,
+            wine_entity.c.vintage,
+            wine_entity.c.region.label("region_id"),
+            wine.c.country.label("wine_country_id"),
+            winery.c.id.label("winery_id"),
+            winery.c.name.label("winery_name"),
+            winery.c.country.label("winery_country_id"),
+            winery_country.c.name.label("winery_country_name"),
+            file_managed.c.uri.label("winery_logo_uri"),
+            func.json_value(wine.c.category, "$.beverageType").cast(Integer).label("beverage_type"),
+            func.json_value(wine.c.category, "$.color").cast(Integer).label("color"),
+            func.json_value(wine.c.category, "$.co2").cast(Integer).label("co2"),
+            wg.c.max_grape_percent,
+        ).select_from(award_wine_entity) \
+            .join(award, award.c.id == award_wine_entity.c.award_id) \
+            .join(event, event.c.id == award.c.event_id) \
+            .join(wine_entity, wine_entity.c.id == award_wine_entity.c.wine_entity_id) \
+            .join(wine, wine.c.id == wine_entity.c.wine) \
+            .outerjoin(winery, winery.c.id == wine.c.winery) \
+            .outerjoin(winery_country, winery_country.c.tid == winery.c.country) \
+            .outerjoin(file_managed, file_managed.c.fid == winery.c.logo) \
+            .outerjoin(wg, wg.c.wine_entity == wine_entity.c.id) \
+            .where(event.c.year.between(year_from, year_to))
+
+        awarded = select(award_wine_entity.c.wine_entity_id) \
+            .join(award, award.c.id == award_wine_entity.c.award_id) \
+            .join(event, event.c.id == award.c.event_id) \
+            .where(event.c.year.between(year_from, year_to))
+        grapes_query = select(
+            wine_grapes.c.wine_entity.label("wine_entity_id"),
+            wine_grapes.c.grape,
+            taxonomy_term.c.name.label("grape_name"),
+        ).select_from(wine_grapes) \
+            .outerjoin(taxonomy_term, taxonomy_term.c.tid == wine_grapes.c.grape) \
+            .where(wine_grapes.c.wine_entity.in_(awarded))
+
+        with Database().connect() as connection:
+            result = connection.execute(awards_query)
+            awards = pd.DataFrame(result.fetchall(), columns=list(result.keys()))
+            result = connection.execute(grapes_query)
+            grapes = pd.DataFrame(result.fetchall(), columns=list(result.keys()))
+
+        continents = Report.get_country_continents()
+        awards["continent"] = awards["wine_country_id"].map(continents)
+        awards["winery_continent"] = awards["winery_country_id"].map(continents)
+
+        for column in CATEGORICAL_COLUMNS:
+            awards[column] = awards[column].astype("category")
+
+        return AwardFactFrame(awards, grapes)
+
+    def select_wine_entities(
+            self,
+            wine_color: Tuple[WineColor, ...] | WineColor = None,
+            wine_type: Tuple[WineType, ...] | WineType = None,
+            grape_variety: GrapeVariety = None,
+    ) -> "pd.DataFrame":
+        """
+        Returns awards of wine entities which "Report.build_query_for_wine_entity" selects by the same filters.
+        """
+        awards = self.awards
+        mask = awards["beverage_type"] == BeverageType.WINE
+
+        if wine_color is not None:
+            wine_color = to_values(wine_color, WineColor)
+            if len(wine_color) > 0:
+                mask &= awards["color"].isin(wine_color)
+
+        if wine_type is not None:
+            wine_type = to_values(wine_type, WineType)
+            if len(wine_type) > 0:
+                mask &= awards["co2"].isin(wine_type)
+
+        if grape_variety is not None:
+            if grape_variety == GrapeVariety.SINGLE:
+                mask &= awards["max_grape_percent"] > 85
+            else:
+                mask &= awards["max_grape_percent"] <= 85
+
+        return awards[mask]
+
+    def count_wineries_medals_wines_by_continent(
+            self,
+            continent_column_name: str,
+            wine_color: Tuple[WineColor, ...] | WineColor = None,
+            wine_type: Tuple[WineType, ...] | WineType = None,
+            grape_variety: GrapeVariety = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregates of "ContinentsTabReport.build_query_for_count_wineries_medals_wines_by_continent".
+        """
+        awards = self.select_wine_entities(wine_color, wine_type, grape_variety)
+        awards = awards[awards["winery_country_id"].notna()]
+
+        groups = awards.groupby("winery_continent", dropna=False, observed=True)
+        wineries = groups["winery_id"].nunique()
+        wines = groups["wine_entity_id"].nunique()
+        medals = groups["award_id"].count()
+
+        return [
+            {
+                "MANUFACTURES": to_python(wineries[continent]),
+                "MEDAL WINES": to_python(wines[continent]),
+                "MEDALS": to_python(medals[continent]),
+                continent_column_name: to_python(continent),
+            }
+            for continent in medals.index
+        ]
+
+    def best_grape_varieties_by_continent(
+            self,
+            tab_title_column_name: str,
+            continent_column_name: str,
+            wine_color: Tuple[WineColor, ...] | WineColor = None,
+            wine_type: Tuple[WineType, ...] | WineType = None,
+            grape_variety: GrapeVariety = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregates of "ContinentsTabReport.build_query_for_best_grape_varieties_by_continent".
+        """
+        awards = self.select_wine_entities(wine_color, wine_type, grape_variety)
+        awards = awards[["award_id", "wine_entity_id", "continent"]] \
+            .merge(self.grapes[self.grapes["grape_name"].notna()], on="wine_entity_id")
+
+        counts = awards.groupby(["continent", "grape"], dropna=False, observed=True) \
+            .agg(name=("grape_name", "first"), medals=("award_id", "count")) \
+            .reset_index()
+        return self.get_first_positions(counts, tab_title_column_name, continent_column_name)
+
+    def most_awarded_vintage_by_continent(
+            self,
+            tab_title_column_name: str,
+            continent_column_name: str,
+            wine_color: Tuple[WineColor, ...] | WineColor = None,
+            wine_type: Tuple[WineType, ...] | WineType = None,
+            grape_variety: GrapeVariety = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregates of "ContinentsTabReport.build_query_for_most_awarded_vintage_by_continent".
+        """
+        awards = self.select_wine_entities(wine_color, wine_type, grape_variety)
+
+        counts = awards.groupby(["continent", "vintage"], dropna=False, observed=True) \
+            .agg(medals=("award_id", "count")) \
+            .reset_index()
+        counts["name"] = counts["vintage"]
+        return self.get_first_positions(counts, tab_title_column_name, continent_column_name)
+
+    @staticmethod
+    def get_first_positions(counts: "pd.DataFrame", tab_title_column_name: str, continent_column_name: str) -> List[Dict[str, Any]]:
+        """
+        :param counts: "name", "medals" and "continent" columns.
+
+        :return: Rows with the most medals of each continent, all of them in case of a tie like RANK() window.
+        """
+        if counts.empty:
+            return []
+
+        counts["continent"] = counts["continent"].astype(object)
+        best = counts["medals"] == counts.groupby("continent", dropna=False)["medals"].transform("max")
+        return [
+            {
+                tab_title_column_name: to_python(row.name),
+                "MEDALS": to_python(row.medals),
+                continent_column_name: to_python(row.continent),
+            }
+            for row in counts[best].itertuples(index=False)
+        ]
+
+    def top_wineries_by_medal_count(
+            self,
+            winery_column_name: str,
+            image_column_name: str,
+            country_column_name: str,
+            value_column_name: str,
+            countries_ids: List[int] | Tuple[int] | int | None = None,
+            wine_color: Tuple[WineColor, ...] | WineColor = None,
+            wine_type: Tuple[WineType, ...] | WineType = None,
+            grape_variety: GrapeVariety = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregates of "TopWineriesReport.build_query_for_top_wineries_by_medal_count".
+        """
+        awards = self.select_wine_entities(wine_color, wine_type, grape_variety)
+        awards = awards[awards["winery_country_name"].notna()]
+        if countries_ids is not None:
+            if not isinstance(countries_ids, Sequence):
+                countries_ids = (countries_ids,)
+            awards = awards[awards["winery_country_id"].isin(countries_ids)]
+
+        wineries = awards.groupby("winery_id").agg(
+            name=("winery_name", "first"),
+            country=("winery_country_name", "first"),
+            uri=("winery_logo_uri", "first"),
+            value=("award_id", "count"),
+        )
+        wineries = wineries[wineries["value"].rank(method="min", ascending=False) <= 8] \
+            .sort_values("value", ascending=False, kind="stable")
+
+        rows = []
+        for row in wineries.itertuples(index=False):
+            uri = to_python(row.uri)
+            rows.append({
+                winery_column_name: row.name,
+                image_column_name: f"https://gustos.local/files/{uri[len('public://'):]}" if uri is not None and uri.startswith("public://") else None,
+                country_column_name: row.country,
+                value_column_name: to_python(row.value),
+            })
+        return rows
+
+    def count_grape_varieties_by_continent(self, value_column_name: str, continent_column_name: str) -> List[Dict[str, Any]]:
+        """
+        Returns numbers of distinct grapes of awarded wine entities by continents.
+        """
+        entities = self.select_wine_entities()[["wine_entity_id", "continent"]].drop_duplicates()
+        grapes = entities.merge(self.grapes, on="wine_entity_id") \
+            .groupby("continent", dropna=False, observed=True)["grape"] \
+            .nunique()
+        return [
+            {
+                value_column_name: to_python(count),
+                continent_column_name: to_python(continent),
+            }
+            for continent, count in grapes.items()
+        ]
+
+    def count_medals(self, by: str, **conditions: Any) -> List[int]:
+        """
+        Returns numbers of medals of wineries or wine entities.
+
+        :param by: "winery_id" or "wine_entity_id" column.
+        :param conditions: Values of columns, e.g. "region_id" or "winery_country_id", which awards must have.
+
+        :return: Numbers of medals.
+        """
+        awards = self.awards[self.awards["winery_id"].notna()]
+        for column, value in conditions.items():
+            awards = awards[awards[column] == value]
+        return [int(count) for count in awards.groupby(by).size()]
+
+
+class AwardFacts:
+    """
+    Award fact frames of a report generation task by year ranges.
+
+    Each frame is loaded once, threads which request a frame being loaded wait for it.
+    """
+
+    def __init__(self):
+        self.frames: Dict[Tuple[int, int], AwardFactFrame] = {}
+        self.locks: Dict[Tuple[int, int], threading.Lock] = {}
+        self.lock = threading.Lock()
+
+    def get(self, year_from: int, year_to: int) -> AwardFactFrame:
+        """
+        :return: Frame of awards of the year range.
+        """
+        key = (year_from, year_to)
+        with self.lock:
+            key_lock = self.locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            frame = self.frames.get(key)
+            if frame is None:
+                frame = AwardFactFrame.load(year_from, year_to)
+                self.frames[key] = frame
+
+        return frame
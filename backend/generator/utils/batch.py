@@ -0,0 +1,118 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Sequence
+
+from django.conf import settings
+from django.http import HttpRequest, QueryDict
+from django.urls import resolve, reverse
+from sqlalchemy import Connection, Select
+
+
+class RowsResult:
+    """
+    Fetched rows of a query result, which can be consumed like a "CursorResult" by "fetchone" calls and iteration.
+    """
+
+    def __init__(self, rows: Sequence[Any]):
+        self.rows = iter(rows)
+
+    def fetchone(self):
+        return next(self.rows, None)
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def __iter__(self):
+        return self.rows
+
+
+class SharedQueryResults:
+    """
+    Rows of queries which do not depend on the winery and are shared by personal reports of many wineries.
+
+    Each query is executed once, threads which request a query being executed wait for its rows. Only rows of the
+    most recently used queries are kept, so a long batch does not hold rows of all queries it has executed.
+    """
+
+    def __init__(self, size: int = None):
+        """
+        :param size: Maximum number of queries whose rows are kept, SHARED_QUERY_RESULTS_SIZE setting by default.
+        """
+        self.size = size if size is not None else settings.SHARED_QUERY_RESULTS_SIZE
+        self.results: OrderedDict = OrderedDict()
+        """Rows by keys of queries, the least recently used ones first."""
+        self.locks: Dict[str, threading.Lock] = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def execute(self, connection: Connection, query: Select) -> RowsResult:
+        """
+        Executes the query or returns rows of the same query executed before.
+
+        :param connection: Connection to Gustos database.
+        :param query: Query to execute.
+
+        :return: Rows of the query.
+        """
+        compiled = query.compile(connection)
+        key = f"{compiled}:{sorted(compiled.params.items(), key=lambda x: x[0])}"
+
+        with self.lock:
+            key_lock = self.locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self.lock:
+                rows = self.results.get(key)
+                if rows is not None:
+                    self.results.move_to_end(key)
+                    self.hits += 1
+            if rows is None:
+                rows = connection.execute(query).fetchall()
+                with self.lock:
+                    self.results[key] = rows
+                    while len(self.results) > self.size:
+                        evicted, _ = self.results.popitem(last=False)
+                        # Locks of queries being executed are still held by their threads.
+                        if evicted != key:
+                            self.locks.pop(evicted, None)
+                    self.misses += 1
+
+        return RowsResult(rows)
+
+
+def build_report_request(path: str, values: Dict[str, Any]) -> HttpRequest:
+    """
+    Builds a POST request of a report form, so reports can be requested outside of views.
+
+    :param path: Path of the view of the form.
+    :param values: Values of fields of the form.
+
+    :return: Request object of Django framework.
+    """
+    request = HttpRequest()
+    request.method = "POST"
+    request.path = request.path_info = path
+    request.POST = QueryDict(mutable=True)
+    request.POST.update({name: str(value) for name, value in values.items()})
+    request.POST._mutable = False
+    request.resolver_match = resolve(request.path)
+    request.user = None
+    return request
+
+
+def build_personal_report_request(winery_id: int, year_from: int, year_to: int) -> HttpRequest:
+    """
+    Builds a request of the personal report form, so personal reports can be requested outside of views.
+
+    :param winery_id: Identifier of the winery.
+    :param year_from: Start of the year range.
+    :param year_to: End of the year range.
+
+    :return: Request object of Django framework.
+    """
+    return build_report_request(reverse("personal_report"), {
+        "winery": winery_id,
+        "year_from": year_from,
+        "year_to": year_to,
+    })
@@ -0,0 +1,145 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import Callable
+
+from django.conf import settings
+
+from generator.utils.formatting import format_entity_name
+
+# Global lock for matplotlib.
+# Charts are rendered in separate threads, but 'pyplot' is static class, so we need to lock the rendering process.
+pyplot_lock = threading.Lock()
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def use_chart_backend():
+    """
+    Selects the non-interactive backend of matplotlib.
+
+    Matplotlib is imported on the first use, so web and worker processes do not pay for it at startup.
+    """
+    import matplotlib as mpl
+
+    mpl.use("Agg")
+
+
+def get_pyplot():
+    """
+    Imports pyplot with the non-interactive backend.
+
+    :return: "matplotlib.pyplot" module.
+    """
+    use_chart_backend()
+
+    from matplotlib import pyplot as plt
+
+    return plt
+
+
+def _initialize_chart_process():
+    """
+    Warms up a chart rendering process, so the first chart does not pay for the backend and font cache initialization.
+    """
+    render_pie_chart(1, "r")
+
+
+def get_chart_executor() -> ProcessPoolExecutor | None:
+    """
+    Returns the process-wide pool of chart rendering processes.
+
+    The pool is created lazily, so each Celery worker process gets its own one. Processes are spawned (not forked)
+    because the parent process is multithreaded.
+
+    :return: Process pool executor or None if rendering in separate processes is disabled.
+    """
+    global _executor
+
+    if settings.CHART_PROCESS_POOL_SIZE <= 0:
+        return None
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.CHART_PROCESS_POOL_SIZE,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize_chart_process,
+            )
+        return _executor
+
+
+def shutdown_chart_executor():
+    """
+    Stops the chart rendering processes.
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True, cancel_futures=True)
+            _executor = None
+
+
+def render_chart(function: Callable[..., bytes], *args) -> bytes:
+    """
+    Renders a chart either in the pool of chart rendering processes or in the current thread.
+
+    :param function: Module-level function which renders a chart and returns its PNG image.
+    :param args: Arguments to pass to the function.
+
+    :return: PNG image.
+    """
+    executor = get_chart_executor()
+    if executor is None:
+        with pyplot_lock:
+            return function(*args)
+    return executor.submit(function, *args).result()
+
+
+def render_bars(a, b, winery: str, country_or_region: str) -> bytes:
+    """
+    Renders two bars chart which compares the winery with the country or region.
+    """
+    import numpy as np
+
+    plt = get_pyplot()
+
+    x = np.array([format_entity_name(winery), country_or_region])
+    y = np.array([a, b])
+
+    output = BytesIO()
+    plt.bar(x, y, color=("steelblue", "silver"))
+    plt.savefig(output, format="png")
+    plt.close()
+    return output.getvalue()
+
+
+def render_pie_chart(x: int, color: str) -> bytes:
+    """
+    Renders donut chart.
+
+    - x - count
+    - color - color for x ring sector
+    """
+    plt = get_pyplot()
+
+    # Dependencies
+    if x < 1:
+        x = 1
+    vals = [100 - x, x]
+    labels = ["", ""]
+
+    # Build chart
+    fig, ax = plt.subplots(figsize=(3, 3))
+    fig.subplots_adjust(left=-0.1, bottom=-0.1, right=1.1, top=1.1, wspace=2, hspace=2)
+    plt.text(0, 0, f"{x}%", horizontalalignment='center', verticalalignment='center', fontsize=30, color=color)
+    ax.pie(vals, labels=labels, wedgeprops=dict(width=0.35), colors=("#7e1538", color))
+
+    # Save chart
+    output = BytesIO()
+    plt.savefig(output, format="png")
+    plt.close()
+    return output.getvalue()
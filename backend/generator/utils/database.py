@@ -1,9 +1,21 @@
-from typing import Sequence, Tuple
+import logging
+import os
+import threading
+import time
+from hashlib import sha1
+from typing import Dict, Sequence, Tuple
 
 from django.conf import settings
-from sqlalchemy import create_engine, Engine, Select
+from sqlalchemy import Connection, create_engine, Engine, func, literal_column, QueuePool, Select, select, table, true
+from sqlalchemy.exc import TimeoutError
 from sqlalchemy.sql.elements import KeyedColumnElement
 
+from gustos.models import (
+    award, award_wine_entity, competition, event, file_managed, taxonomy_term, wine, wine_entity, wine_grapes, wine_gwmr, winery,
+)
+
+logger = logging.getLogger(__name__)
+
 
 def apply_range_filter(query: Select, column: Tuple[KeyedColumnElement, KeyedColumnElement] | KeyedColumnElement, value_range: Tuple[str | int, str | int]):
     if value_range is None:
@@ -26,16 +38,241 @@ def apply_range_filter(query: Select, column: Tuple[KeyedColumnElement, KeyedCol
             return query.where(column.between(value_from, value_to))
 
 
+class PoolMetrics:
+    """
+    Counters of checkouts of connections from the pool of Gustos database engine of the process.
+
+    A checkout is saturated if all connections allowed by GUSTOS_POOL_SIZE and GUSTOS_POOL_MAX_OVERFLOW settings are
+    checked out, so the thread waits until another thread returns a connection.
+    """
+
+    lock = threading.Lock()
+    checkouts = 0
+    saturated = 0
+    timeouts = 0
+    wait_total = 0.0
+    wait_max = 0.0
+    checked_out_max = 0
+
+    @staticmethod
+    def record(wait: float, saturated: bool, timeout: bool, checked_out: int):
+        with PoolMetrics.lock:
+            PoolMetrics.checkouts += 1
+            PoolMetrics.saturated += saturated
+            PoolMetrics.timeouts += timeout
+            PoolMetrics.wait_total += wait
+            PoolMetrics.wait_max = max(PoolMetrics.wait_max, wait)
+            PoolMetrics.checked_out_max = max(PoolMetrics.checked_out_max, checked_out)
+
+    @staticmethod
+    def get_stats() -> Dict[str, int | float]:
+        """
+        :return: Number of checkouts, saturated checkouts and timeouts, total and maximal wait time in seconds and
+            maximal number of connections checked out at the same time.
+        """
+        with PoolMetrics.lock:
+            return {
+                "checkouts": PoolMetrics.checkouts,
+                "saturated": PoolMetrics.saturated,
+                "timeouts": PoolMetrics.timeouts,
+                "wait_total": PoolMetrics.wait_total,
+                "wait_max": PoolMetrics.wait_max,
+                "checked_out_max": PoolMetrics.checked_out_max,
+                "capacity": settings.GUSTOS_POOL_SIZE + settings.GUSTOS_POOL_MAX_OVERFLOW,
+            }
+
+    @staticmethod
+    def log_stats():
+        """
+        Logs counters of checkouts of the process.
+        """
+        stats = PoolMetrics.get_stats()
+        if stats["checkouts"] > 0:
+            logger.info(
+                "Gustos database pool: %(checkouts)s checkouts, %(saturated)s saturated, %(timeouts)s timed out, "
+                "waited %(wait_total).2f s in total and %(wait_max).2f s at most, "
+                "%(checked_out_max)s of %(capacity)s connections checked out at most." % stats
+            )
+
+
+class MeasuredQueuePool(QueuePool):
+    """
+    Queue pool which measures how long threads wait for connections.
+
+    Checkouts are timed around the public "connect" method, which engines call for every connection, so the wait also
+    includes the test of the connection if GUSTOS_POOL_PRE_PING setting is enabled.
+    """
+
+    def __init__(self, creator, pool_size: int = 5, max_overflow: int = 10, **kwargs):
+        # A negative overflow means that the number of connections is not limited.
+        self.capacity = pool_size + max_overflow if max_overflow > -1 else None
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kwargs)
+
+    def connect(self):
+        saturated = self.capacity is not None and self.checkedout() >= self.capacity
+        started = time.perf_counter()
+        timeout = False
+        try:
+            return super().connect()
+        except TimeoutError:
+            timeout = True
+            raise
+        finally:
+            PoolMetrics.record(time.perf_counter() - started, saturated, timeout, self.checkedout())
+
+
+def create_mysql_engine() -> Engine:
+    """
+    :return: Engine of the Gustos database server.
+    """
+    return create_engine(
+        "mysql+mysqldb://{user}:{password}@{host}:{port}/{database}?charset=utf8mb4".format(
+            host=settings.DATABASES['gustos']['HOST'],
+            port=settings.DATABASES['gustos']['PORT'],
+            database=settings.DATABASES['gustos']['NAME'],
+            user=settings.DATABASES['gustos']['USER'],
+            password=settings.DATABASES['gustos']['PASSWORD'],
+        ),
+        poolclass=MeasuredQueuePool,
+        pool_size=settings.GUSTOS_POOL_SIZE,
+        max_overflow=settings.GUSTOS_POOL_MAX_OVERFLOW,
+        pool_timeout=settings.GUSTOS_POOL_TIMEOUT,
+        pool_recycle=settings.GUSTOS_POOL_RECYCLE,
+        pool_pre_ping=settings.GUSTOS_POOL_PRE_PING,
+    )
+
+
 class Database:
     __instance: Engine = None
 
     def __new__(cls):
         if cls.__instance is None:
-            cls.__instance = create_engine("mysql+mysqldb://{user}:{password}@{host}:{port}/{database}?charset=utf8mb4".format(
-                host=settings.DATABASES['gustos']['HOST'],
-                port=settings.DATABASES['gustos']['PORT'],
-                database=settings.DATABASES['gustos']['NAME'],
-                user=settings.DATABASES['gustos']['USER'],
-                password=settings.DATABASES['gustos']['PASSWORD'],
-            ))
+            if settings.GUSTOS_BACKEND == "duckdb":
+                from generator.utils.snapshot import create_snapshot_engine
+
+                cls.__instance = create_snapshot_engine()
+            else:
+                cls.__instance = create_mysql_engine()
         return cls.__instance
+
+    @classmethod
+    def dispose(cls):
+        """
+        Drops the engine, so the next call creates a new one.
+
+        Connections inherited from the parent process are left open for the parent, a forked process must call it
+        before it uses the database.
+        """
+        if cls.__instance is not None:
+            cls.__instance.dispose(close=False)
+            cls.__instance = None
+
+
+# Columns of Gustos tables read by reports which change whenever a row of the table is added or changed.
+UPDATED_COLUMNS = (
+    award.c.updated,
+    event.c.updated,
+    competition.c.updated,
+    wine_entity.c.updated,
+    wine.c.updated,
+    winery.c.updated,
+    file_managed.c.timestamp,
+)
+# Gustos tables read by reports without such columns.
+CHECKSUM_TABLES = (award_wine_entity, wine_grapes, wine_gwmr, taxonomy_term)
+
+
+def build_data_version_query() -> Select:
+    """
+    :return: Query of change markers of all Gustos tables read by reports.
+    """
+    markers = []
+    for column in UPDATED_COLUMNS:
+        # The number of rows changes when rows are removed.
+        markers.append(select(func.max(column), func.count()).select_from(column.table).subquery())
+    for checksum_table in CHECKSUM_TABLES:
+        checksum = func.sum(func.crc32(func.concat_ws("|", *checksum_table.c)))
+        markers.append(select(checksum, func.count()).select_from(checksum_table).subquery())
+    query = select(*(column for marker in markers for column in marker.c)).select_from(markers[0])
+    for marker in markers[1:]:
+        # Every marker is a single row.
+        query = query.join(marker, true())
+    return query
+
+
+def get_gustos_data_version(connection: Connection) -> str:
+    """
+    Returns the version of Gustos tables read by reports.
+
+    The version changes whenever a row of any of them is added, changed or removed. Tables with "updated" column are
+    tracked by its maximum and the number of rows, other tables by the sum of CRC32 checksums of their rows, which reads
+    whole tables. If GUSTOS_DATA_VERSION_TABLE setting is set, the version is read from the table instead, which the
+    Gustos writer must update whenever it changes the data.
+
+    :param connection: Connection to the Gustos database.
+
+    :return: SHA1 hash of the version.
+    """
+    if settings.GUSTOS_DATA_VERSION_TABLE:
+        query = select(literal_column("*")).select_from(table(settings.GUSTOS_DATA_VERSION_TABLE))
+    else:
+        query = build_data_version_query()
+
+    version = connection.execute(query).fetchall()
+    return sha1("_".join(str(value) for row in version for value in row).encode()).hexdigest()
+
+
+class DataVersion:
+    """
+    Version of Gustos data last read by "get_data_version" without a connection.
+    """
+
+    lock = threading.Lock()
+    version: str = None
+    checked_at: float = None
+
+
+def get_data_version(connection: Connection = None) -> str:
+    """
+    Returns the version of Gustos data used by reports.
+
+    It is the version of Gustos tables combined with the version of the facts tables if WINE_ENTITY_FACTS_SCHEMA setting
+    is set, which also tells query builders whether the facts are current. The version of the DuckDB backend is the name
+    of the current snapshot, which is the version of the data it was exported from.
+
+    Without a connection, each process reads the version at most once per DATA_VERSION_TTL seconds, so web requests
+    and cached queries do not read Gustos tables on every call.
+
+    :param connection: Connection to Gustos data, a connection of the engine of reports by default.
+
+    :return: SHA1 hash of the version.
+    """
+    if connection is None:
+        with DataVersion.lock:
+            if DataVersion.checked_at is not None and time.monotonic() - DataVersion.checked_at < settings.DATA_VERSION_TTL:
+                return DataVersion.version
+
+        path = None
+        if settings.GUSTOS_BACKEND == "duckdb":
+            from generator.utils.snapshot import get_current_snapshot
+
+            path = get_current_snapshot()
+
+        if path is not None:
+            version = os.path.basename(path)
+        else:
+            with Database().connect() as connection:
+                version = get_data_version(connection)
+
+        with DataVersion.lock:
+            DataVersion.version = version
+            DataVersion.checked_at = time.monotonic()
+        return version
+
+    version = get_gustos_data_version(connection)
+
+    from generator.utils.facts import facts_configured, get_facts_version
+
+    if facts_configured():
+        version = sha1(f"{version}_{get_facts_version(connection, version)}".encode()).hexdigest()
+    return version
@@ -0,0 +1,131 @@
+import fcntl
+import os
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, Set, Tuple
+
+from django.conf import settings
+from django.db import close_old_connections
+
+HOST_SEMAPHORE_MIN_DELAY = 0.01
+"""Initial wait in seconds for a free slot of a host semaphore."""
+HOST_SEMAPHORE_MAX_DELAY = 1.0
+"""Maximum wait in seconds for a free slot of a host semaphore."""
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Returns the process-wide thread pool which renders reports.
+
+    All tasks executed by the worker process share the pool, so the number of threads does not grow with the number
+    of executed tasks.
+
+    :return: Thread pool executor.
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.THREAD_POOL_SIZE, thread_name_prefix="report")
+        return _executor
+
+
+def shutdown_executor():
+    """
+    Waits for the submitted reports and stops the threads of the pool.
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True, cancel_futures=True)
+            _executor = None
+
+
+def call_in_thread(function: Callable[..., Any], *args) -> Any:
+    """
+    Calls the function in a thread of the pool.
+
+    Threads of the pool outlive requests and tasks, so Django database connections which they open are closed as
+    obsolete before and after every call, as Django does for requests.
+    """
+    close_old_connections()
+    try:
+        return function(*args)
+    finally:
+        close_old_connections()
+
+
+def execute(function: Callable[..., Any], arguments: Iterable[Tuple[Any, ...]], quota: int) -> Iterator[Any]:
+    """
+    Executes the function in the process-wide thread pool for every tuple of arguments.
+
+    :param function: Function to execute.
+    :param arguments: Tuples of positional arguments of the function.
+    :param quota: Maximum number of calls which are submitted to the pool at the same time, so a single task cannot
+        occupy the whole pool.
+
+    :return: Results of the calls in order of their completion.
+    """
+    executor = get_executor()
+    arguments = iter(arguments)
+    futures: Set[Future] = set()
+
+    try:
+        while True:
+            for args in arguments:
+                futures.add(executor.submit(call_in_thread, function, *args))
+                if len(futures) >= quota:
+                    break
+
+            if not futures:
+                return
+
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+@contextmanager
+def host_semaphore(name: str, value: int):
+    """
+    Limits the number of threads of all processes of the host which execute the block at the same time.
+
+    Slots of the semaphore are lock files in the temporary directory, so the limit is shared by all Celery worker
+    processes of the host (container).
+
+    :param name: Name of the semaphore.
+    :param value: Maximum number of threads which execute the block at the same time.
+    """
+    paths = [os.path.join(tempfile.gettempdir(), f"gustos-reports-{name}-{slot}.lock") for slot in range(max(value, 1))]
+
+    # Waits grow while all slots stay busy, so waiting threads do not keep polling the lock files.
+    delay = HOST_SEMAPHORE_MIN_DELAY
+    while True:
+        for path in paths:
+            file = open(path, "a")
+            try:
+                fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                file.close()
+                continue
+
+            try:
+                yield
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+                file.close()
+            return
+
+        time.sleep(delay * random.uniform(0.5, 1.0))
+        delay = min(delay * 2, HOST_SEMAPHORE_MAX_DELAY)
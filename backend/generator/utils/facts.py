@@ -0,0 +1,169 @@
+import threading
+from hashlib import sha1
+
+from django.conf import settings
+from sqlalchemy import Boolean, case, Column, Connection, delete, func, insert, inspect, Integer, MetaData, select, SmallInteger, String, Table
+
+from generator.utils.database import create_mysql_engine, get_gustos_data_version
+from gustos.models import wine, wine_entity, wine_grapes
+
+metadata_obj = MetaData()
+
+# Denormalized facts about wine entities, which are decoded from JSON "category" column of "wine" table once, so
+# queries filter them by indexed columns. The table is stored in a separate (shadow) schema of the Gustos database
+# server and is refreshed by "refresh_wine_entity_facts" management command.
+wine_entity_fact = Table(
+    "wine_entity_fact",
+    metadata_obj,
+    Column("wine_entity_id", Integer, primary_key=True, autoincrement=False),
+    Column("wine_id", Integer, nullable=False, index=True),
+    Column("winery_id", Integer, nullable=False, index=True),
+    Column("country_id", Integer, index=True),
+    Column("continent_id", SmallInteger, index=True),
+    Column("beverage_type", Integer, index=True),
+    Column("color", Integer, index=True),
+    Column("co2", Integer, index=True),
+    Column("max_grape_percent", SmallInteger),
+    Column("is_blend", Boolean, index=True),
+    schema=settings.WINE_ENTITY_FACTS_SCHEMA or None,
+)
+
+# Continents of countries of "Report.CONTINENTS", so queries join them by the country instead of evaluating a CASE
+# expression with lists of all countries for every row. The table is stored in the same schema as the facts table.
+country_continent = Table(
+    "country_continent",
+    metadata_obj,
+    Column("country_id", Integer, primary_key=True, autoincrement=False),
+    Column("continent_id", SmallInteger, nullable=False, index=True),
+    schema=settings.WINE_ENTITY_FACTS_SCHEMA or None,
+)
+
+# Versions of Gustos data and of "Report.CONTINENTS" the facts tables were refreshed from, it has a single row.
+wine_entity_fact_version = Table(
+    "wine_entity_fact_version",
+    metadata_obj,
+    Column("id", SmallInteger, primary_key=True, autoincrement=False),
+    Column("data_version", String(40), nullable=False),
+    Column("continents_version", String(40), nullable=False),
+    schema=settings.WINE_ENTITY_FACTS_SCHEMA or None,
+)
+
+
+class FactsVersion:
+    """
+    Whether the facts tables are refreshed from the current Gustos data, it is updated by "get_data_version".
+    """
+
+    lock = threading.Lock()
+    current: bool = False
+
+
+def facts_configured() -> bool:
+    """
+    :return: Whether the facts tables are maintained in WINE_ENTITY_FACTS_SCHEMA.
+    """
+    return bool(settings.WINE_ENTITY_FACTS_SCHEMA)
+
+
+def facts_enabled() -> bool:
+    """
+    Returns whether query builders use the facts tables instead of JSON columns of "wine" table and CASE expressions.
+
+    Outdated facts are not used until "refresh_wine_entity_facts" command refreshes them, their version is checked
+    together with the version of Gustos data at most once per DATA_VERSION_TTL seconds.
+    """
+    if not facts_configured():
+        return False
+    # Snapshots are exported only with current facts.
+    if settings.GUSTOS_BACKEND == "duckdb":
+        return True
+
+    from generator.utils.database import get_data_version
+
+    get_data_version()
+    with FactsVersion.lock:
+        return FactsVersion.current
+
+
+def get_continents_version() -> str:
+    """
+    :return: SHA1 hash of "Report.CONTINENTS", including the order of continents.
+    """
+    from generator.reports.report import Report
+
+    return sha1(repr(list(Report.CONTINENTS.items())).encode()).hexdigest()
+
+
+def get_facts_version(connection: Connection, data_version: str) -> str | None:
+    """
+    Reads versions the facts tables were refreshed from and checks whether they are current.
+
+    :param connection: Connection to the Gustos database.
+    :param data_version: Current version of Gustos tables.
+
+    :return: Version of the facts tables or None if they have never been refreshed.
+    """
+    if inspect(connection).has_table(wine_entity_fact_version.name, schema=wine_entity_fact_version.schema):
+        row = connection.execute(select(wine_entity_fact_version.c.data_version, wine_entity_fact_version.c.continents_version)).fetchone()
+    else:
+        row = None
+
+    with FactsVersion.lock:
+        FactsVersion.current = row is not None and tuple(row) == (data_version, get_continents_version())
+
+    return None if row is None else "_".join(row)
+
+
+def refresh_wine_entity_facts() -> int:
+    """
+    Creates the facts tables if they do not exist and fills them from the current Gustos data and "Report.CONTINENTS".
+
+    The tables are refilled in a single transaction together with versions of Gustos data and "Report.CONTINENTS" they
+    are refreshed from, so readers see either old or new facts and query builders know whether they are current.
+
+    :return: Number of stored facts.
+    """
+    from generator.reports.report import Report
+
+    continents = Report.get_country_continents()
+
+    wg = select(
+        wine_grapes.c.wine_entity,
+        func.max(wine_grapes.c.percent).label("max_grape_percent"),
+    ).group_by(wine_grapes.c.wine_entity).subquery("wg")
+
+    query = select(
+        wine_entity.c.id,
+        wine.c.id,
+        wine.c.winery,
+        wine.c.country,
+        case(*[(wine.c.country.in_(countries), continent) for continent, countries in Report.CONTINENTS.items()], else_=None),
+        func.json_value(wine.c.category, "$.beverageType").cast(Integer),
+        func.json_value(wine.c.category, "$.color").cast(Integer),
+        func.json_value(wine.c.category, "$.co2").cast(Integer),
+        wg.c.max_grape_percent,
+        # The same threshold as "GrapeVariety" filter of "Report.build_query_for_wine_entity".
+        case((wg.c.max_grape_percent.is_(None), None), else_=wg.c.max_grape_percent <= 85),
+    ).select_from(wine_entity) \
+        .join(wine, wine.c.id == wine_entity.c.wine) \
+        .join(wg, wg.c.wine_entity == wine_entity.c.id, isouter=True)
+
+    # The facts are always built in the Gustos database, even if report queries read a DuckDB snapshot of it.
+    engine = create_mysql_engine()
+    try:
+        metadata_obj.create_all(engine, checkfirst=True)
+        with engine.begin() as connection:
+            # Gustos data changed while facts are filled make the facts outdated, so they are refreshed again instead
+            # of being used with a newer version.
+            data_version = get_gustos_data_version(connection)
+            connection.execute(delete(wine_entity_fact_version))
+            connection.execute(insert(wine_entity_fact_version).values(id=1, data_version=data_version, continents_version=get_continents_version()))
+            connection.execute(delete(country_continent))
+            connection.execute(insert(country_continent), [{"country_id": country, "continent_id": continent} for country, continent in continents.items()])
+            connection.execute(delete(wine_entity_fact))
+            connection.execute(insert(wine_entity_fact).from_select([c.name for c in wine_entity_fact.c], query))
+            count, = connection.execute(select(func.count()).select_from(wine_entity_fact)).fetchone()
+    finally:
+        engine.dispose()
+
+    return count
@@ -0,0 +1,50 @@
+import threading
+import time
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from generator.models import Task
+
+
+class TaskProgress:
+    """
+    Coalesces increments of "Task.current" of the task.
+
+    Increments are accumulated in memory and written by a single UPDATE of "current" column at most once per
+    PROGRESS_FLUSH_INTERVAL milliseconds, so rendering threads neither rewrite the whole row nor wait for each other.
+    """
+
+    def __init__(self, task_id: str, interval: int = None):
+        """
+        :param task_id: Identifier of the task.
+        :param interval: Minimal interval between writes in milliseconds, PROGRESS_FLUSH_INTERVAL by default.
+        """
+        self.task_id = task_id
+        self.interval = (settings.PROGRESS_FLUSH_INTERVAL if interval is None else interval) / 1000
+        self.pending = 0
+        self.flushed_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def increment(self, value: int = 1):
+        """
+        Increments progress of the task, the increment is written only if the flush interval has passed.
+        """
+        with self.lock:
+            self.pending += value
+            if time.monotonic() - self.flushed_at >= self.interval:
+                self.__flush()
+
+    def flush(self):
+        """
+        Writes all accumulated increments.
+        """
+        with self.lock:
+            self.__flush()
+
+    def __flush(self):
+        if self.pending > 0:
+            Task.objects.filter(id=self.task_id).update(current=F("current") + self.pending, updated=timezone.now())
+            self.pending = 0
+        self.flushed_at = time.monotonic()
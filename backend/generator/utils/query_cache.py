@@ -0,0 +1,304 @@
+import base64
+import datetime
+import json
+import logging
+import threading
+import time
+from collections import Counter, OrderedDict
+from decimal import Decimal
+from hashlib import sha1
+from typing import Any, Dict, Mapping
+
+from django.conf import settings
+from sqlalchemy import Connection, Engine, Result, Select, TextClause
+from sqlalchemy.engine import FrozenResult
+from sqlalchemy.engine.result import IteratorResult, SimpleResultMetaData
+from sqlalchemy.sql import ClauseElement
+
+from generator.utils.database import get_data_version
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "gustos-reports:query-cache"
+
+
+def encode_value(value: Any) -> Dict[str, str]:
+    """
+    Encodes values of query results which JSON does not support.
+    """
+    if isinstance(value, Decimal):
+        return {"decimal": str(value)}
+    if isinstance(value, datetime.datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"date": value.isoformat()}
+    if isinstance(value, bytes):
+        return {"bytes": base64.b64encode(value).decode()}
+    raise TypeError(f"Value of type {type(value).__name__} cannot be cached.")
+
+
+def decode_value(value: Dict[str, str]) -> Any:
+    if "decimal" in value:
+        return Decimal(value["decimal"])
+    if "datetime" in value:
+        return datetime.datetime.fromisoformat(value["datetime"])
+    if "date" in value:
+        return datetime.date.fromisoformat(value["date"])
+    if "bytes" in value:
+        return base64.b64decode(value["bytes"])
+    return value
+
+
+def dump_result(frozen: FrozenResult) -> bytes:
+    """
+    Serializes the query result to JSON, so results read from Redis shared by other hosts cannot execute code.
+    """
+    result = frozen()
+    return json.dumps({"keys": list(result.keys()), "rows": [list(row) for row in result]}, default=encode_value).encode()
+
+
+def load_result(value: bytes) -> FrozenResult:
+    data = json.loads(value, object_hook=decode_value)
+    return IteratorResult(SimpleResultMetaData(data["keys"]), iter(tuple(row) for row in data["rows"])).freeze()
+
+
+class QueryCache:
+    """
+    Two-tier cache of results of report queries.
+
+    Results are stored in a local LRU cache of the process and in Redis shared by all processes. Keys consist of the
+    compiled SQL, its parameters and the version of Gustos data, so cached results become unreachable as soon as
+    Gustos data changes instead of expiring after a fixed time.
+    """
+
+    lock = threading.Lock()
+    local: OrderedDict = OrderedDict()
+    """Frozen results by keys, the least recently used ones first."""
+    version: str = None
+    """Version of Gustos data of cached results."""
+    stats: Dict[str, Counter] = {}
+    """Counters of hits and misses by names of reports."""
+    pending_stats: Counter = Counter()
+    """Increments of counters of Redis which have not been stored yet."""
+    stats_flushed_at: float = None
+    redis = None
+
+    @staticmethod
+    def get_version() -> str:
+        """
+        :return: Version of Gustos data, see "get_data_version".
+        """
+        version = get_data_version()
+
+        with QueryCache.lock:
+            if version != QueryCache.version:
+                QueryCache.local.clear()
+                QueryCache.version = version
+        return version
+
+    @staticmethod
+    def get_redis():
+        if not settings.QUERY_CACHE_REDIS_URL:
+            return None
+
+        with QueryCache.lock:
+            if QueryCache.redis is None:
+                import redis
+
+                QueryCache.redis = redis.Redis.from_url(settings.QUERY_CACHE_REDIS_URL)
+            return QueryCache.redis
+
+    @staticmethod
+    def count(name: str, event: str):
+        """
+        Counts the event locally, counters of Redis are incremented at most once per QUERY_CACHE_STATS_INTERVAL seconds.
+        """
+        with QueryCache.lock:
+            QueryCache.stats.setdefault(name, Counter())[event] += 1
+            QueryCache.pending_stats[f"{name}:{event}"] += 1
+
+            now = time.monotonic()
+            if QueryCache.stats_flushed_at is None:
+                QueryCache.stats_flushed_at = now
+            flush = now - QueryCache.stats_flushed_at >= settings.QUERY_CACHE_STATS_INTERVAL
+
+        if flush:
+            QueryCache.flush_stats()
+
+    @staticmethod
+    def flush_stats():
+        """
+        Adds counters of the process which have not been stored yet to counters of Redis shared by all processes.
+        """
+        with QueryCache.lock:
+            pending_stats = QueryCache.pending_stats
+            QueryCache.pending_stats = Counter()
+            QueryCache.stats_flushed_at = time.monotonic()
+
+        redis = QueryCache.get_redis()
+        if redis is None or not pending_stats:
+            return
+
+        try:
+            pipeline = redis.pipeline(transaction=False)
+            for field, amount in pending_stats.items():
+                pipeline.hincrby(f"{REDIS_KEY_PREFIX}:stats", field, amount)
+            pipeline.execute()
+        except Exception as e:
+            logger.warning("Query cache statistics cannot be stored in Redis: %s", e)
+            # The counters are stored by the next flush.
+            with QueryCache.lock:
+                QueryCache.pending_stats.update(pending_stats)
+
+    @staticmethod
+    def get_stats() -> Dict[str, Counter]:
+        """
+        :return: Counters of "local_hit", "redis_hit" and "miss" events by names of reports of the process.
+        """
+        with QueryCache.lock:
+            return {name: Counter(counter) for name, counter in QueryCache.stats.items()}
+
+    @staticmethod
+    def log_stats():
+        """
+        Logs counters of hits and misses of the process.
+        """
+        for name, counter in sorted(QueryCache.get_stats().items()):
+            logger.info("Query cache of %s: %s local hits, %s Redis hits, %s misses.", name, counter["local_hit"], counter["redis_hit"], counter["miss"])
+
+    @staticmethod
+    def get(key: str, name: str) -> FrozenResult | None:
+        with QueryCache.lock:
+            frozen = QueryCache.local.get(key)
+            if frozen is not None:
+                QueryCache.local.move_to_end(key)
+        if frozen is not None:
+            QueryCache.count(name, "local_hit")
+            return frozen
+
+        redis = QueryCache.get_redis()
+        if redis is not None:
+            try:
+                value = redis.get(f"{REDIS_KEY_PREFIX}:{key}")
+            except Exception as e:
+                logger.warning("Query result cannot be read from Redis: %s", e)
+                value = None
+            if value is not None:
+                try:
+                    frozen = load_result(value)
+                except ValueError as e:
+                    logger.warning("Query result read from Redis cannot be decoded: %s", e)
+                    frozen = None
+            if frozen is not None:
+                QueryCache.set_local(key, frozen)
+                QueryCache.count(name, "redis_hit")
+                return frozen
+
+        QueryCache.count(name, "miss")
+        return None
+
+    @staticmethod
+    def set_local(key: str, frozen: FrozenResult):
+        with QueryCache.lock:
+            QueryCache.local[key] = frozen
+            QueryCache.local.move_to_end(key)
+            while len(QueryCache.local) > settings.QUERY_CACHE_SIZE:
+                QueryCache.local.popitem(last=False)
+
+    @staticmethod
+    def set(key: str, frozen: FrozenResult):
+        # Huge results would evict everything else.
+        if len(frozen.data) > settings.QUERY_CACHE_MAX_ROWS:
+            return
+
+        QueryCache.set_local(key, frozen)
+
+        redis = QueryCache.get_redis()
+        if redis is not None:
+            try:
+                # The expiration only removes results of outdated versions of Gustos data.
+                redis.set(f"{REDIS_KEY_PREFIX}:{key}", dump_result(frozen), ex=settings.QUERY_CACHE_REDIS_EXPIRE)
+            except Exception as e:
+                logger.warning("Query result cannot be stored in Redis: %s", e)
+
+
+class CachedConnection:
+    """
+    Connection to Gustos database which returns cached results of SELECT queries.
+
+    The underlying connection is checked out from the pool only if a query has to be executed.
+    """
+
+    def __init__(self, engine: Engine, name: str):
+        """
+        :param engine: Engine of Gustos database.
+        :param name: Name of the report which executes queries, it is used by hit and miss counters.
+        """
+        self.engine = engine
+        self.name = name
+        self.connection: Connection | None = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __getattr__(self, name: str):
+        return getattr(self.get_connection(), name)
+
+    @property
+    def dialect(self):
+        return self.engine.dialect
+
+    def get_connection(self) -> Connection:
+        if self.connection is None:
+            self.connection = self.engine.connect()
+        return self.connection
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def execute(self, statement: ClauseElement, parameters: Mapping[str, Any] = None) -> Result:
+        if not self.is_cacheable(statement):
+            return self.get_connection().execute(statement, parameters)
+
+        compiled = statement.compile(dialect=self.engine.dialect)
+        params = {**compiled.params, **(parameters or {})}
+        key = sha1(f"{QueryCache.get_version()}:{compiled}:{sorted(params.items(), key=lambda x: x[0])}".encode()).hexdigest()
+
+        frozen = QueryCache.get(key, self.name)
+        if frozen is None:
+            frozen = self.get_connection().execute(statement, parameters).freeze()
+            QueryCache.set(key, frozen)
+        return frozen()
+
+    @staticmethod
+    def is_cacheable(statement: ClauseElement) -> bool:
+        if settings.QUERY_CACHE_SIZE <= 0:
+            return False
+        if isinstance(statement, Select):
+            return True
+        return isinstance(statement, TextClause) and statement.text.lstrip().upper().startswith(("SELECT", "WITH"))
+
+
+class CachedDatabase:
+    """
+    Gustos database, connections of which return cached results of SELECT queries.
+    """
+
+    def __init__(self, engine: Engine, name: str):
+        """
+        :param engine: Engine of Gustos database.
+        :param name: Name of the report which executes queries, it is used by hit and miss counters.
+        """
+        self.engine = engine
+        self.name = name
+
+    def __getattr__(self, name: str):
+        return getattr(self.engine, name)
+
+    def connect(self) -> CachedConnection:
+        return CachedConnection(self.engine, self.name)
@@ -0,0 +1,253 @@
+import json
+import logging
+from datetime import timedelta
+from hashlib import sha1
+from typing import Any, List, Mapping, Sequence, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from sqlalchemy import case, func, or_, Select, select
+
+from generator.enum import Continent
+from generator.models import RankingRow, RankingSnapshot, RankingSnapshotStatus
+from generator.utils.batch import RowsResult
+from generator.utils.database import Database
+from generator.utils.query_cache import decode_value, encode_value, QueryCache
+
+logger = logging.getLogger(__name__)
+
+
+def rankings_enabled() -> bool:
+    """
+    :return: Whether table winery reports look up ratings in ranking snapshots.
+    """
+    return settings.RANKING_SNAPSHOTS
+
+
+def get_ranking_key(query: Select) -> str:
+    """
+    :param query: Rating query of a table winery report.
+
+    :return: Key of snapshots of the query, it depends on the criterion, filters and year range of the query.
+    """
+    compiled = query.compile(dialect=Database().dialect)
+    return sha1(f"{compiled}:{sorted(compiled.params.items(), key=lambda x: x[0])}".encode()).hexdigest()
+
+
+def build_neighbour_query(query: Select, arguments: Mapping[str, Any]) -> Select:
+    """
+    Builds a query which selects only rows of the rating query needed to find ratings and neighbours of the entity, the
+    same rows as "lookup_ranking_rows" selects from a snapshot.
+
+    The first and the last positions of rank groups are found by MIN and MAX windows, the first positions of the
+    preceding and the following rank groups by LAG and LEAD windows over the world, continent and country rankings.
+
+    :param query: Rating query of a table winery report, its "position" column numbers rows in the order of the result.
+    :param arguments: Indices of columns and identifiers of "get_ratings_by_query_result" method of the report.
+
+    :return: Query which selects rows of the rating query ordered by their position.
+    """
+    ranked = query.order_by(None).cte("ranked")
+    names = [column.name for column in ranked.c]
+    position = ranked.c.position
+    rankings = (
+        ("w", ranked.c[names[arguments["world_rank_index"]]], ()),
+        ("c", ranked.c[names[arguments["continent_rank_index"]]], (ranked.c[names[arguments["continent_id_index"]]],)),
+        ("k", ranked.c[names[arguments["country_rank_index"]]], (ranked.c[names[arguments["country_id_index"]]],)),
+    )
+
+    # The first and the last positions of the rank group of each row.
+    groups = select(
+        ranked,
+        *[func.min(position).over(partition_by=(*partition, rank)).label(f"{prefix}_first") for prefix, rank, partition in rankings],
+        *[func.max(position).over(partition_by=(*partition, rank)).label(f"{prefix}_last") for prefix, rank, partition in rankings],
+    ).subquery("rank_groups")
+
+    # The first position of the preceding group is known in the first row of a group, the first position of the
+    # following group is the position after the last row of a group.
+    boundaries = select(
+        groups,
+        *[func.lag(groups.c[f"{prefix}_first"]).over(partition_by=[groups.c[c.name] for c in partition], order_by=groups.c.position).label(f"{prefix}_lag") for prefix, _, partition in rankings],
+        *[func.lead(groups.c.position).over(partition_by=[groups.c[c.name] for c in partition], order_by=groups.c.position).label(f"{prefix}_lead") for prefix, _, partition in rankings],
+    ).subquery("boundaries")
+
+    # Spread the neighbours of the group to all its rows.
+    neighbours = select(
+        boundaries,
+        *[func.max(case((boundaries.c.position == boundaries.c[f"{prefix}_first"], boundaries.c[f"{prefix}_lag"]))).over(
+            partition_by=(*[boundaries.c[c.name] for c in partition], boundaries.c[rank.name])
+        ).label(f"{prefix}_previous") for prefix, rank, partition in rankings],
+        *[func.max(case((boundaries.c.position == boundaries.c[f"{prefix}_last"], boundaries.c[f"{prefix}_lead"]))).over(
+            partition_by=(*[boundaries.c[c.name] for c in partition], boundaries.c[rank.name])
+        ).label(f"{prefix}_next") for prefix, rank, partition in rankings],
+    ).subquery("neighbours")
+
+    current = select(neighbours) \
+        .where(neighbours.c[names[arguments["entity_id_index"]]] == arguments["entity_id"]) \
+        .order_by(neighbours.c.position) \
+        .limit(1) \
+        .subquery("current")
+
+    positions = [current.c.position] + [current.c[f"{prefix}_{neighbour}"] for prefix, _, _ in rankings for neighbour in ("previous", "next")]
+    return select(ranked) \
+        .select_from(ranked.join(current, or_(position == 1, *[position == p for p in positions]))) \
+        .order_by(position)
+
+
+def dump_row(row: Sequence[Any]) -> str:
+    return json.dumps(list(row), default=encode_value)
+
+
+def load_row(value: str) -> Tuple[Any, ...]:
+    return tuple(json.loads(value, object_hook=decode_value))
+
+
+def fail_ranking_snapshot(snapshot: RankingSnapshot):
+    """
+    Marks the snapshot as failed, its refresh is enqueued again after RANKING_SNAPSHOT_RETRY_DELAY seconds.
+    """
+    snapshot.status = RankingSnapshotStatus.FAILED
+    snapshot.retry_after = timezone.now() + timedelta(seconds=settings.RANKING_SNAPSHOT_RETRY_DELAY)
+    snapshot.save(update_fields=("status", "retry_after", "updated"))
+
+
+def get_ranking_snapshot(report, enqueue: bool = True) -> RankingSnapshot:
+    """
+    Returns the snapshot of the rating query of the report for the current version of Gustos data and starts its
+    refresh if it does not exist yet or its previous refresh has failed more than RANKING_SNAPSHOT_RETRY_DELAY seconds
+    ago.
+
+    It is called by report generation tasks only, so rendering of reports never writes snapshots.
+
+    :param report: Table winery report.
+    :param enqueue: Whether the refresh is enqueued, otherwise the caller refreshes the snapshot of IN_PROGRESS status.
+
+    :return: Snapshot, which may be not finished yet.
+    """
+    snapshot, created = RankingSnapshot.objects.get_or_create(
+        key=get_ranking_key(report.get_query()),
+        data_version=QueryCache.get_version(),
+        defaults={
+            "report": type(report).__name__,
+            "year_from": report.year_from,
+            "year_to": report.year_to,
+        },
+    )
+    if not created:
+        if snapshot.status != RankingSnapshotStatus.FAILED or (snapshot.retry_after is not None and snapshot.retry_after > timezone.now()):
+            return snapshot
+        # Only one of concurrent tasks restarts the refresh.
+        if not RankingSnapshot.objects.filter(id=snapshot.id, status=RankingSnapshotStatus.FAILED).update(status=RankingSnapshotStatus.IN_PROGRESS, retry_after=None):
+            return snapshot
+        snapshot.status = RankingSnapshotStatus.IN_PROGRESS
+        snapshot.retry_after = None
+
+    if enqueue:
+        from generator.tasks import refresh_ranking_snapshot
+
+        try:
+            refresh_ranking_snapshot.delay(snapshot.id, f"{type(report).__module__}.{type(report).__qualname__}")
+        except Exception as e:
+            logger.warning("Refresh of the ranking snapshot of %s cannot be enqueued: %s", snapshot.report, e)
+            fail_ranking_snapshot(snapshot)
+
+    return snapshot
+
+
+def get_ranking_rows(report, arguments: Mapping[str, Any]) -> RowsResult | None:
+    """
+    Looks up rows of the rating query which are needed to find ratings and neighbours of the entity.
+
+    :param report: Table winery report.
+    :param arguments: Indices of columns and identifiers of "get_ratings_by_query_result" method of the report.
+
+    :return: Rows in the order of the query result or None if the snapshot is not finished.
+    """
+    snapshot = RankingSnapshot.objects.filter(
+        key=get_ranking_key(report.get_query()),
+        data_version=QueryCache.get_version(),
+        status=RankingSnapshotStatus.FINISHED,
+    ).first()
+    if snapshot is None:
+        return None
+
+    return RowsResult(lookup_ranking_rows(snapshot, arguments))
+
+
+def lookup_ranking_rows(snapshot: RankingSnapshot, arguments: Mapping[str, Any]) -> List[Any]:
+    """
+    Returns the first row of the rating query, the first row of the entity and the first rows of rank groups which
+    precede and follow the entity in the world, continent and country rankings.
+
+    "get_ratings_by_query_result" method finds the same ratings in these rows as in the whole query result.
+
+    :param snapshot: Finished ranking snapshot.
+    :param arguments: Indices of columns and identifiers of "get_ratings_by_query_result" method of the report.
+
+    :return: Rows in the order of the query result.
+    """
+    rows = snapshot.rows.all()
+    current = rows.filter(entity_id=arguments["entity_id"]).order_by("position").first()
+    if current is None:
+        return []
+
+    continent_id = arguments["continent_id"]
+    if isinstance(continent_id, Continent):
+        continent_id = continent_id.value
+
+    positions = {0, current.position}
+    for rank_field, group in (
+            ("world_rank", {}),
+            ("continent_rank", {"continent_id": continent_id}),
+            ("country_rank", {"country_id": arguments["country_id"]}),
+    ):
+        group_rows = rows.filter(**group)
+        rank = getattr(current, rank_field)
+        previous = group_rows.filter(**{f"{rank_field}__lt": rank}).order_by(f"-{rank_field}", "position").values_list("position", flat=True).first()
+        following = group_rows.filter(**{f"{rank_field}__gt": rank}).order_by(rank_field, "position").values_list("position", flat=True).first()
+        positions.update(position for position in (previous, following) if position is not None)
+
+    return [load_row(row) for row in rows.filter(position__in=positions).order_by("position").values_list("row", flat=True)]
+
+
+def materialize_ranking_snapshot(snapshot: RankingSnapshot, query: Select, arguments: Mapping[str, Any]) -> int:
+    """
+    Stores rows of the rating query in the snapshot and removes older snapshots of the query.
+
+    Rows are committed in batches of RANKING_SNAPSHOT_BATCH_SIZE rows, so a long refresh does not hold a transaction
+    open, reports ignore rows of the snapshot until it is finished.
+
+    :param snapshot: Snapshot to fill.
+    :param query: Rating query of the report.
+    :param arguments: Indices of columns of "get_ratings_by_query_result" method of the report.
+
+    :return: Number of stored rows.
+    """
+    # Rows of an interrupted refresh.
+    snapshot.rows.all().delete()
+
+    count = 0
+    with Database().connect() as connection:
+        result = connection.execution_options(stream_results=True).execute(query)
+        for rows in result.partitions(settings.RANKING_SNAPSHOT_BATCH_SIZE):
+            RankingRow.objects.bulk_create(RankingRow(
+                snapshot=snapshot,
+                position=count + index,
+                entity_id=row[arguments["entity_id_index"]],
+                continent_id=row[arguments["continent_id_index"]],
+                country_id=row[arguments["country_id_index"]],
+                world_rank=row[arguments["world_rank_index"]],
+                continent_rank=row[arguments["continent_rank_index"]],
+                country_rank=row[arguments["country_rank_index"]],
+                row=dump_row(row),
+            ) for index, row in enumerate(rows))
+            count += len(rows)
+
+    with transaction.atomic():
+        snapshot.status = RankingSnapshotStatus.FINISHED
+        snapshot.save()
+
+        RankingSnapshot.objects.filter(key=snapshot.key, created__lt=snapshot.created).delete()
+
+    return count
@@ -1,7 +1,11 @@
+import importlib
 import inspect
 import os
-from importlib.machinery import SourceFileLoader
-from typing import IO
+import shutil
+import tempfile
+import threading
+from types import ModuleType
+from typing import Dict, IO, List, Sequence, Tuple, Type
 
 import pdfkit
 from bs4 import BeautifulSoup
@@ -11,6 +15,44 @@ from django.template.loader import render_to_string
 
 import generator
 from generator.reports.report import Report, Section
+from generator.utils.charts import use_chart_backend
+from generator.utils.executor import host_semaphore
+
+
+PDF_OPTIONS = {
+    'page-size': 'B3',
+    'margin-top': '0',
+    'margin-right': '0',
+    'margin-bottom': '0',
+    'margin-left': '0',
+    'encoding': 'UTF-8',
+    'no-outline': None,
+    'enable-local-file-access': None,
+    'load-error-handling': 'ignore',
+    'print-media-type': None,
+}
+
+
+REPORTS_PLACEHOLDER = "<!-- reports -->"
+
+
+def replace_urls_by_paths(document: BeautifulSoup):
+    """
+    Replaces URLs to static and media files by its absolute path, so wkhtmltopdf reads them from the file system.
+
+    :param document: Parsed HTML document or fragment.
+    """
+    if document.head is not None:
+        for element in document.head.findAll(lambda e: e.name == "link" and e.has_attr("href")):
+            if element["href"].startswith(settings.STATIC_URL):
+                element["href"] = os.path.join(settings.STATIC_ROOT, element["href"][len(settings.STATIC_URL):])
+            elif element["href"].startswith(settings.MEDIA_URL):
+                element["href"] = os.path.join(settings.MEDIA_ROOT, element["href"][len(settings.MEDIA_URL):])
+    for element in document.findAll(lambda e: e.has_attr("src")):
+        if element["src"].startswith(settings.STATIC_URL):
+            element["src"] = os.path.join(settings.STATIC_ROOT, element["src"][len(settings.STATIC_URL):])
+        elif element["src"].startswith(settings.MEDIA_URL):
+            element["src"] = os.path.join(settings.MEDIA_ROOT, element["src"][len(settings.MEDIA_URL):])
 
 
 def generating_pdf_report(html, output: IO, **kwargs):
@@ -21,33 +63,188 @@ def generating_pdf_report(html, output: IO, **kwargs):
     })
 
     document = BeautifulSoup(html, "html.parser")
+    replace_urls_by_paths(document)
 
-    # Replaces URLs to static and media files by its absolute path.
-    for element in document.head.findAll(lambda e: e.name == "link" and e.has_attr("href")):
-        if element["href"].startswith(settings.STATIC_URL):
-            element["href"] = os.path.join(settings.STATIC_ROOT, element["href"][len(settings.STATIC_URL):])
-        elif element["href"].startswith(settings.MEDIA_URL):
-            element["href"] = os.path.join(settings.MEDIA_ROOT, element["href"][len(settings.MEDIA_URL):])
-    for element in document.findAll(lambda e: e.has_attr("src")):
-        if element["src"].startswith(settings.STATIC_URL):
-            element["src"] = os.path.join(settings.STATIC_ROOT, element["src"][len(settings.STATIC_URL):])
-        elif element["src"].startswith(settings.MEDIA_URL):
-            element["src"] = os.path.join(settings.MEDIA_ROOT, element["src"][len(settings.MEDIA_URL):])
+    with host_semaphore("wkhtmltopdf", settings.HOST_WKHTMLTOPDF_CONCURRENCY):
+        output.write(pdfkit.PDFKit(str(document), "string", options=PDF_OPTIONS).to_pdf())
 
-    options = {
-        'page-size': 'B3',
-        'margin-top': '0',
-        'margin-right': '0',
-        'margin-bottom': '0',
-        'margin-left': '0',
-        'encoding': 'UTF-8',
-        'no-outline': None,
-        'enable-local-file-access': None,
-        'load-error-handling': 'ignore',
-        'print-media-type': None,
-    }
 
-    output.write(pdfkit.PDFKit(str(document), "string", options=options).to_pdf())
+def get_meta_options(document: BeautifulSoup) -> Dict[str, str]:
+    """
+    Returns wkhtmltopdf options of "pdfkit-" meta tags of the document, which pdfkit reads only from strings.
+
+    :param document: Parsed HTML document.
+
+    :return: Values of options by their names.
+    """
+    options = {}
+    if document.head is not None:
+        for element in document.head.findAll(lambda e: e.name == "meta" and e.get("name", "").startswith("pdfkit-")):
+            options[element["name"][len("pdfkit-"):]] = element.get("content", "")
+    return options
+
+
+def spool_html(html: str, directory: str) -> str:
+    """
+    Writes HTML code of the report to a temporary file, so it does not stay in memory until the PDF is generated.
+
+    :param html: HTML code of the report.
+    :param directory: Directory to create the file in.
+
+    :return: Path to the file.
+    """
+    document = BeautifulSoup(html, "html.parser")
+    replace_urls_by_paths(document)
+
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".html", dir=directory, delete=False) as file:
+        file.write(str(document))
+    return file.name
+
+
+def generating_batch_pdf_report(paths: Sequence[str], output_path: str, **kwargs):
+    """
+    Generates a single PDF document from several reports using one wkhtmltopdf run.
+
+    The document is assembled file by file next to the output, so neither the reports nor the PDF are kept in memory.
+
+    :param paths: Paths to HTML code of reports (see "spool_html") in the order they must appear in the document.
+        Each report starts on a new page.
+    :param output_path: Path to write PDF to.
+    :param kwargs: Additional variables of "pdf.html" template.
+    """
+    html = render_to_string("pdf.html", {
+        "result_data": REPORTS_PLACEHOLDER,
+        ** kwargs,
+    })
+
+    document = BeautifulSoup(html, "html.parser")
+    replace_urls_by_paths(document)
+    header, footer = str(document).split(REPORTS_PLACEHOLDER, 1)
+
+    document_path = f"{output_path}.html"
+    with open(document_path, "w", encoding="utf-8") as document_file:
+        document_file.write(header)
+        for i, path in enumerate(paths):
+            document_file.write('<div style="page-break-after: always;">' if i < len(paths) - 1 else "<div>")
+            with open(path, "r", encoding="utf-8") as file:
+                shutil.copyfileobj(file, document_file)
+            document_file.write("</div>")
+        document_file.write(footer)
+
+    # pdfkit applies options of meta tags of strings first, so PDF_OPTIONS override them as in "generating_pdf_report".
+    options = {**get_meta_options(document), **PDF_OPTIONS}
+    try:
+        with host_semaphore("wkhtmltopdf", settings.HOST_WKHTMLTOPDF_CONCURRENCY):
+            pdfkit.PDFKit(document_path, "file", options=options).to_pdf(output_path)
+    finally:
+        os.remove(document_path)
+
+
+class ReportRegistry:
+    """
+    Process-wide index of sections and report classes of their subsections.
+
+    Modules of sections and subsections are discovered and imported once, on the first access, instead of being
+    loaded from their source files on every lookup.
+    """
+    lock = threading.Lock()
+    sections: Dict[str, Section] = None
+    """Sections by their names."""
+    subsections: Dict[str, List[str]] = None
+    """Names of subsections by names of their sections."""
+    reports: Dict[Tuple[str, str], Type[Report]] = None
+    """Report classes by (section, subsection) tuples."""
+    errors: Dict[Tuple[str, str], Exception] = None
+    """Errors of subsection modules which cannot be imported by (section, subsection) tuples."""
+    catalog: Dict[str, Tuple[Tuple[str, str], ...]] = None
+    """(subsection, title) tuples of reports ordered by their weight by names of sections."""
+
+    @staticmethod
+    def load():
+        """
+        Discovers and imports modules of all sections and subsections, if it has not been done yet.
+        """
+        if ReportRegistry.reports is not None:
+            return
+
+        with ReportRegistry.lock:
+            if ReportRegistry.reports is not None:
+                return
+
+            sections_dir = os.path.dirname(inspect.getfile(generator.reports))
+
+            # Report modules import pyplot, so the non-interactive backend has to be selected before.
+            use_chart_backend()
+
+            sections = {}
+            subsections = {}
+            reports = {}
+            errors = {}
+            for section in ReportRegistry.__list_packages(sections_dir):
+                module = importlib.import_module(f"{generator.reports.__name__}.{section}.main")
+                sections[section] = next((value for value in vars(module).values() if isinstance(value, Section)), None)
+
+                subsections[section] = ReportRegistry.__list_packages(os.path.join(sections_dir, section))
+                for subsection in subsections[section]:
+                    # A broken subsection must not break the others, its error is raised when the subsection is used.
+                    try:
+                        module = importlib.import_module(f"{generator.reports.__name__}.{section}.{subsection}.main")
+                    except Exception as e:
+                        errors[(section, subsection)] = e
+                        continue
+                    reports[(section, subsection)] = ReportRegistry.__find_report_class(module)
+
+            ReportRegistry.sections = sections
+            ReportRegistry.subsections = subsections
+            ReportRegistry.errors = errors
+            # Metadata of reports are class attributes, so the catalog is compiled without instantiating reports.
+            ReportRegistry.catalog = {
+                section: tuple(
+                    (subsection, report_class.title)
+                    for subsection, report_class in sorted(
+                        ((subsection, reports[(section, subsection)]) for subsection in subsections[section] if reports.get((section, subsection)) is not None),
+                        key=lambda item: item[1].weight,
+                    )
+                )
+                for section in sections
+            }
+            ReportRegistry.reports = reports
+
+    @staticmethod
+    def __list_packages(directory: str) -> List[str]:
+        return [name for name in os.listdir(directory) if os.path.isdir(os.path.join(directory, name)) and name != "__pycache__"]
+
+    @staticmethod
+    def __find_report_class(module: ModuleType) -> Type[Report] | None:
+        classes = [
+            cls_obj for cls_name, cls_obj in inspect.getmembers(module, inspect.isclass)
+            if issubclass(cls_obj, Report) and not inspect.isabstract(cls_obj)
+        ]
+        # Classes defined by the module take precedence over imported ones.
+        classes.sort(key=lambda cls_obj: cls_obj.__module__ != module.__name__)
+        return classes[0] if classes else None
+
+    @staticmethod
+    def get_section(section: str) -> Section | None:
+        ReportRegistry.load()
+        return ReportRegistry.sections.get(section)
+
+    @staticmethod
+    def get_catalog(section: str) -> Tuple[Tuple[str, str], ...]:
+        """
+        :param section: Name of the section.
+
+        :return: (subsection, title) tuples of reports of the section ordered by their weight.
+        """
+        ReportRegistry.load()
+        return ReportRegistry.catalog.get(section, ())
+
+    @staticmethod
+    def get_report_class(section: str, subsection: str) -> Type[Report] | None:
+        ReportRegistry.load()
+        if (section, subsection) in ReportRegistry.errors:
+            raise ReportRegistry.errors[(section, subsection)]
+        return ReportRegistry.reports.get((section, subsection))
 
 
 def get_section(section: str):
@@ -56,16 +253,7 @@ def get_section(section: str):
     :param section: name of section
     :return: object
     """
-    sections_dir = os.path.dirname(inspect.getfile(generator.reports))
-    module_path = os.path.join(sections_dir, section, "main.py")
-    module = SourceFileLoader(section, module_path).load_module()
-
-    for name in dir(module):
-        if isinstance(getattr(module, name), Section):
-            try:
-                return getattr(module, name)
-            except TypeError:
-                continue
+    return ReportRegistry.get_section(section)
 
 
 def get_report(request: HttpRequest, section: str, subsection: str, **kwargs):
@@ -79,23 +267,17 @@ def get_report(request: HttpRequest, section: str, subsection: str, **kwargs):
 
     :return: report object
     """
-    sections_dir = os.path.dirname(inspect.getfile(generator.reports))
-    module_path = os.path.join(sections_dir, section, subsection, "main.py")
-    module = SourceFileLoader(subsection, module_path).load_module()
-
-    # Get all classes from module.
-    classes = [cls_name for cls_name, cls_obj in inspect.getmembers(module) if inspect.isclass(cls_obj)]
-
-    # Find class with subclass Reports.
-    for name in classes:
-        if issubclass(getattr(module, name), Report):
-            try:
-                return getattr(module, name)(request, **kwargs)
-            except TypeError:
-                continue
+    report_class = ReportRegistry.get_report_class(section, subsection)
+    if report_class is not None:
+        return report_class(request, **kwargs)
 
 
 class SubsectionsBySections:
+    """
+    Navigation tree of sections, it is built once per process from "ReportRegistry".
+
+    The development server restarts the process when the report package changes, so the tree does not become stale.
+    """
     got_subsections_by_sections = False
     subsections_by_sections = {}
     got_sections_by_chapters = False
@@ -103,15 +285,20 @@ class SubsectionsBySections:
 
     @staticmethod
     def get_sections_by_chapters():
+        if SubsectionsBySections.got_sections_by_chapters:
+            return
+
+        SubsectionsBySections.get_subsections_by_sections()
+
         sections_list = SubsectionsBySections.subsections_by_sections.keys()  # Default sections list to be shown.
-        SubsectionsBySections.sections_by_chapters = {}
+        sections_by_chapters = {}
         for section in sections_list:
             section_info = get_section(section)
 
-            if not SubsectionsBySections.sections_by_chapters.get(section_info.chapter):
-                SubsectionsBySections.sections_by_chapters[section_info.chapter] = []
+            if not sections_by_chapters.get(section_info.chapter):
+                sections_by_chapters[section_info.chapter] = []
 
-            SubsectionsBySections.sections_by_chapters[section_info.chapter].append(
+            sections_by_chapters[section_info.chapter].append(
                 {
                     "name": section_info.name,
                     "slug": section,
@@ -119,33 +306,20 @@ class SubsectionsBySections:
                 }
             )
 
-        for chapter in SubsectionsBySections.sections_by_chapters:
-            SubsectionsBySections.sections_by_chapters[chapter] = sorted(SubsectionsBySections.sections_by_chapters[chapter], key=lambda d: d["weight"])
+        for chapter in sections_by_chapters:
+            sections_by_chapters[chapter] = sorted(sections_by_chapters[chapter], key=lambda d: d["weight"])
 
+        SubsectionsBySections.sections_by_chapters = sections_by_chapters
         SubsectionsBySections.got_sections_by_chapters = True
 
     @staticmethod
     def get_subsections_by_sections():
-        sections_dir = os.path.dirname(inspect.getfile(generator.reports))
-
-        # Get sections list form sections_dir.
-        sections_list = [name for name in os.listdir(sections_dir) if os.path.isdir(os.path.join(sections_dir, name))]
-        sections_list.remove("__pycache__")
-
-        sections_by_weight = {}
-        for section in sections_list:
-            section_info = get_section(section)
-            sections_by_weight[section] = section_info.weight
-
-        sections_list = [k for k, v in sorted(sections_by_weight.items(), key=lambda item: item[1])]
-
-        for section in sections_list:
-            subsections_dir = os.path.join(sections_dir, section)
+        if SubsectionsBySections.got_subsections_by_sections:
+            return
 
-            # Get subsection list form subsections_dir.
-            subsections_list = [name for name in os.listdir(subsections_dir) if os.path.isdir(os.path.join(subsections_dir, name))]
-            subsections_list.remove("__pycache__")
+        ReportRegistry.load()
 
-            SubsectionsBySections.subsections_by_sections[section] = subsections_list
+        sections_list = [k for k, v in sorted(ReportRegistry.sections.items(), key=lambda item: item[1].weight)]
 
+        SubsectionsBySections.subsections_by_sections = {section: ReportRegistry.subsections[section] for section in sections_list}
         SubsectionsBySections.got_subsections_by_sections = True
@@ -0,0 +1,58 @@
+import math
+from typing import List, Mapping, Sequence, Tuple, TypeVar
+
+from generator.models import SubsectionRenderTime
+
+T = TypeVar("T", bound=Tuple)
+
+RENDER_TIME_SMOOTHING = 0.3
+"""Weight of the latest render duration in the moving average of render durations."""
+
+
+def sort_by_render_time(subsections: Sequence[T]) -> List[T]:
+    """
+    Sorts subsections by the expected render duration in descending order (longest processing time first), so the
+    slowest subsections do not start last and the makespan of the report gets shorter.
+
+    Subsections which have never been rendered go first, so their duration gets measured as soon as possible.
+
+    :param subsections: Tuples where the second and the third items are names of the section and the subsection.
+
+    :return: Sorted subsections.
+    """
+    durations = {
+        (section, subsection): duration
+        for section, subsection, duration in SubsectionRenderTime.objects.filter(
+            section__in={s[1] for s in subsections},
+        ).values_list("section", "subsection", "duration")
+    }
+
+    return sorted(subsections, key=lambda s: durations.get((s[1], s[2]), math.inf), reverse=True)
+
+
+def record_render_times(durations: Mapping[Tuple[str, str], float]):
+    """
+    Updates the moving average of render durations of the subsections.
+
+    :param durations: Render durations in seconds by (section, subsection) tuples.
+    """
+    if not durations:
+        return
+
+    render_times = {
+        (render_time.section, render_time.subsection): render_time
+        for render_time in SubsectionRenderTime.objects.filter(section__in={section for section, _ in durations})
+    }
+
+    created = []
+    updated = []
+    for (section, subsection), duration in durations.items():
+        render_time = render_times.get((section, subsection))
+        if render_time is None:
+            created.append(SubsectionRenderTime(section=section, subsection=subsection, duration=duration))
+        else:
+            render_time.duration = RENDER_TIME_SMOOTHING * duration + (1 - RENDER_TIME_SMOOTHING) * render_time.duration
+            updated.append(render_time)
+
+    SubsectionRenderTime.objects.bulk_create(created, ignore_conflicts=True)
+    SubsectionRenderTime.objects.bulk_update(updated, ("duration", ))
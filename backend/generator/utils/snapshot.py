@@ -0,0 +1,180 @@
+import logging
+import os
+import shutil
+from typing import Dict, List, Tuple
+
+from django.conf import settings
+from sqlalchemy import Boolean, create_engine, Engine, event, Integer, Numeric, select, Table
+
+from generator.utils.database import create_mysql_engine, get_data_version, MeasuredQueuePool
+from generator.utils.facts import country_continent, facts_configured, FactsVersion, wine_entity_fact, wine_entity_fact_version
+from gustos.models import metadata_obj
+
+logger = logging.getLogger(__name__)
+
+CURRENT_FILE = "CURRENT"
+"""Name of the file with the name of the current snapshot in GUSTOS_SNAPSHOT_DIR."""
+
+# DuckDB counterparts of MySQL JSON functions used by report queries. MySQL compares the unquoted strings with numbers
+# numerically, DuckDB casts them to numbers as well, while its own "json_value" returns JSON values which cannot be
+# compared with numbers.
+JSON_MACROS = (
+    "CREATE OR REPLACE MACRO json_value(document, path) AS json_extract_string(document, path)",
+    "CREATE OR REPLACE MACRO json_unquote(value) AS json_extract_string(value, '$')",
+)
+
+
+def get_snapshot_tables() -> List[Table]:
+    """
+    :return: Gustos tables stored in snapshots, including the facts tables if they are used by report queries.
+    """
+    tables = list(metadata_obj.tables.values())
+    if facts_configured():
+        tables.extend((wine_entity_fact, country_continent, wine_entity_fact_version))
+    return tables
+
+
+def get_current_snapshot() -> str | None:
+    """
+    :return: Path of the current snapshot or None if no snapshot has been exported yet.
+    """
+    try:
+        with open(os.path.join(settings.GUSTOS_SNAPSHOT_DIR, CURRENT_FILE)) as f:
+            name = f.read().strip()
+    except FileNotFoundError:
+        return None
+    return os.path.join(settings.GUSTOS_SNAPSHOT_DIR, name)
+
+
+def quote(identifier: str) -> str:
+    return '"{}"'.format(identifier.replace('"', '""'))
+
+
+def attach_snapshot(dbapi_connection, connection_record):
+    """
+    Creates views of Gustos tables over Parquet files of the current snapshot and macros of MySQL JSON functions in a
+    new DuckDB connection.
+
+    Connections keep the snapshot they were created with, so they read a new snapshot after GUSTOS_POOL_RECYCLE seconds.
+    """
+    path = get_current_snapshot()
+    if path is None:
+        raise RuntimeError(f"No snapshot of Gustos tables in {settings.GUSTOS_SNAPSHOT_DIR}, run \"export_gustos_snapshot\" command.")
+
+    cursor = dbapi_connection.cursor()
+    try:
+        for macro in JSON_MACROS:
+            cursor.execute(macro)
+        for table in get_snapshot_tables():
+            files = os.path.join(path, table.fullname, "*.parquet").replace("'", "''")
+            if table.schema:
+                cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {quote(table.schema)}")
+                name = f"{quote(table.schema)}.{quote(table.name)}"
+            else:
+                name = quote(table.name)
+            cursor.execute(f"CREATE OR REPLACE VIEW {name} AS SELECT * FROM read_parquet('{files}')")
+    finally:
+        cursor.close()
+
+
+def create_snapshot_engine() -> Engine:
+    """
+    :return: Engine of in-memory DuckDB databases, which read Gustos tables from the current snapshot.
+    """
+    engine = create_engine(
+        "duckdb:///:memory:",
+        poolclass=MeasuredQueuePool,
+        pool_size=settings.GUSTOS_POOL_SIZE,
+        max_overflow=settings.GUSTOS_POOL_MAX_OVERFLOW,
+        pool_timeout=settings.GUSTOS_POOL_TIMEOUT,
+        pool_recycle=settings.GUSTOS_POOL_RECYCLE,
+    )
+    event.listen(engine, "connect", attach_snapshot)
+    return engine
+
+
+def get_arrow_schema(table: Table):
+    """
+    :return: Schema of Parquet files of the table.
+    """
+    import pyarrow as pa
+
+    fields = []
+    for column in table.c:
+        if isinstance(column.type, Boolean):
+            arrow_type = pa.bool_()
+        elif isinstance(column.type, Integer):
+            # Columns are unsigned in the Gustos database.
+            arrow_type = pa.int64()
+        elif isinstance(column.type, Numeric):
+            arrow_type = pa.decimal128(column.type.precision, column.type.scale)
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column.name, arrow_type))
+    return pa.schema(fields)
+
+
+def export_snapshot(keep: int = 2) -> Tuple[str, Dict[str, int]]:
+    """
+    Exports Gustos tables from the Gustos database to a new snapshot and makes it current.
+
+    All tables are read in a single transaction, so they are consistent with each other. Every table is stored in its
+    own directory, split into Parquet files of at most GUSTOS_SNAPSHOT_FILE_ROWS rows. The facts tables must be current,
+    because report queries always use them with the DuckDB backend.
+
+    :param keep: Number of the newest snapshots which are kept, older ones are removed.
+
+    :return: Name of the snapshot and numbers of exported rows by names of tables.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    engine = create_mysql_engine()
+    counts = {}
+    try:
+        with engine.connect() as connection:
+            connection = connection.execution_options(isolation_level="REPEATABLE READ")
+            with connection.begin():
+                name = get_data_version(connection)
+                if facts_configured() and not FactsVersion.current:
+                    raise RuntimeError("Wine entity facts are outdated, run \"refresh_wine_entity_facts\" command first.")
+                path = os.path.join(settings.GUSTOS_SNAPSHOT_DIR, name)
+                if os.path.isdir(path):
+                    logger.info("Snapshot %s is up to date.", name)
+                else:
+                    # Readers never see a partially written snapshot.
+                    temporary_path = f"{path}.tmp"
+                    shutil.rmtree(temporary_path, ignore_errors=True)
+                    for table in get_snapshot_tables():
+                        schema = get_arrow_schema(table)
+                        directory = os.path.join(temporary_path, table.fullname)
+                        os.makedirs(directory)
+
+                        result = connection.execution_options(stream_results=True).execute(select(table))
+                        counts[table.fullname] = 0
+                        for part, rows in enumerate(result.partitions(settings.GUSTOS_SNAPSHOT_FILE_ROWS)):
+                            pq.write_table(pa.Table.from_pylist([row._asdict() for row in rows], schema=schema), os.path.join(directory, f"part-{part:05d}.parquet"))
+                            counts[table.fullname] += len(rows)
+                        if counts[table.fullname] == 0:
+                            # DuckDB needs at least one file to know columns of the view.
+                            pq.write_table(schema.empty_table(), os.path.join(directory, "part-00000.parquet"))
+                        logger.info("Exported %s rows of %s table.", counts[table.fullname], table.fullname)
+                    os.rename(temporary_path, path)
+    finally:
+        engine.dispose()
+
+    current_file = os.path.join(settings.GUSTOS_SNAPSHOT_DIR, CURRENT_FILE)
+    with open(f"{current_file}.tmp", "w") as f:
+        f.write(name)
+    os.replace(f"{current_file}.tmp", current_file)
+
+    # The previous snapshot is kept for connections which have not been recycled yet.
+    snapshots = sorted(
+        (entry for entry in os.scandir(settings.GUSTOS_SNAPSHOT_DIR) if entry.is_dir() and not entry.name.endswith(".tmp") and entry.name != name),
+        key=lambda entry: entry.stat().st_mtime,
+        reverse=True,
+    )
+    for entry in snapshots[max(keep - 1, 0):]:
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+    return name, counts
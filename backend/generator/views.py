@@ -15,7 +15,7 @@ from generator.forms import SectionForm
 from generator.models import Task, TaskLogEntry
 from generator.reports.personal_winery_report.personal_winery_report.main import PersonalWineryReport
 from generator.utils.database import Database
-from generator.utils.report import generating_pdf_report, get_report, get_section, SubsectionsBySections
+from generator.utils.report import generating_pdf_report, get_report, get_section, ReportRegistry, SubsectionsBySections
 from gustos.models import winery
 
 PAGE_SIZE = 20
@@ -37,8 +37,7 @@ class SectionView(View):
 
         section_info = get_section(section)
 
-        subsections = {subsection: get_report(request, section, subsection) for subsection in SubsectionsBySections.subsections_by_sections[section]}
-        subsections = ((subsection, report.title) for subsection, report in sorted(subsections.items(), key=lambda subsection: subsection[1].weight))
+        subsections = ReportRegistry.get_catalog(section)
 
         form = SectionForm(subsections=subsections)
 
@@ -57,8 +56,7 @@ class SectionView(View):
         section_info = get_section(section)
 
         preview = ""
-        subsections = {subsection: get_report(request, section, subsection) for subsection in SubsectionsBySections.subsections_by_sections[section]}
-        subsections = tuple((subsection, report.title) for subsection, report in sorted(subsections.items(), key=lambda subsection: subsection[1].weight))
+        subsections = ReportRegistry.get_catalog(section)
 
         form = SectionForm(request.POST, subsections=subsections)
 
@@ -114,8 +112,11 @@ class PersonalReportSectionView(View):
         form = report.get_form(request.POST)
 
         if form.is_valid():
-            task = report.enqueue_report_generation()
-            messages.success(request, mark_safe(_("Task \"%(id)s\" has been created successfully.") % { "id": f'<a href="{reverse("task", args=[task.id])}">{task.id}</a>' }))
+            task, created = report.enqueue_report_generation()
+            if created:
+                messages.success(request, mark_safe(_("Task \"%(id)s\" has been created successfully.") % { "id": f'<a href="{reverse("task", args=[task.id])}">{task.id}</a>' }))
+            else:
+                messages.success(request, mark_safe(_("The report has already been requested by task \"%(id)s\".") % { "id": f'<a href="{reverse("task", args=[task.id])}">{task.id}</a>' }))
 
         return render(
             request, "generator/pages/subsection.html", {
@@ -158,7 +159,7 @@ class TaskView(View):
                 "log_entries": log_entries,
                 # TODO: Make template tag for progress bar.
                 # TODO: Mark progress bar with colors depending on slide errors.
-                "progress": round(task.current / task.total * 100),
+                "progress": task.progress,
             }
         )
 
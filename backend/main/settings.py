@@ -192,6 +192,10 @@ LOGGING = {
             "level": "DEBUG",
             "propagate": False,
         },
+        # Pools log every checkout, SQLAlchemy silences its own pools the same way.
+        "generator.utils.database.MeasuredQueuePool": {
+            "level": "WARNING",
+        },
     },
 }
 
@@ -205,6 +209,77 @@ CELERY_RESULT_SERIALIZER = "json"
 
 
 # Custom settings
+# How subsections of personal reports are rendered: "threads" renders them in a thread pool of the task,
+# "celery" spreads them across Celery workers as a chord of separate tasks.
+PERSONAL_REPORT_EXECUTOR = env.get_str("PERSONAL_REPORT_EXECUTOR", "threads")
+# Number of threads of the process-wide pool which renders subsections of personal reports.
 THREAD_POOL_SIZE = env.get_int("THREAD_POOL_SIZE", os.cpu_count())
+# Maximum number of subsections of a single task which are rendered at the same time, half of the thread pool by
+# default, so concurrent tasks share the pool.
+TASK_CONCURRENCY = env.get_int("TASK_CONCURRENCY", max(THREAD_POOL_SIZE // 2, 1))
+# Maximum number of subsections rendered at the same time by all worker processes of the host,
+# it also bounds the number of connections to the Gustos database used for rendering.
+HOST_RENDER_CONCURRENCY = env.get_int("HOST_RENDER_CONCURRENCY", os.cpu_count())
+# Maximum number of wkhtmltopdf processes running at the same time on the host.
+HOST_WKHTMLTOPDF_CONCURRENCY = env.get_int("HOST_WKHTMLTOPDF_CONCURRENCY", max(os.cpu_count() // 2, 1))
+# Minimal interval in milliseconds between writes of the progress of a task.
+PROGRESS_FLUSH_INTERVAL = env.get_int("PROGRESS_FLUSH_INTERVAL", 1000)
+# Number of processes rendering charts of personal reports, 0 renders charts in the calling thread.
+CHART_PROCESS_POOL_SIZE = env.get_int("CHART_PROCESS_POOL_SIZE", 0)
+# Schema of the Gustos database server which holds the denormalized wine entity facts and continents of countries,
+# queries decode JSON columns of "wine" table and find continents by CASE expressions when it is empty or the facts are
+# outdated.
+WINE_ENTITY_FACTS_SCHEMA = env.get_str("WINE_ENTITY_FACTS_SCHEMA", "")
+# Maximum number of query results cached by each process, 0 disables caching of query results of reports.
+QUERY_CACHE_SIZE = env.get_int("QUERY_CACHE_SIZE", 0)
+# Maximum number of rows of a cached query result.
+QUERY_CACHE_MAX_ROWS = env.get_int("QUERY_CACHE_MAX_ROWS", 100000)
+# Interval in seconds between writes of hits and misses of the query cache of each process to Redis.
+QUERY_CACHE_STATS_INTERVAL = env.get_int("QUERY_CACHE_STATS_INTERVAL", 60)
+# URL of Redis shared by all processes as the second tier of the query cache, empty disables the tier.
+QUERY_CACHE_REDIS_URL = env.get_str("QUERY_CACHE_REDIS_URL", "")
+# Time in seconds after which query results of outdated versions of Gustos data are removed from Redis.
+QUERY_CACHE_REDIS_EXPIRE = env.get_int("QUERY_CACHE_REDIS_EXPIRE", 7 * 24 * 60 * 60)
+# Number of connections to the Gustos database kept open by each process, rendering threads should not outnumber them.
+GUSTOS_POOL_SIZE = env.get_int("GUSTOS_POOL_SIZE", THREAD_POOL_SIZE)
+# Number of connections to the Gustos database which are opened beyond the pool size when all pooled ones are in use.
+GUSTOS_POOL_MAX_OVERFLOW = env.get_int("GUSTOS_POOL_MAX_OVERFLOW", 10)
+# Time in seconds to wait for a connection to the Gustos database when all of them are in use.
+GUSTOS_POOL_TIMEOUT = env.get_int("GUSTOS_POOL_TIMEOUT", 30)
+# Age in seconds after which connections to the Gustos database are reopened, it must be less than "wait_timeout" of the server.
+GUSTOS_POOL_RECYCLE = env.get_int("GUSTOS_POOL_RECYCLE", 3600)
+# Whether connections to the Gustos database are tested before they are checked out, 0 disables the test.
+GUSTOS_POOL_PRE_PING = bool(env.get_int("GUSTOS_POOL_PRE_PING", 1))
+# Maximum number of rating queries whose rows are shared by personal reports of a batch, the least recently used ones
+# are released first.
+SHARED_QUERY_RESULTS_SIZE = env.get_int("SHARED_QUERY_RESULTS_SIZE", 32)
+# Whether table winery reports look up ratings in ranking snapshots refreshed by Celery workers, 0 disables snapshots.
+RANKING_SNAPSHOTS = bool(env.get_int("RANKING_SNAPSHOTS", 0))
+# Time in seconds after which report generation tasks enqueue the refresh of a failed ranking snapshot again.
+RANKING_SNAPSHOT_RETRY_DELAY = env.get_int("RANKING_SNAPSHOT_RETRY_DELAY", 600)
+# Number of rows of a ranking snapshot inserted and committed together.
+RANKING_SNAPSHOT_BATCH_SIZE = env.get_int("RANKING_SNAPSHOT_BATCH_SIZE", 1000)
+# Whether table winery reports fetch only the rows of the winery and its neighbours from rating queries,
+# 0 fetches whole rankings.
+RATING_NEIGHBOUR_QUERIES = bool(env.get_int("RATING_NEIGHBOUR_QUERIES", 1))
+# Whether report generation tasks load awards of the year range into a frame once and compute aggregates of continent,
+# top wineries and country comparison reports from it instead of separate queries, 0 disables frames.
+AWARD_FACT_FRAMES = bool(env.get_int("AWARD_FACT_FRAMES", 0))
+# Backend of report queries: "mysql" runs them in the Gustos database, "duckdb" runs them in DuckDB over the Parquet
+# snapshot of Gustos tables exported by "export_gustos_snapshot" command.
+GUSTOS_BACKEND = env.get_str("GUSTOS_BACKEND", "mysql")
+# Directory of Parquet snapshots of Gustos tables.
+GUSTOS_SNAPSHOT_DIR = env.get_str("GUSTOS_SNAPSHOT_DIR", os.path.join(BASE_DIR, "gustos_snapshot"))
+# Maximal number of rows of a Parquet file of a snapshot, larger tables are split into several files.
+GUSTOS_SNAPSHOT_FILE_ROWS = env.get_int("GUSTOS_SNAPSHOT_FILE_ROWS", 1000000)
+# Table of the Gustos database with the version of its data, which the Gustos writer updates whenever it changes the
+# data, empty computes the version from change markers and checksums of all tables read by reports.
+GUSTOS_DATA_VERSION_TABLE = env.get_str("GUSTOS_DATA_VERSION_TABLE", "")
+# Time in seconds for which each process reuses the version of Gustos data, which invalidates reused reports and cached
+# query results. Without GUSTOS_DATA_VERSION_TABLE reading the version scans whole tables, so it should not be short.
+DATA_VERSION_TTL = env.get_int("DATA_VERSION_TTL", 60)
+# Time in seconds after which a pending or running personal report task which has not updated its progress is
+# considered lost, so the next request for the same report starts it again.
+PERSONAL_REPORT_TASK_TIMEOUT = env.get_int("PERSONAL_REPORT_TASK_TIMEOUT", 3600)
 
 GWMR_FINDER_DOMAIN = env.get_str("GWMR_FINDER_DOMAIN", "gwmr.local")